@@ -19,6 +19,7 @@ from configparser import ConfigParser
 from datetime import date
 
 from client import Client
+from market import BarBuilder, IndicatorEngine
 
 ## Constants
 logging.basicConfig(
@@ -36,13 +37,36 @@ credentials = ConfigParser()
 class Scalp_Mechanic(Client):
     """Scalp-Mechanic Tradovate Client"""
 
+    # -Constructor
+    def __init__(
+        self, symbols: list[str], contract_cache: str | None = None
+    ) -> Scalp_Mechanic:
+        super().__init__(contract_cache=contract_cache)
+        self.symbols: list[str] = symbols
+        self.indicators: dict[str, IndicatorEngine] = {}
+        self._loading: dict[BarBuilder, str] = {}
+
+    # -Instance Methods
     async def on_connect(self) -> None:
         print("Connected Successfully")
+        for symbol in self.symbols:
+            builder = await self.subscribe_chart(symbol)
+            if builder:
+                self._loading[builder] = symbol
+
+    def on_history(self, builder: BarBuilder) -> None:
+        # -Indicators warm up once the chart history has loaded
+        symbol = self._loading.pop(builder, None)
+        if symbol is not None:
+            self.indicators[symbol] = IndicatorEngine.scalping(builder)
 
 
 ## Body
-client = Scalp_Mechanic()
 credentials.read("account.ini")
+client = Scalp_Mechanic(
+    credentials.get('market', 'symbols', fallback="").split(),
+    credentials.get('market', 'contract_cache', fallback=None)
+)
 authorization_dict = {
     'name': credentials['authentication']['username'],
     'password': credentials['authentication']['password'],
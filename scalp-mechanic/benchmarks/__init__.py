@@ -0,0 +1,6 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Benchmarks Module             ##
+##-------------------------------##
@@ -0,0 +1,314 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Client Benchmark              ##
+##-------------------------------##
+
+"""
+Benchmark the Client receive and send paths against a local ReplayServer.
+
+Usage (from the scalp-mechanic directory):
+    python -m benchmarks.client [--count N] [--rate N] [--concurrency N]
+                                [--output FILE] [--compare FILE]
+
+The server runs in a child process so CPU figures cover the client only.
+Frames are stamped with time.monotonic_ns() as they are sent, which is
+system-wide on Linux, so latency covers socket, decode and handling.
+
+Scenarios:
+    poll_message     WebSocket.poll_message receive + decode
+    process_message  Client.process_message through the router and caches
+    request          WebSocket.request round trip, --concurrency in flight
+    session_get      Session.get round trip, --concurrency in flight
+
+Per scenario: messages/second, p50/p99/p999 latency, CPU per message, and
+net memory blocks retained per message (from a tracemalloc pass).
+"""
+
+## Imports
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import multiprocessing
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime
+from itertools import cycle, islice
+from pathlib import Path
+from time import monotonic_ns, perf_counter_ns, process_time_ns
+from typing import Awaitable, Callable
+
+from benchmarks.codec import DEFAULT_FRAMES, load_frames
+from client import Client
+from profile.session import Session, WebSocket
+from replay import ReplayServer
+from utils import codec, urls
+from utils.codec import QuoteStruct
+
+## Constants
+RESULTS = Path(__file__).parent / "results"
+Scenario = Callable[[str, int, int], Awaitable[list[int]]]
+
+
+## Classes
+class StampedServer(ReplayServer):
+    """ReplayServer stamping each frame with its send time"""
+
+    def encode_frame(self, frame: str) -> str:
+        return f'a[{{"t":{monotonic_ns()},' + frame[3:]
+
+
+class BenchClient(Client):
+    """Client that records frame latency after routing"""
+
+    # -Constructor
+    def __init__(self, count: int, loop: asyncio.AbstractEventLoop) -> BenchClient:
+        super().__init__(loop=loop)
+        self.count: int = count
+        self.latencies: list[int] = []
+        self.done: asyncio.Event = asyncio.Event()
+
+    # -Instance Methods
+    def on_quote(self, quote: QuoteStruct) -> None:
+        pass
+
+    def process_frame(
+        self, websocket: WebSocket, frame: list[dict], *args
+    ) -> asyncio.Task | None:
+        task = super().process_frame(websocket, frame, *args)
+        if 't' in frame[0]:
+            self.latencies.append(monotonic_ns() - frame[0]['t'])
+            if len(self.latencies) >= self.count:
+                self.done.set()
+        return task
+
+
+## Functions
+def _serve(queue: multiprocessing.Queue, count: int, rate: float | None) -> None:
+    """Child process: run a StampedServer with count frames"""
+    frames = [
+        f"a{frame}" for frame in load_frames(DEFAULT_FRAMES)
+        if any('e' in msg for msg in codec.loads(frame))
+    ]
+
+    async def main() -> None:
+        server = StampedServer.from_frames(islice(cycle(frames), count), rate)
+        await server.start()
+        queue.put(server.address)
+        await asyncio.Event().wait()
+    asyncio.run(main())
+
+
+async def _websocket(address: str) -> tuple[Session, WebSocket]:
+    """Session and connected WebSocket to server"""
+    session = Session(loop=asyncio.get_running_loop())
+    await asyncio.sleep(0)
+    ws = await WebSocket.from_session(f"ws://{address}/v1/websocket", session)
+    await ws.wait_connected()
+    return session, ws
+
+
+async def bench_poll_message(address: str, count: int, _: int) -> list[int]:
+    """Latency from frame send to poll_message return"""
+    session, ws = await _websocket(address)
+    subscribe = asyncio.ensure_future(ws.request(urls.wss_market_sub, body={'symbol': 0}))
+    latencies = []
+    while len(latencies) < count:
+        frame = await ws.poll_message()
+        if frame and 't' in frame[0]:
+            latencies.append(monotonic_ns() - frame[0]['t'])
+    await subscribe
+    await ws.close()
+    await session.close()
+    return latencies
+
+
+async def bench_process_message(address: str, count: int, _: int) -> list[int]:
+    """Latency from frame send to Client routing completion"""
+    client = BenchClient(count, asyncio.get_running_loop())
+    await asyncio.sleep(0)
+    await client.create_websockets(False, False, True)
+    websocket = client.market_websocket
+    reader = asyncio.create_task(client.process_message(websocket))
+    await websocket.authorize("benchmark")
+    await client.subscribe_symbol(0, histogram=False)
+    await client.done.wait()
+    await client.close()
+    await reader
+    return client.latencies
+
+
+async def bench_request(address: str, count: int, concurrency: int) -> list[int]:
+    """WebSocket.request round trip latency"""
+    session, ws = await _websocket(address)
+
+    async def drain() -> None:
+        while True:
+            await ws.poll_message()
+    reader = asyncio.create_task(drain())
+    latencies = []
+
+    async def worker(n: int) -> None:
+        for _ in range(n):
+            start = perf_counter_ns()
+            await ws.request(urls.wss_market_usub, body={'symbol': 0})
+            latencies.append(perf_counter_ns() - start)
+    await asyncio.gather(*(worker(count // concurrency) for _ in range(concurrency)))
+    reader.cancel()
+    await ws.close()
+    await session.close()
+    return latencies
+
+
+async def bench_session_get(address: str, count: int, concurrency: int) -> list[int]:
+    """Session.get round trip latency, unthrottled so the client itself is measured"""
+    session = Session(
+        loop=asyncio.get_running_loop(), rates={}, max_inflight=max(concurrency, 1)
+    )
+    await asyncio.sleep(0)
+    latencies = []
+
+    async def worker(n: int) -> None:
+        for _ in range(n):
+            start = perf_counter_ns()
+            await session.get(urls.http_auth_me)
+            latencies.append(perf_counter_ns() - start)
+    await asyncio.gather(*(worker(count // concurrency) for _ in range(concurrency)))
+    await session.close()
+    return latencies
+
+
+SCENARIOS: dict[str, Scenario] = {
+    'poll_message': bench_poll_message,
+    'process_message': bench_process_message,
+    'request': bench_request,
+    'session_get': bench_session_get,
+}
+
+
+def percentile(ordered: list[int], fraction: float) -> int:
+    """Nearest-rank percentile of a sorted list"""
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_scenario(
+    name: str, count: int, rate: float | None, concurrency: int, alloc_count: int
+) -> dict[str, float]:
+    """Run a scenario against a fresh server process and summarize it"""
+    scenario = SCENARIOS[name]
+
+    def call(n: int) -> list[int]:
+        queue = multiprocessing.Queue()
+        server = multiprocessing.Process(target=_serve, args=(queue, n, rate), daemon=True)
+        server.start()
+        address = queue.get(timeout=30)
+        urls.set_host(address, secure=False)
+        try:
+            if asyncio.iscoroutinefunction(scenario):
+                return asyncio.run(scenario(address, n, concurrency))
+            return scenario(address, n, concurrency)
+        finally:
+            server.terminate()
+            server.join()
+            urls.set_host()
+    # -Timing pass
+    wall, cpu = perf_counter_ns(), process_time_ns()
+    latencies = call(count)
+    wall, cpu = perf_counter_ns() - wall, process_time_ns() - cpu
+    # -Allocation pass
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    call(alloc_count)
+    after = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    latencies.sort()
+    return {
+        'messages': len(latencies),
+        'messages_per_second': len(latencies) / (wall / 1e9),
+        'p50_us': percentile(latencies, 0.50) / 1e3,
+        'p99_us': percentile(latencies, 0.99) / 1e3,
+        'p999_us': percentile(latencies, 0.999) / 1e3,
+        'max_us': (latencies[-1] if latencies else 0) / 1e3,
+        'cpu_us_per_message': cpu / 1e3 / max(len(latencies), 1),
+        'retained_blocks_per_message': retained / alloc_count,
+        'traced_peak_kb': peak / 1024,
+    }
+
+
+def _revision() -> str | None:
+    """Current git commit, if any"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Print relative change of each metric against a baseline result file"""
+    print(f"\nvs {baseline['meta'].get('revision')} ({baseline['meta']['date']})")
+    for name, result in current['scenarios'].items():
+        base = baseline['scenarios'].get(name)
+        if not base:
+            continue
+        changes = ', '.join(
+            f"{metric} {100 * (value - base[metric]) / base[metric]:+.1f}%"
+            for metric, value in result.items()
+            if metric in ('messages_per_second', 'p50_us', 'p99_us', 'cpu_us_per_message')
+            and base.get(metric)
+        )
+        print(f"  {name:<16}{changes}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=20000)
+    parser.add_argument('--rate', type=float, default=None, help="frames/s, default max")
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument('--alloc-count', type=int, default=2000)
+    parser.add_argument('--scenario', action='append', choices=tuple(SCENARIOS))
+    parser.add_argument('--output', type=Path)
+    parser.add_argument('--compare', type=Path)
+    args = parser.parse_args()
+    now = datetime.now()
+    results = {
+        'meta': {
+            'date': now.isoformat(timespec='seconds'), 'revision': _revision(),
+            'python': platform.python_version(), 'codec': codec.backend,
+            'count': args.count, 'rate': args.rate, 'concurrency': args.concurrency,
+        },
+        'scenarios': {},
+    }
+    print(f"{'scenario':<16}{'msg/s':>10}{'p50 us':>10}{'p99 us':>10}"
+          f"{'p999 us':>10}{'cpu us':>10}{'blocks':>8}")
+    for name in args.scenario or SCENARIOS:
+        result = run_scenario(
+            name, args.count, args.rate, args.concurrency, args.alloc_count
+        )
+        results['scenarios'][name] = result
+        print(
+            f"{name:<16}{result['messages_per_second']:>10.0f}{result['p50_us']:>10.1f}"
+            f"{result['p99_us']:>10.1f}{result['p999_us']:>10.1f}"
+            f"{result['cpu_us_per_message']:>10.1f}"
+            f"{result['retained_blocks_per_message']:>8.2f}"
+        )
+    output = args.output or RESULTS / f"client-{now:%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\nWrote {output}")
+    if args.compare:
+        compare(results, json.loads(args.compare.read_text()))
+
+
+## Body
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## JSON Codec Benchmark          ##
+##-------------------------------##
+
+"""
+Compare JSON codec backends on WebSocket frames.
+
+Usage (from the scalp-mechanic directory):
+    python -m benchmarks.codec [frames.txt] [--repeat N]
+
+Frames are read one per line, in the raw 'a[...]' form they arrive in.
+"""
+
+## Imports
+from __future__ import annotations
+import argparse
+from pathlib import Path
+from time import perf_counter_ns
+
+from utils import codec
+
+## Constants
+DEFAULT_FRAMES = Path(__file__).parent / "data" / "frames.txt"
+
+
+## Functions
+def load_frames(path: Path) -> list[str]:
+    """Read raw 'a' frames from a frame file"""
+    with open(path, encoding='utf-8') as file:
+        return [line[1:].rstrip('\n') for line in file if line.startswith('a')]
+
+
+def bench_backend(name: str, frames: list[str], repeat: int) -> dict[str, float]:
+    """Time decode, typed conversion and encode for one backend"""
+    codec.use(name)
+    decoded = [codec.loads(frame) for frame in frames]
+    start = perf_counter_ns()
+    for _ in range(repeat):
+        for frame in frames:
+            codec.loads(frame)
+    decode_ns = perf_counter_ns() - start
+    start = perf_counter_ns()
+    for _ in range(repeat):
+        for msgs in decoded:
+            for msg in msgs:
+                data = msg.get('d', {})
+                for quote in data.get('quotes', ()):
+                    codec.decode_quote(quote)
+                for dom in data.get('doms', ()):
+                    codec.decode_dom(dom)
+    typed_ns = perf_counter_ns() - start
+    start = perf_counter_ns()
+    for _ in range(repeat):
+        for msgs in decoded:
+            codec.dumps(msgs)
+    encode_ns = perf_counter_ns() - start
+    count = len(frames) * repeat
+    return {
+        'decode_ns': decode_ns / count,
+        'typed_ns': typed_ns / count,
+        'encode_ns': encode_ns / count,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('frames', nargs='?', type=Path, default=DEFAULT_FRAMES)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+    frames = load_frames(args.frames)
+    print(f"{len(frames)} frames, {args.repeat} repeats")
+    print(f"{'backend':<10}{'decode ns':>12}{'typed ns':>12}{'encode ns':>12}")
+    for name in codec.BACKENDS:
+        result = bench_backend(name, frames, args.repeat)
+        print(
+            f"{name:<10}{result['decode_ns']:>12.0f}"
+            f"{result['typed_ns']:>12.0f}{result['encode_ns']:>12.0f}"
+        )
+
+
+## Body
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Indicator Benchmark           ##
+##-------------------------------##
+
+"""
+Check incremental indicators against their batch mode and time both.
+
+Usage (from the scalp-mechanic directory):
+    python -m benchmarks.indicators [--bars N] [--seed N]
+
+Exits non-zero if batch, incremental, or batch warm-up followed by
+incremental updates disagree.
+"""
+
+## Imports
+from __future__ import annotations
+import argparse
+from time import perf_counter_ns
+
+import numpy as np
+
+from market.bars import COLUMNS, BarSeries
+from market.indicators import ATR, EMA, RSI, VWAP, RollingStd
+
+## Constants
+INDICATORS = (
+    ('ema', lambda: EMA(9)), ('vwap', VWAP), ('atr', lambda: ATR(14)),
+    ('rsi', lambda: RSI(14)), ('std', lambda: RollingStd(20)),
+)
+
+
+## Functions
+def random_bars(count: int, seed: int) -> BarSeries:
+    """Random-walk ES-like bars on a 0.25 tick grid"""
+    rng = np.random.default_rng(seed)
+    bars = BarSeries(count)
+    close = 4300.0
+    for i in range(count):
+        open_ = close
+        close = open_ + 0.25 * rng.integers(-8, 9)
+        high = max(open_, close) + 0.25 * rng.integers(0, 4)
+        low = min(open_, close) - 0.25 * rng.integers(0, 4)
+        bars.append(60.0 * i, open_, high, low, close, float(rng.integers(1, 500)), 1)
+    return bars
+
+
+def stream(bars: BarSeries, start: int = 0, stop: int | None = None):
+    """Yield a one-bar series per bar, as seen on bar close"""
+    columns = [bars.column(name) for name in COLUMNS]
+    bar = BarSeries(1)
+    for i in range(start, len(bars) if stop is None else stop):
+        bar.append(*(column[i] for column in columns))
+        yield bar
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--bars', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    bars = random_bars(args.bars, args.seed)
+    half = len(bars) // 2
+    head = BarSeries(half)
+    for bar in stream(bars, 0, half):
+        head.append(*(bar.last(name) for name in COLUMNS))
+    failed = False
+    print(f"{args.bars} bars")
+    print(f"{'indicator':<10}{'batch us':>12}{'update ns':>12}{'max diff':>12}")
+    for name, factory in INDICATORS:
+        # -Batch
+        start = perf_counter_ns()
+        batch = factory().batch_bars(bars)
+        batch_ns = perf_counter_ns() - start
+        # -Incremental
+        indicator = factory()
+        start = perf_counter_ns()
+        incremental = np.array([indicator.update_bar(bar) for bar in stream(bars)])
+        update_ns = (perf_counter_ns() - start) / len(bars)
+        # -Batch warm-up, then incremental
+        split = factory()
+        warm = split.batch_bars(head)
+        tail = [split.update_bar(bar) for bar in stream(bars, half)]
+        combined = np.concatenate((warm, tail))
+        diff = max(
+            np.nanmax(np.abs(batch - incremental)), np.nanmax(np.abs(batch - combined))
+        )
+        ok = all(
+            np.allclose(batch, other, rtol=1e-9, atol=1e-6, equal_nan=True)
+            for other in (incremental, combined)
+        )
+        failed |= not ok
+        print(
+            f"{name:<10}{batch_ns / 1000:>12.0f}{update_ns:>12.0f}"
+            f"{diff:>12.2e}{'' if ok else '  MISMATCH'}"
+        )
+    if failed:
+        raise SystemExit(1)
+
+
+## Body
+if __name__ == '__main__':
+    main()
@@ -9,15 +9,37 @@
 from __future__ import annotations
 import asyncio
 import logging
-from datetime import timedelta
+import random
+from pathlib import Path
+from typing import Callable, Iterable
 
-from profile import Profile
+from market import (
+    BAR, FEED, BarBuilder, ContractCache, ContractInfo, OrderBook, Quote, QuoteCache,
+    SubscriptionManager, TickRecorder
+)
+from market.bars import DEFAULT_CAPACITY
+from profile import Account, Profile
+from profile.directory import AccountDirectory
+from profile.entities import EntityStore
+from profile.pnl import PnLEngine
+from profile.renewal import TokenRenewal
+from profile.rest import EntityClient
+from profile.scheduler import LANE
+from profile.risk import RiskGate, RiskLimits
 from profile.session import Session, WebSocket
-from utils import urls
-from utils.typing import CredentialAuthDict
+from utils import codec, timestamp_to_seconds, urls
+from utils.errors import WebSocketClosedException
+from utils.inbound import OVERFLOW, QUEUE_SIZE, FrameQueue
+from utils.router import EVENTS, HandlerStats, Router
+from utils.stats import LatencyStats
+from utils.codec import DOMStruct, QuoteStruct
+from utils.typing import ChartDict, CredentialAuthDict, FillDict, GapDict
 
 ## Constants
 log = logging.getLogger(__name__)
+RECONNECT_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+RECONNECT_TIMEOUT = 15.0
 
 
 ## Classes
@@ -25,18 +47,78 @@ class Client(Profile):
     """Tradovate Client"""
 
     # -Constructor
-    def __init__(self) -> Client:
+    def __init__(
+        self, *, queue_size: int = QUEUE_SIZE, overflow: OVERFLOW = OVERFLOW.BLOCK,
+        contract_cache: str | Path | None = None,
+        rates: dict[LANE, tuple[float, int]] | None = None,
+        loop: asyncio.AbstractEventLoop | None = None
+    ) -> Client:
         self.id: int = 0
-        self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
-        self._session: Session = Session(loop=self._loop)
-        self._handle_auto_renewal: asyncio.TimerHandle | None = None
+        self.queue_size: int = queue_size
+        self.overflow: OVERFLOW = overflow
+        self._loop: asyncio.AbstractEventLoop = loop if loop else asyncio.new_event_loop()
+        self._session: Session = Session(loop=self._loop, rates=rates)
+        self._renewal: TokenRenewal = TokenRenewal(
+            self._session, lambda: (self._websockets_account, self._websockets_market)
+        )
         self._live: WebSocket | None = None
         self._demo: WebSocket | None = None
         self._mdlive: WebSocket | None = None
         self._mddemo: WebSocket | None = None
         self._mdreplay: WebSocket | None = None
+        self._books: dict[int, OrderBook] = {}
+        self._charts: dict[int, BarBuilder] = {}
+        self._chart_subscriptions: dict[BarBuilder, tuple[int, int]] = {}
+        self._chart_requests: dict[BarBuilder, dict] = {}
+        self._tick_builders: list[BarBuilder] = []
+        self._closing: bool = False
+        self._queues: dict[WebSocket, FrameQueue] = {}
+        self._entities: dict[urls.ENDPOINT, EntityStore] = {
+            urls.ENDPOINT.LIVE: EntityStore(), urls.ENDPOINT.DEMO: EntityStore(),
+        }
+        self._stores: dict[WebSocket, EntityStore] = {}
+        self._pnl: PnLEngine = PnLEngine()
+        self._rest: dict[urls.ENDPOINT, EntityClient] = {
+            endpoint: EntityClient(self._session, endpoint)
+            for endpoint in (urls.ENDPOINT.LIVE, urls.ENDPOINT.DEMO)
+        }
+        self._directory: AccountDirectory = AccountDirectory(self)
+        for endpoint, store in self._entities.items():
+            self._pnl.attach(store, endpoint)
+            self._directory.attach(store, endpoint)
+        self._quotes: QuoteCache = QuoteCache()
+        self._quotes.subscribe(self._pnl.update_quote)
+        self._symbols: dict[int, str] = {}
+        self._gates: list[RiskGate] = []
+        self._contracts: ContractCache = ContractCache(
+            contract_cache, self._rest[urls.ENDPOINT.LIVE]
+        )
+        for info in self._contracts.contracts:
+            self.add_contract(info.id, info.name)
+        for store in self._entities.values():
+            store.subscribe(self._resolve_fill, 'fill')
+        self._subscriptions: SubscriptionManager = SubscriptionManager()
+        self._recorder: TickRecorder | None = None
+        self._stats_task: asyncio.Task | None = None
+        self._started: float = 0.0
+        self.startup: dict[str, float] = {}
+        self._router: Router = Router(loop=self._loop)
+        self._router.register('dom', self._update_book)
+        self._router.register('quote', self._quotes.update)
+        self._router.register('chart', self._update_chart)
+        for event in EVENTS:
+            handler = getattr(self, "on_" + event, None)
+            if handler:
+                self._router.register(event, handler)
 
     # -Instance Methods: Private
+    async def _contract_ids(self, ids: Iterable[int | str]) -> tuple[int | str, ...]:
+        '''Resolved contract ids of symbols or ids, unresolved keys kept as given'''
+        infos = await asyncio.gather(*(self.resolve_contract(id_) for id_ in ids))
+        return tuple(
+            id_ if info is None else info.id for id_, info in zip(ids, infos)
+        )
+
     def _dispatch(self, event: str, *args, **kwargs) -> None:
         '''Dispatch task for event name'''
         log.debug(f"Client event '{event}'")
@@ -48,27 +130,192 @@ class Client(Profile):
         else:
             self._loop.create_task(coro(*args, **kwargs))
 
-    async def _renewal(self) -> None:
-        '''Task for Session authorization renewal loop'''
-        while self._session.authenticated.is_set():
-            time = self._session.token_duration - timedelta(minutes=10)
-            await asyncio.sleep(time.total_seconds())
-            await self._session.renew_access_token()
+    async def _consume(self, websocket: WebSocket, queue: FrameQueue) -> None:
+        '''Task handling queued frames, then awaiting their coroutine handlers'''
+        while True:
+            task = self.process_frame(websocket, *await queue.get())
+            while queue:
+                task = self.process_frame(websocket, *queue.get_nowait()) or task
+            if task is not None:
+                await task
+
+    async def _dump_stats(self, interval: float) -> None:
+        '''Task logging Client stats every interval seconds'''
+        while True:
+            await asyncio.sleep(interval)
+            log.info(f"Client stats {codec.dumps(self.stats())}")
+
+    def _drop_websocket(self, websocket: WebSocket) -> None:
+        '''Detach websocket from its Client slot'''
+        for name in ('_live', '_demo', '_mdlive', '_mddemo', '_mdreplay'):
+            if getattr(self, name) is websocket:
+                setattr(self, name, None)
+
+    async def _reconnect(self, websocket: WebSocket) -> bool:
+        '''Reconnect websocket with jittered exponential backoff until closing'''
+        market = websocket in (self._websockets_market or ())
+        gap: GapDict = {
+            'websocket': websocket.id, 'url': websocket.url, 'market': market,
+            'start': self._loop.time(),
+        }
+        log.warning(f"Client WebSocket[{websocket.id}] disconnected, reconnecting")
+        await websocket.close()
+        if websocket in self._queues:
+            self._queues[websocket].clear()
+        if market:
+            self._reset_market()
+        self._router.emit('gap', gap)
+        attempts = 0
+        # -Sockets their owner dropped, e.g. after a failed authorize, stay closed
+        while not self._closing and websocket in (self._websockets or ()):
+            if attempts:
+                delay = min(RECONNECT_MAX_DELAY, RECONNECT_DELAY * 2 ** attempts)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            attempts += 1
+            try:
+                websocket_ = await self._session.create_websocket(websocket.url)
+                await asyncio.wait_for(websocket.reopen(websocket_), RECONNECT_TIMEOUT)
+            except Exception as exc:
+                log.warning(
+                    f"Client WebSocket[{websocket.id}] reconnect attempt {attempts} "
+                    f"failed: {exc!r}"
+                )
+                continue
+            if websocket not in (self._websockets or ()):
+                await websocket.close()
+                return False
+            gap['attempts'] = attempts
+            self._loop.create_task(
+                self._restore(websocket, gap), name=f"client-restore[{websocket.id}]"
+            )
+            return True
+        return False
+
+    def _reset_market(self) -> None:
+        '''Drop market state that a data gap has made stale'''
+        for book in self._books.values():
+            book.clear()
+        self._quotes.clear()
+        for builder in self._tick_builders:
+            builder.reset()
+        for builder in self._chart_subscriptions:
+            builder.reset()
+
+    async def _request_chart(self, builder: BarBuilder, body: dict) -> None:
+        '''Request md/getChart and route its chart ids to builder'''
+        res = await self._mdlive.request(urls.wss_market_chart_sub, body=body)
+        ids = (res['d']['historicalId'], res['d']['realtimeId'])
+        for id_ in ids:
+            self._charts[id_] = builder
+        self._chart_subscriptions[builder] = ids
+
+    async def _restore(self, websocket: WebSocket, gap: GapDict) -> None:
+        '''Task restoring websocket subscriptions and charts after reopen'''
+        try:
+            responses = await websocket.restore()
+            store = self._stores.get(websocket)
+            if store is not None:
+                for endpoint, res in responses:
+                    if endpoint == urls.wss_user_sync.lower():
+                        store.load(res['d'])
+            if websocket is self._mdlive:
+                for ids in self._chart_subscriptions.values():
+                    for id_ in ids:
+                        self._charts.pop(id_, None)
+                await asyncio.gather(*(
+                    self._request_chart(builder, body)
+                    for builder, body in self._chart_requests.items()
+                ))
+        except Exception as exc:
+            log.warning(f"Client WebSocket[{websocket.id}] restore failed: {exc!r}")
+            await websocket.abort()
+            return None
+        gap['duration'] = self._loop.time() - gap['start']
+        log.info(
+            f"Client WebSocket[{websocket.id}] reconnected after {gap['duration']:.3f}s"
+        )
+        self._router.emit('reconnect', gap)
+
+    @staticmethod
+    def _feeds(dom: bool, histogram: bool) -> tuple[FEED, ...]:
+        '''Market data feeds for subscribe flags'''
+        feeds = (FEED.QUOTE,)
+        if dom:
+            feeds += (FEED.DOM,)
+        if histogram:
+            feeds += (FEED.HISTOGRAM,)
+        return feeds
+
+    def _first_quote(self, quote: QuoteStruct) -> None:
+        '''Record time from startup to the first quote event'''
+        self.startup['first_quote'] = self._loop.time() - self._started
+        self._router.unregister('quote', self._first_quote)
+        log.info(f"Client first quote after {self.startup['first_quote']:.3f}s")
+
+    def _resolve_fill(self, entity_type: str, event_type: str, fill: FillDict) -> None:
+        '''Resolve metadata of contracts filled before they were registered'''
+        if event_type != "Deleted" and fill['contractId'] not in self._symbols:
+            self._loop.create_task(self.resolve_contract(fill['contractId']))
+
+    def _stage(self, stage: str, since: float) -> float:
+        '''Record startup stage duration since loop time and return loop time'''
+        now = self._loop.time()
+        self.startup[stage] = now - since
+        return now
+
+    def _update_chart(self, chart: ChartDict) -> None:
+        '''Apply chart bars to their subscription BarBuilder, emitting history once loaded'''
+        builder = self._charts.get(chart['id'])
+        if builder is None:
+            return None
+        for bar in chart.get('bars', ()):
+            builder.update_bar(bar)
+        if chart.get('eoh'):
+            self._router.emit('history', builder)
+
+    def _update_book(self, dom: DOMStruct) -> None:
+        '''Apply DOM update to its contract OrderBook'''
+        book = self._books.get(dom.contractId)
+        if book is None:
+            book = self._books[dom.contractId] = OrderBook(dom.contractId)
+        book.apply(dom)
 
     async def _run(
         self, auth: CredentialAuthDict, auto_renew: bool,
-        live: bool, demo: bool, mdlive: bool
+        live: bool, demo: bool, mdlive: bool, mddemo: bool, mdreplay: bool
     ) -> None:
         '''Private client loop run method'''
-        await self.create_websockets(live, demo, mdlive)
+        self.startup = {}
+        self._started = stage = self._loop.time()
+        self._router.register('quote', self._first_quote)
+        await self.create_websockets(live, demo, mdlive, mddemo, mdreplay)
+        stage = self._stage('open', stage)
+        for websocket in self._websockets or ():
+            self._loop.create_task(self.process_message(websocket))
         await self.authorize(auth, auto_renew)
+        stage = self._stage('authorize', stage)
         await self.authorizion_hold()
+        stage = self._stage('hold', stage)
         await self.sync_websockets()
-        for websocket in self._websockets:
-            self._loop.create_task(self.process_message(websocket))
+        self._stage('sync', stage)
+        self._stage('connect', self._started)
+        log.info("Client startup " + ", ".join(
+            f"{stage} {seconds:.3f}s" for stage, seconds in self.startup.items()
+        ))
         self._dispatch('connect')
 
     # -Instance Methods: Public
+    def add_contract(self, contract_id: int, symbol: str) -> None:
+        '''Register contract symbol with the P&L engine and every risk gate'''
+        self._pnl.add_contract(contract_id, symbol)
+        for gate in self._gates:
+            gate.add_contract(contract_id, symbol)
+        self._symbols[contract_id] = symbol
+
+    def add_handler(self, event: str, handler: Callable) -> None:
+        '''Route WebSocket event to handler'''
+        self._router.register(event, handler)
+
     async def authorize(
         self, auth: CredentialAuthDict, auto_renew: bool = True
     ) -> None:
@@ -77,52 +324,210 @@ class Client(Profile):
             auth, account_websockets=self._websockets_account,
             market_websockets=self._websockets_market
         )
+        for websocket in self._websockets or ():
+            if not websocket.authenticated.is_set():
+                log.error(f"Client dropping unauthorized WebSocket[{websocket.id}]")
+                self._drop_websocket(websocket)
+                await websocket.close()
         if auto_renew:
-            self._loop.create_task(self._renewal(), name="client-renewal")
+            self._renewal.start()
 
     async def authorizion_hold(self) -> None:
         '''Wait for all authentication setup to be finished'''
         await self._session.authenticated.wait()
-        for websocket in self._websockets:
-            await websocket.authenticated.wait()
+        await asyncio.gather(*(
+            websocket.authenticated.wait() for websocket in self._websockets or ()
+        ))
+
+    def build_bars(
+        self, contract_id: int, type_: BAR, size: float, *,
+        capacity: int = DEFAULT_CAPACITY
+    ) -> BarBuilder:
+        '''Aggregate quote subscription trades into bars'''
+        builder = BarBuilder(type_, size, capacity=capacity)
+        current = self._quotes.get(contract_id)
+
+        def on_quote(quote: Quote, changed: dict[str, float]) -> None:
+            nonlocal current
+            # -A new Quote is a full snapshot, e.g. after a reset, not a new trade
+            if quote is not current:
+                current = quote
+                return None
+            if 'volume' in changed and quote.trade is not None:
+                builder.update_tick(
+                    timestamp_to_seconds(quote.timestamp),
+                    quote.trade, quote.trade_size or 0
+                )
+        self._quotes.subscribe(on_quote, contract_id)
+        self._tick_builders.append(builder)
+        return builder
 
     async def close(self) -> None:
-        for websocket in self._websockets:
+        self._closing = True
+        self._renewal.stop()
+        self.disable_stats()
+        self.stop_recording()
+        for websocket in self._websockets or ():
             await websocket.close()
         await self._session.close()
 
-    async def create_websockets(self, live: bool, demo: bool, mdlive: bool) -> None:
-        '''Initialize Client WebSockets'''
-        self._live = (
-            await WebSocket.from_session(urls.wss_base_live, self._session)
-            if live else None
-        )
-        self._demo = (
-            await WebSocket.from_session(urls.wss_base_demo, self._session)
-            if demo else None
-        )
-        self._mdlive = (
-            await WebSocket.from_session(urls.wss_base_market, self._session)
-            if mdlive else None
+    async def create_websockets(
+        self, live: bool, demo: bool, mdlive: bool,
+        mddemo: bool = False, mdreplay: bool = False
+    ) -> None:
+        '''Initialize Client WebSockets concurrently'''
+        slots = (
+            ('_live', live, urls.wss_base_live),
+            ('_demo', demo, urls.wss_base_demo),
+            ('_mdlive', mdlive, urls.wss_base_market),
+            ('_mddemo', mddemo, urls.wss_base_mddemo),
+            ('_mdreplay', mdreplay, urls.wss_base_replay),
         )
+        for name, _, _ in slots:
+            setattr(self, name, None)
+        opening = [(name, url) for name, enabled, url in slots if enabled]
+        results = await asyncio.gather(*(
+            WebSocket.from_session(url, self._session) for _, url in opening
+        ), return_exceptions=True)
+        for (name, url), result in zip(opening, results):
+            if isinstance(result, Exception):
+                log.error(f"Client WebSocket '{url}' failed to open: {result!r}")
+                continue
+            result.timing = self._router.latency is not None
+            setattr(self, name, result)
+        self._subscriptions.websocket = self._mdlive
+        self._stores = {}
+        if self._live:
+            self._stores[self._live] = self._entities[urls.ENDPOINT.LIVE]
+        if self._demo:
+            self._stores[self._demo] = self._entities[urls.ENDPOINT.DEMO]
+
+    def disable_stats(self) -> None:
+        '''Stop latency instrumentation and its dump task'''
+        if self._stats_task:
+            self._stats_task.cancel()
+            self._stats_task = None
+        self._router.latency = None
+        for websocket in self._websockets or ():
+            websocket.timing = False
+
+    def entities(self, endpoint: urls.ENDPOINT = urls.ENDPOINT.LIVE) -> EntityStore:
+        '''Get entities kept from user sync of the endpoint account WebSocket'''
+        return self._entities[endpoint]
+
+    def enable_stats(self, dump_interval: float | None = None) -> LatencyStats:
+        '''Start latency instrumentation, logging stats every dump_interval seconds'''
+        if self._router.latency is None:
+            self._router.latency = LatencyStats()
+        for websocket in self._websockets or ():
+            websocket.timing = True
+        if dump_interval and not self._stats_task:
+            self._stats_task = self._loop.create_task(
+                self._dump_stats(dump_interval), name="client-stats"
+            )
+        return self._router.latency
 
     async def process_message(self, websocket: WebSocket) -> None:
         '''Task for WebSocket loop'''
-        while websocket.connected.is_set():
-            msg = (await websocket.poll_message())[0]
-            if not msg:
-                continue
-            print(msg)
+        try:
+            await websocket.wait_connected()
+        except Exception as exc:
+            log.error(f"Client WebSocket[{websocket.id}] failed to open: {exc!r}")
+            return None
+        queue = consumer = None
+        if self.queue_size:
+            queue = self._queues[websocket] = FrameQueue(self.queue_size, self.overflow)
+            consumer = self._loop.create_task(
+                self._consume(websocket, queue), name=f"client-consume[{websocket.id}]"
+            )
+        try:
+            while websocket.connected.is_set():
+                try:
+                    frame = await websocket.poll_message()
+                except WebSocketClosedException:
+                    if not websocket.connected.is_set():
+                        return None
+                    if not await self._reconnect(websocket):
+                        return None
+                    continue
+                if not frame:
+                    continue
+                if queue is None:
+                    self.process_frame(
+                        websocket, frame, websocket.received_ns, websocket.decoded_ns
+                    )
+                else:
+                    await queue.put(frame, websocket.received_ns, websocket.decoded_ns)
+        finally:
+            if consumer is not None:
+                consumer.cancel()
+                self._queues.pop(websocket, None)
+
+    def order_book(self, contract_id: int) -> OrderBook | None:
+        '''Get contract OrderBook kept from DOM subscription'''
+        return self._books.get(contract_id)
+
+    def process_frame(
+        self, websocket: WebSocket, frame: list[dict],
+        received: int = 0, decoded: int = 0
+    ) -> asyncio.Task | None:
+        '''Handle every message batched into a single WebSocket frame'''
+        store = self._stores.get(websocket)
+        if store is not None:
+            for msg in frame:
+                if msg.get('e') == 'props':
+                    store.apply(msg['d'])
+        return self._router.route_frame(frame, received, decoded)
+
+    def quote(self, contract_id: int) -> Quote | None:
+        '''Get latest contract Quote kept from quote subscription'''
+        return self._quotes.get(contract_id)
+
+    def record(self, directory: str, *, frames: bool = False) -> TickRecorder | None:
+        '''Record quote/DOM events to directory, and raw mdlive WebSocket frames if frames'''
+        if not self._mdlive:
+            return None
+        self.stop_recording()
+        self._recorder = TickRecorder(directory)
+        if frames:
+            self._mdlive.recorder = self._recorder
+        self._router.register('quote', self._recorder.record_quote)
+        self._router.register('dom', self._recorder.record_dom)
+        return self._recorder
+
+    def remove_handler(self, event: str, handler: Callable) -> None:
+        '''Stop routing WebSocket event to handler'''
+        self._router.unregister(event, handler)
+
+    async def resolve_contract(self, key: int | str) -> ContractInfo | None:
+        '''Resolve contract metadata from the cache, or REST once, and register it'''
+        info = await self._contracts.resolve(key)
+        if info is not None and info.id not in self._symbols:
+            self.add_contract(info.id, info.name)
+        return info
+
+    def risk_gate(self, account: Account, limits: RiskLimits | None = None) -> RiskGate:
+        '''Put a pre-trade risk gate between account order methods and the wire'''
+        gate = RiskGate(
+            self._pnl.account(account.endpoint, account.id), self._quotes, limits,
+            self._entities[account.endpoint]
+        )
+        for contract_id, symbol in self._symbols.items():
+            gate.add_contract(contract_id, symbol)
+        self._gates.append(gate)
+        account.risk = gate
+        return gate
 
     def run(
         self, auth: CredentialAuthDict, *, auto_renew: bool = True,
         live_websocket: bool = True, demo_websocket: bool = True,
-        mdlive_websocket: bool = True
+        mdlive_websocket: bool = True, mddemo_websocket: bool = False,
+        mdreplay_websocket: bool = False
     ) -> None:
         '''Public client loop run method'''
         self._loop.run_until_complete(self._run(
-            auth, auto_renew, live_websocket,
-            demo_websocket, mdlive_websocket
+            auth, auto_renew, live_websocket, demo_websocket,
+            mdlive_websocket, mddemo_websocket, mdreplay_websocket
         ))
         try:
             self._loop.run_forever()
@@ -134,30 +539,120 @@ class Client(Profile):
 
     async def subscribe_symbol(
         self, id_: int | str, *, dom: bool = True, histogram: bool = True
-    ) -> None:
+    ) -> bool:
         '''Add symbol to market subscription'''
+        return await self.subscribe_symbols((id_,), dom=dom, histogram=histogram)
+
+    async def subscribe_symbols(
+        self, ids: Iterable[int | str], *, dom: bool = True, histogram: bool = True
+    ) -> bool:
+        '''Add symbols to market subscription by contract id with concurrent requests'''
         if not self._mdlive:
+            return False
+        ids = await self._contract_ids(tuple(ids))
+        return await self._subscriptions.subscribe(ids, self._feeds(dom, histogram))
+
+    def stats(self) -> dict[str, dict]:
+        '''Latency summaries in nanoseconds by event type and stage, and component counters'''
+        latency = self._router.latency
+        return {
+            'latency': latency.summary() if latency is not None else {},
+            'queues': {
+                websocket.id: queue.stats for websocket, queue in self._queues.items()
+            },
+            'handlers': {
+                name: {
+                    'calls': stats.calls, 'errors': stats.errors,
+                    'mean_ns': stats.mean_ns, 'max_ns': stats.max_ns,
+                }
+                for name, stats in self._router.stats.items()
+            },
+            'risk': {gate.pnl.account_id: gate.stats for gate in self._gates},
+            'scheduler': self._session.scheduler.stats,
+            'renewal': self._renewal.stats,
+        }
+
+    def stop_recording(self) -> None:
+        '''Stop and close the market data recorder'''
+        if not self._recorder:
             return None
-        # -Market
-        await self._mdlive.request(urls.wss_market_sub, body={"symbol": id_})
-        # -DOM
-        if not dom:
-            return None
-        await self._mdlive.request(urls.wss_market_dom_sub, body={"symbol": id_})
-        # -Histogram
-        if not histogram:
+        self._router.unregister('quote', self._recorder.record_quote)
+        self._router.unregister('dom', self._recorder.record_dom)
+        if self._mdlive:
+            self._mdlive.recorder = None
+        self._recorder.close()
+        self._recorder = None
+
+    async def subscribe_chart(
+        self, symbol: int | str, *, underlying_type: str = "MinuteBar",
+        element_size: int = 1, element_size_unit: str = "UnderlyingUnits",
+        elements: int = 100, capacity: int = DEFAULT_CAPACITY
+    ) -> BarBuilder | None:
+        '''Add chart subscription and return its BarBuilder'''
+        if not self._mdlive:
             return None
-        await self._mdlive.request(urls.wss_market_histogram_sub, body={"symbol": id_})
+        body = {
+            "symbol": symbol,
+            "chartDescription": {
+                "underlyingType": underlying_type,
+                "elementSize": element_size,
+                "elementSizeUnit": element_size_unit,
+                "withHistogram": False,
+            },
+            "timeRange": {"asMuchAsElements": elements},
+        }
+        builder = BarBuilder(BAR.CHART, capacity=capacity)
+        await self._request_chart(builder, body)
+        self._chart_requests[builder] = body
+        return builder
 
     async def sync_websockets(self) -> None:
-        for websocket in self._websockets_account:
-            await websocket.request(urls.wss_user_sync, body={'users': [self.id]})
+        '''Request user sync on every account WebSocket concurrently'''
+        websockets = self._websockets_account or ()
+        results = await asyncio.gather(*(
+            websocket.request(urls.wss_user_sync, body={'users': [self.id]})
+            for websocket in websockets
+        ), return_exceptions=True)
+        for websocket, result in zip(websockets, results):
+            if isinstance(result, Exception) or result['s'] != 200:
+                log.error(f"Client WebSocket[{websocket.id}] sync failed: {result!r}")
+            elif 'd' in result:
+                self._stores[websocket].load(result['d'])
 
-    async def unsubscribe_symbol(self, id_: int | str) -> None:
+    async def unsubscribe_symbol(
+        self, id_: int | str, *, dom: bool = True, histogram: bool = True
+    ) -> bool:
         '''Remove symbol from market subscription'''
-        await self._mdlive.request(urls.wss_market_usub, body={"symbol": id_})
-        await self._mdlive.request(urls.wss_market_dom_usub, body={"symbol": id_})
-        await self._mdlive.request(urls.wss_market_histogram_usub, body={"symbol": id_})
+        return await self.unsubscribe_symbols((id_,), dom=dom, histogram=histogram)
+
+    async def unsubscribe_symbols(
+        self, ids: Iterable[int | str], *, dom: bool = True, histogram: bool = True
+    ) -> bool:
+        '''Remove symbols from market subscription, releasing unused feeds'''
+        if not self._mdlive:
+            return False
+        ids = await self._contract_ids(tuple(ids))
+        return await self._subscriptions.unsubscribe(ids, self._feeds(dom, histogram))
+
+    async def unsubscribe_chart(self, builder: BarBuilder) -> None:
+        '''Remove chart subscription'''
+        self._chart_requests.pop(builder, None)
+        ids = self._chart_subscriptions.pop(builder, None)
+        if not ids:
+            return None
+        for id_ in ids:
+            self._charts.pop(id_, None)
+        await self._mdlive.request(
+            urls.wss_market_chart_usub, body={"subscriptionId": ids[0]}
+        )
+
+    def websocket(self, endpoint: urls.ENDPOINT) -> WebSocket | None:
+        '''Account WebSocket for endpoint, if connected'''
+        if endpoint == urls.ENDPOINT.LIVE:
+            return self._live
+        if endpoint == urls.ENDPOINT.DEMO:
+            return self._demo
+        return None
 
     # -Properties: Private
     @property
@@ -201,12 +696,41 @@ class Client(Profile):
             return tuple(websockets)
         return None
 
+    # -Properties
+    @property
+    def contracts(self) -> ContractCache:
+        return self._contracts
+
+    @property
+    def handler_stats(self) -> dict[str, HandlerStats]:
+        return self._router.stats
+
+    @property
+    def market_websocket(self) -> WebSocket | None:
+        return self._mdlive
+
+    @property
+    def pnl(self) -> PnLEngine:
+        return self._pnl
+
+    @property
+    def quotes(self) -> QuoteCache:
+        return self._quotes
+
+    @property
+    def renewal(self) -> TokenRenewal:
+        return self._renewal
+
+    @property
+    def subscriptions(self) -> SubscriptionManager:
+        return self._subscriptions
+
     # -Properties: Authenticated
     @property
     def authenticated(self) -> bool:
         if not self._session.authenticated.is_set():
             return False
-        for websocket in self._websockets:
+        for websocket in self._websockets or ():
             if not websocket.authenticated.is_set():
                 return False
         return True
@@ -0,0 +1,15 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Market Data Module            ##
+##-------------------------------##
+
+## Imports
+from .bars import BAR, BarBuilder, BarSeries
+from .contracts import ContractCache, ContractInfo
+from .indicators import ATR, EMA, RSI, VWAP, Indicator, IndicatorEngine, RollingStd
+from .orderbook import BookView, OrderBook
+from .quotes import Quote, QuoteCache
+from .recorder import SIDE, TickReader, TickRecorder
+from .subscriptions import FEED, SubscriptionManager
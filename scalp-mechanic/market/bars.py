@@ -0,0 +1,257 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Bar Classes         ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import logging
+from enum import Enum
+from typing import Callable
+
+import numpy as np
+
+from utils import timestamp_to_seconds
+from utils.typing import BarDict
+
+## Constants
+log = logging.getLogger(__name__)
+DEFAULT_CAPACITY = 4096
+COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume', 'ticks')
+
+
+## Classes
+class BAR(Enum):
+    """Bar close rule Enum"""
+    TIME = 'time'           # -size in seconds
+    TICK = 'tick'           # -size in trades
+    VOLUME = 'volume'       # -size in contracts
+    RANGE = 'range'         # -size in price points
+    CHART = 'chart'         # -closed by md/getChart bar timestamps
+
+
+class BarSeries:
+    """Preallocated NumPy ring buffer of bars"""
+
+    # -Constructor
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> BarSeries:
+        self.capacity: int = capacity
+        self.count: int = 0
+        self._head: int = -1
+        # -Each column is written twice, capacity apart, so the newest
+        #  'count' bars are always one contiguous slice
+        self._data: np.ndarray = np.zeros((len(COLUMNS), 2 * capacity))
+
+    # -Dunder Methods
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"BarSeries(count={self.count}, capacity={self.capacity})"
+
+    # -Instance Methods: Private
+    def _slice(self, column: int, n: int | None) -> np.ndarray:
+        '''View of the newest n values of column, oldest first'''
+        n = self.count if n is None else min(n, self.count)
+        end = self._head + 1 + self.capacity
+        return self._data[column, end - n:end]
+
+    # -Instance Methods: Public
+    def append(
+        self, timestamp: float, open_: float, high: float, low: float,
+        close: float, volume: float, ticks: float
+    ) -> None:
+        '''Start a new bar, overwriting the oldest once full'''
+        self._head = (self._head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        self.set(timestamp, open_, high, low, close, volume, ticks)
+
+    def clear(self) -> None:
+        '''Drop every bar'''
+        self.count = 0
+        self._head = -1
+
+    def column(self, name: str, n: int | None = None) -> np.ndarray:
+        '''Zero-copy view of the newest n values of a column, oldest first'''
+        return self._slice(COLUMNS.index(name), n)
+
+    def last(self, name: str) -> float:
+        '''Value of column for the newest bar, NaN if there are none'''
+        if not self.count:
+            return float('nan')
+        return self._data[COLUMNS.index(name), self._head]
+
+    def pop(self) -> None:
+        '''Drop the newest bar'''
+        if self.count:
+            self.count -= 1
+            self._head = (self._head - 1) % self.capacity
+
+    def set(
+        self, timestamp: float, open_: float, high: float, low: float,
+        close: float, volume: float, ticks: float
+    ) -> None:
+        '''Overwrite the newest bar'''
+        head, data = self._head, self._data
+        values = (timestamp, open_, high, low, close, volume, ticks)
+        for column, value in enumerate(values):
+            data[column, head] = value
+            data[column, head + self.capacity] = value
+
+    def view(self, drop: int = 0) -> BarSeries:
+        '''Zero-copy series sharing this buffer, without its newest drop bars'''
+        series = BarSeries.__new__(BarSeries)
+        series.capacity = self.capacity
+        series.count = max(self.count - drop, 0)
+        series._head = (self._head - drop) % self.capacity if series.count else -1
+        series._data = self._data
+        return series
+
+    # -Properties
+    @property
+    def close(self) -> np.ndarray:
+        return self._slice(4, None)
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._slice(2, None)
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._slice(3, None)
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._slice(1, None)
+
+    @property
+    def timestamp(self) -> np.ndarray:
+        return self._slice(0, None)
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._slice(5, None)
+
+
+class BarBuilder:
+    """Incremental tick/chart to bar aggregator"""
+
+    # -Constructor
+    def __init__(
+        self, type_: BAR, size: float = 1, *, capacity: int = DEFAULT_CAPACITY
+    ) -> BarBuilder:
+        self.type: BAR = type_
+        self.size: float = size
+        self.bars: BarSeries = BarSeries(capacity)
+        self._open: bool = False
+        self._bucket: float = 0.0
+        self._timestamp: float = 0.0
+        self._o: float = 0.0
+        self._h: float = 0.0
+        self._l: float = 0.0
+        self._c: float = 0.0
+        self._v: float = 0.0
+        self._n: float = 0.0
+        self._subscribers: tuple[Callable[[BarSeries], None], ...] = ()
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"BarBuilder(type={self.type.name}, size={self.size}, bars={len(self.bars)})"
+
+    # -Instance Methods: Private
+    def _close(self) -> None:
+        '''Close the forming bar and notify subscribers'''
+        self._open = False
+        for callback in self._subscribers:
+            try:
+                callback(self.bars)
+            except Exception:
+                log.exception(f"Bar subscriber '{callback.__qualname__}' failed")
+
+    def _start(self, timestamp: float, price: float, size: float) -> None:
+        '''Open a new bar from its first tick'''
+        self._open = True
+        self._timestamp = timestamp
+        self._o = self._h = self._l = self._c = price
+        self._v = size
+        self._n = 1
+        self.bars.append(timestamp, price, price, price, price, size, 1)
+
+    # -Instance Methods: Public
+    def reset(self) -> None:
+        '''Abandon the forming bar, e.g. after a data gap'''
+        if self._open:
+            self._open = False
+            self.bars.pop()
+
+    def subscribe(self, callback: Callable[[BarSeries], None]) -> None:
+        '''Call back with the BarSeries on every bar close'''
+        self._subscribers += (callback,)
+
+    def unsubscribe(self, callback: Callable[[BarSeries], None]) -> None:
+        '''Stop calling back on bar close'''
+        self._subscribers = tuple(c for c in self._subscribers if c != callback)
+
+    def update_bar(self, bar: BarDict) -> bool:
+        '''Apply md/getChart bar; returns True if the previous bar closed'''
+        timestamp = timestamp_to_seconds(bar['timestamp'])
+        volume = bar.get('upVolume', 0) + bar.get('downVolume', 0)
+        ticks = bar.get('upTicks', 0) + bar.get('downTicks', 0)
+        values = (
+            timestamp, bar['open'], bar['high'], bar['low'], bar['close'], volume, ticks
+        )
+        if self._open and timestamp == self._timestamp:
+            self.bars.set(*values)
+            return False
+        if timestamp < self._timestamp:
+            return False
+        closed = self._open
+        if closed:
+            self._close()
+        self._open = True
+        self._timestamp = timestamp
+        self.bars.append(*values)
+        return closed
+
+    def update_tick(self, timestamp: float, price: float, size: float = 0) -> bool:
+        '''Apply trade tick; returns True if a bar closed'''
+        type_ = self.type
+        closed = False
+        if self._open:
+            if type_ is BAR.TIME:
+                closed = timestamp // self.size != self._bucket
+            elif type_ is BAR.RANGE:
+                closed = max(self._h, price) - min(self._l, price) > self.size
+            if closed:
+                self._close()
+        if not self._open:
+            if type_ is BAR.TIME:
+                self._bucket = timestamp // self.size
+                timestamp = self._bucket * self.size
+            self._start(timestamp, price, size)
+        else:
+            if price > self._h:
+                self._h = price
+            elif price < self._l:
+                self._l = price
+            self._c = price
+            self._v += size
+            self._n += 1
+            self.bars.set(
+                self._timestamp, self._o, self._h, self._l, self._c, self._v, self._n
+            )
+        if type_ is BAR.TICK and self._n >= self.size:
+            self._close()
+            closed = True
+        elif type_ is BAR.VOLUME and self._v >= self.size:
+            self._close()
+            closed = True
+        return closed
+
+    # -Properties
+    @property
+    def closed(self) -> BarSeries:
+        return self.bars.view(1) if self._open else self.bars
@@ -0,0 +1,201 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Contract Cache      ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+import logging
+import os
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING
+
+from .products import register
+from utils import codec, timestamp_to_seconds
+if TYPE_CHECKING:
+    from profile.rest import EntityClient
+
+## Constants
+log = logging.getLogger(__name__)
+VERSION = 1
+
+
+## Classes
+class ContractInfo:
+    """Contract id, product spec and maturity of one symbol"""
+    __slots__ = ('id', 'name', 'product', 'tick_size', 'point_value', 'expiration')
+
+    # -Constructor
+    def __init__(
+        self, id_: int, name: str, product: str, tick_size: float,
+        point_value: float, expiration: float
+    ) -> ContractInfo:
+        self.id: int = id_
+        self.name: str = name
+        self.product: str = product
+        self.tick_size: float = tick_size
+        self.point_value: float = point_value
+        self.expiration: float = expiration
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"ContractInfo(id={self.id}, name={self.name}, product={self.product}, "
+            f"tick_size={self.tick_size}, point_value={self.point_value})"
+        )
+
+    # -Instance Methods
+    def row(self) -> list:
+        '''Compact row persisted to the cache file'''
+        return [
+            self.id, self.name, self.product, self.tick_size,
+            self.point_value, self.expiration
+        ]
+
+    # -Properties
+    @property
+    def expired(self) -> bool:
+        return time() >= self.expiration
+
+
+class ContractCache:
+    """Symbol and contract id metadata indexes, persisted to disk until maturity if given a path"""
+
+    # -Constructor
+    def __init__(
+        self, path: str | Path | None = None, rest: EntityClient | None = None
+    ) -> ContractCache:
+        self.path: Path | None = Path(path) if path else None
+        self.rest: EntityClient | None = rest
+        self.hits: int = 0
+        self.misses: int = 0
+        self._ids: dict[int, ContractInfo] = {}
+        self._names: dict[str, ContractInfo] = {}
+        self._pending: dict[str | int, asyncio.Task] = {}
+        if self.path:
+            self.load()
+
+    # -Dunder Methods
+    def __contains__(self, key: int | str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"ContractCache(contracts={len(self._ids)}, path={self.path})"
+
+    # -Instance Methods: Private
+    def _add(self, info: ContractInfo) -> ContractInfo:
+        '''Index contract and register its product spec'''
+        self._ids[info.id] = info
+        self._names[info.name] = info
+        register(info.product, info.point_value, info.tick_size)
+        return info
+
+    async def _fetch(self, key: int | str) -> ContractInfo | None:
+        '''Resolve contract, maturity and product from REST and save the cache'''
+        if self.rest is None:
+            return None
+        if isinstance(key, int):
+            contract = await self.rest.item('contract', key)
+        else:
+            contract = await self.rest.find('contract', key)
+        if not contract:
+            return None
+        maturity = await self.rest.item('contractMaturity', contract['contractMaturityId'])
+        product = await self.rest.item('product', maturity['productId']) if maturity else None
+        if not product:
+            log.warning(f"ContractCache incomplete metadata for '{contract['name']}'")
+            return None
+        info = self._add(ContractInfo(
+            contract['id'], contract['name'], product['name'],
+            product['tickSize'], product['valuePerPoint'],
+            timestamp_to_seconds(maturity['expirationDate'].replace('Z', '+00:00')),
+        ))
+        self.save()
+        return info
+
+    def _remove(self, info: ContractInfo) -> None:
+        '''Drop contract from every index'''
+        self._ids.pop(info.id, None)
+        if self._names.get(info.name) is info:
+            del self._names[info.name]
+
+    # -Instance Methods: Public
+    def get(self, key: int | str) -> ContractInfo | None:
+        '''Cached unexpired contract by id or symbol'''
+        info = self._ids.get(key) if isinstance(key, int) else self._names.get(key)
+        if info is not None and info.expired:
+            self._remove(info)
+            return None
+        return info
+
+    def load(self) -> int:
+        '''Load unexpired contracts from the cache file'''
+        try:
+            with open(self.path, 'rb') as file:
+                data = codec.loads(file.read())
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as exc:
+            log.warning(f"ContractCache unable to read '{self.path}': {exc!r}")
+            return 0
+        if not isinstance(data, dict) or data.get('version') != VERSION:
+            return 0
+        now = time()
+        for row in data.get('contracts', ()):
+            try:
+                info = ContractInfo(*row)
+                expired = info.expiration <= now
+            except TypeError:
+                log.warning(f"ContractCache skipping malformed row {row!r}")
+                continue
+            if not expired:
+                self._add(info)
+        log.debug(f"ContractCache loaded {len(self._ids)} contracts")
+        return len(self._ids)
+
+    async def resolve(self, key: int | str) -> ContractInfo | None:
+        '''Contract by id or symbol, fetched once from REST on a cache miss'''
+        info = self.get(key)
+        if info is not None:
+            self.hits += 1
+            return info
+        self.misses += 1
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.ensure_future(self._fetch(key))
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        try:
+            return await asyncio.shield(task)
+        except Exception as exc:
+            log.error(f"ContractCache unable to resolve '{key}': {exc!r}")
+            return None
+
+    def save(self) -> None:
+        '''Atomically write unexpired contracts to the cache file'''
+        if not self.path:
+            return None
+        now = time()
+        data = codec.dumps({
+            'version': VERSION,
+            'contracts': [info.row() for info in self._ids.values() if info.expiration > now],
+        })
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.path.with_suffix('.tmp')
+            with open(temp, 'w') as file:
+                file.write(data)
+            os.replace(temp, self.path)
+        except OSError as exc:
+            log.warning(f"ContractCache unable to write '{self.path}': {exc!r}")
+
+    # -Properties
+    @property
+    def contracts(self) -> tuple[ContractInfo, ...]:
+        return tuple(self._ids.values())
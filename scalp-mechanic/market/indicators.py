@@ -0,0 +1,394 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Indicator Classes   ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from collections import deque
+from math import sqrt
+
+import numpy as np
+
+from .bars import BarBuilder, BarSeries
+
+## Constants
+_BLOCK = 256
+
+
+## Functions
+def _ewm(values: np.ndarray, alpha: float, seed: float) -> np.ndarray:
+    """Vectorized y[i] = y[i-1] + alpha * (x[i] - y[i-1]) starting from seed"""
+    out = np.empty(len(values))
+    if alpha >= 1.0:
+        out[:] = values
+        return out
+    decay = 1.0 - alpha
+    # -Powers are bounded per block so decay**-k never overflows
+    powers = decay ** np.arange(_BLOCK + 1)
+    inverse = 1.0 / powers[1:]
+    last = seed
+    for start in range(0, len(values), _BLOCK):
+        block = values[start:start + _BLOCK]
+        n = len(block)
+        acc = np.cumsum(block * inverse[:n] * alpha)
+        out[start:start + n] = powers[1:n + 1] * (last + acc)
+        last = out[start + n - 1]
+    return out
+
+
+## Classes
+class Indicator(ABC):
+    """Base incremental indicator"""
+
+    # -Constructor
+    def __init__(self) -> Indicator:
+        self.value: float = float('nan')
+
+    # -Instance Methods
+    @abstractmethod
+    def batch_bars(self, bars: BarSeries) -> np.ndarray:
+        '''Vectorized update over every bar, leaving state after the last'''
+
+    def reset(self) -> None:
+        '''Clear indicator state'''
+        self.__init__(*self._args)
+
+    @abstractmethod
+    def update_bar(self, bars: BarSeries) -> float:
+        '''Update from the newest bar of a series'''
+
+    # -Properties
+    @property
+    def _args(self) -> tuple:
+        return ()
+
+
+class EMA(Indicator):
+    """Exponential moving average of closes"""
+
+    # -Constructor
+    def __init__(self, period: int) -> EMA:
+        super().__init__()
+        self.period: int = period
+        self.alpha: float = 2.0 / (period + 1)
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"EMA(period={self.period}, value={self.value})"
+
+    # -Instance Methods
+    def batch(self, values: np.ndarray) -> np.ndarray:
+        '''Vectorized update over values'''
+        if not len(values):
+            return np.empty(0)
+        seed = values[0] if self.value != self.value else self.value
+        out = _ewm(np.asarray(values, dtype=float), self.alpha, seed)
+        self.value = out[-1]
+        return out
+
+    def batch_bars(self, bars: BarSeries) -> np.ndarray:
+        return self.batch(bars.close)
+
+    def update(self, value: float) -> float:
+        '''Incremental update'''
+        if self.value != self.value:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+    def update_bar(self, bars: BarSeries) -> float:
+        return self.update(bars.last('close'))
+
+    # -Properties
+    @property
+    def _args(self) -> tuple:
+        return (self.period,)
+
+
+class VWAP(Indicator):
+    """Volume weighted average price of typical price"""
+
+    # -Constructor
+    def __init__(self) -> VWAP:
+        super().__init__()
+        self._pv: float = 0.0
+        self._v: float = 0.0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"VWAP(value={self.value})"
+
+    # -Instance Methods
+    def batch(self, price: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        '''Vectorized update over prices and volumes'''
+        pv = np.cumsum(price * volume) + self._pv
+        v = np.cumsum(volume) + self._v
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out = np.where(v > 0, pv / np.where(v > 0, v, 1.0), np.nan)
+        if len(out):
+            self._pv, self._v, self.value = pv[-1], v[-1], out[-1]
+        return out
+
+    def batch_bars(self, bars: BarSeries) -> np.ndarray:
+        return self.batch((bars.high + bars.low + bars.close) / 3.0, bars.volume)
+
+    def update(self, price: float, volume: float) -> float:
+        '''Incremental update'''
+        self._pv += price * volume
+        self._v += volume
+        if self._v > 0:
+            self.value = self._pv / self._v
+        return self.value
+
+    def update_bar(self, bars: BarSeries) -> float:
+        price = (bars.last('high') + bars.last('low') + bars.last('close')) / 3.0
+        return self.update(price, bars.last('volume'))
+
+
+class ATR(Indicator):
+    """Wilder average true range"""
+
+    # -Constructor
+    def __init__(self, period: int) -> ATR:
+        super().__init__()
+        self.period: int = period
+        self._close: float = float('nan')
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"ATR(period={self.period}, value={self.value})"
+
+    # -Instance Methods
+    def batch(
+        self, high: np.ndarray, low: np.ndarray, close: np.ndarray
+    ) -> np.ndarray:
+        '''Vectorized update over high, low and close arrays'''
+        if not len(close):
+            return np.empty(0)
+        prev = np.empty(len(close))
+        prev[0] = self._close
+        prev[1:] = close[:-1]
+        tr = high - low
+        if self._close != self._close:
+            gaps = np.maximum(np.abs(high[1:] - prev[1:]), np.abs(low[1:] - prev[1:]))
+            tr[1:] = np.maximum(tr[1:], gaps)
+        else:
+            tr = np.maximum(tr, np.maximum(np.abs(high - prev), np.abs(low - prev)))
+        seed = tr[0] if self.value != self.value else self.value
+        out = _ewm(tr, 1.0 / self.period, seed)
+        self._close, self.value = close[-1], out[-1]
+        return out
+
+    def batch_bars(self, bars: BarSeries) -> np.ndarray:
+        return self.batch(bars.high, bars.low, bars.close)
+
+    def update(self, high: float, low: float, close: float) -> float:
+        '''Incremental update'''
+        tr = high - low
+        if self._close == self._close:
+            tr = max(tr, abs(high - self._close), abs(low - self._close))
+        if self.value != self.value:
+            self.value = tr
+        else:
+            self.value += (tr - self.value) / self.period
+        self._close = close
+        return self.value
+
+    def update_bar(self, bars: BarSeries) -> float:
+        return self.update(bars.last('high'), bars.last('low'), bars.last('close'))
+
+    # -Properties
+    @property
+    def _args(self) -> tuple:
+        return (self.period,)
+
+
+class RSI(Indicator):
+    """Wilder relative strength index of closes"""
+
+    # -Constructor
+    def __init__(self, period: int) -> RSI:
+        super().__init__()
+        self.period: int = period
+        self._close: float = float('nan')
+        self._gain: float = float('nan')
+        self._loss: float = float('nan')
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"RSI(period={self.period}, value={self.value})"
+
+    # -Instance Methods: Private
+    @staticmethod
+    def _rsi(gain: np.ndarray | float, loss: np.ndarray | float) -> np.ndarray | float:
+        '''RSI from average gain and loss'''
+        total = gain + loss
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(total > 0, 100.0 * gain / np.where(total > 0, total, 1.0), 50.0)
+
+    # -Instance Methods: Public
+    def batch(self, values: np.ndarray) -> np.ndarray:
+        '''Vectorized update over values'''
+        out = np.full(len(values), np.nan)
+        if not len(values):
+            return out
+        start = 0
+        if self._close != self._close:
+            self._close, start = values[0], 1
+        if start >= len(values):
+            return out
+        diff = np.diff(values[start:], prepend=self._close)
+        gain, loss = np.maximum(diff, 0.0), np.maximum(-diff, 0.0)
+        seeded = self._gain == self._gain
+        alpha = 1.0 / self.period
+        gains = _ewm(gain, alpha, self._gain if seeded else gain[0])
+        losses = _ewm(loss, alpha, self._loss if seeded else loss[0])
+        out[start:] = self._rsi(gains, losses)
+        self._close, self._gain, self._loss = values[-1], gains[-1], losses[-1]
+        self.value = out[-1]
+        return out
+
+    def batch_bars(self, bars: BarSeries) -> np.ndarray:
+        return self.batch(bars.close)
+
+    def update(self, value: float) -> float:
+        '''Incremental update'''
+        if self._close != self._close:
+            self._close = value
+            return self.value
+        diff = value - self._close
+        gain, loss = max(diff, 0.0), max(-diff, 0.0)
+        if self._gain != self._gain:
+            self._gain, self._loss = gain, loss
+        else:
+            self._gain += (gain - self._gain) / self.period
+            self._loss += (loss - self._loss) / self.period
+        self._close = value
+        total = self._gain + self._loss
+        self.value = 100.0 * self._gain / total if total > 0 else 50.0
+        return self.value
+
+    def update_bar(self, bars: BarSeries) -> float:
+        return self.update(bars.last('close'))
+
+    # -Properties
+    @property
+    def _args(self) -> tuple:
+        return (self.period,)
+
+
+class RollingStd(Indicator):
+    """Rolling population standard deviation of closes"""
+
+    # -Constructor
+    def __init__(self, window: int) -> RollingStd:
+        super().__init__()
+        self.window: int = window
+        self._values: deque[float] = deque(maxlen=window)
+        self._sum: float = 0.0
+        self._sumsq: float = 0.0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"RollingStd(window={self.window}, value={self.value})"
+
+    # -Instance Methods
+    def batch(self, values: np.ndarray) -> np.ndarray:
+        '''Vectorized update over values'''
+        values = np.concatenate((np.fromiter(self._values, float), values))
+        skip = len(self._values)
+        n = np.minimum(np.arange(1, len(values) + 1), self.window)
+        csum = np.cumsum(np.concatenate(([0.0], values)))
+        csumsq = np.cumsum(np.concatenate(([0.0], values * values)))
+        ends = np.arange(1, len(values) + 1)
+        sums = csum[ends] - csum[ends - n]
+        sumsqs = csumsq[ends] - csumsq[ends - n]
+        mean = sums / n
+        out = np.sqrt(np.maximum(sumsqs / n - mean * mean, 0.0))[skip:]
+        self._values.extend(values[-self.window:])
+        self._sum = float(np.sum(self._values))
+        self._sumsq = float(np.sum(np.square(self._values)))
+        if len(out):
+            self.value = out[-1]
+        return out
+
+    def batch_bars(self, bars: BarSeries) -> np.ndarray:
+        return self.batch(bars.close)
+
+    def update(self, value: float) -> float:
+        '''Incremental update'''
+        if len(self._values) == self.window:
+            old = self._values[0]
+            self._sum -= old
+            self._sumsq -= old * old
+        self._values.append(value)
+        self._sum += value
+        self._sumsq += value * value
+        n = len(self._values)
+        mean = self._sum / n
+        self.value = sqrt(max(self._sumsq / n - mean * mean, 0.0))
+        return self.value
+
+    def update_bar(self, bars: BarSeries) -> float:
+        return self.update(bars.last('close'))
+
+    # -Properties
+    @property
+    def _args(self) -> tuple:
+        return (self.window,)
+
+
+class IndicatorEngine:
+    """Set of named indicators updated on every bar close"""
+
+    # -Constructor
+    def __init__(self, **indicators: Indicator) -> IndicatorEngine:
+        self.indicators: dict[str, Indicator] = indicators
+
+    # -Dunder Methods
+    def __getitem__(self, name: str) -> float:
+        return self.indicators[name].value
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={ind.value:.4f}" for name, ind in self.indicators.items())
+        return f"IndicatorEngine({values})"
+
+    # -Instance Methods
+    def attach(self, builder: BarBuilder) -> None:
+        '''Warm up from builder's closed bars and update on every bar close'''
+        self.warm_up(builder.closed)
+        builder.subscribe(self.update)
+
+    def detach(self, builder: BarBuilder) -> None:
+        '''Stop updating from builder'''
+        builder.unsubscribe(self.update)
+
+    def update(self, bars: BarSeries) -> None:
+        '''Incremental update of every indicator from the newest bar'''
+        for indicator in self.indicators.values():
+            indicator.update_bar(bars)
+
+    def warm_up(self, bars: BarSeries) -> dict[str, np.ndarray]:
+        '''Reset and batch-compute every indicator over a bar series'''
+        results = {}
+        for name, indicator in self.indicators.items():
+            indicator.reset()
+            results[name] = indicator.batch_bars(bars)
+        return results
+
+    # -Class Methods
+    @classmethod
+    def scalping(cls, builder: BarBuilder | None = None) -> IndicatorEngine:
+        '''Create engine with the scalping rule indicators'''
+        engine = cls(
+            ema_fast=EMA(9), ema_slow=EMA(21), vwap=VWAP(),
+            atr=ATR(14), rsi=RSI(14), std=RollingStd(20),
+        )
+        if builder:
+            engine.attach(builder)
+        return engine
@@ -0,0 +1,159 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Order Book Class    ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from array import array
+
+from utils.codec import DOMStruct, PriceLevel
+
+## Constants
+DEFAULT_DEPTH = 10
+
+
+## Classes
+class BookView:
+    """Zero-copy view of an OrderBook's price levels"""
+    __slots__ = (
+        'timestamp', 'bid_prices', 'bid_sizes', 'ask_prices', 'ask_sizes'
+    )
+
+    # -Constructor
+    def __init__(
+        self, timestamp: str | None,
+        bid_prices: memoryview, bid_sizes: memoryview,
+        ask_prices: memoryview, ask_sizes: memoryview
+    ) -> BookView:
+        self.timestamp: str | None = timestamp
+        self.bid_prices: memoryview = bid_prices
+        self.bid_sizes: memoryview = bid_sizes
+        self.ask_prices: memoryview = ask_prices
+        self.ask_sizes: memoryview = ask_sizes
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"BookView(timestamp={self.timestamp}, bids={len(self.bid_prices)}, "
+            f"asks={len(self.ask_prices)})"
+        )
+
+
+class OrderBook:
+    """Tradovate contract order book"""
+
+    # -Constructor
+    def __init__(self, contract_id: int, depth: int = DEFAULT_DEPTH) -> OrderBook:
+        self.contract_id: int = contract_id
+        self.depth: int = depth
+        self.timestamp: str | None = None
+        self.updates: int = 0
+        self._bids: int = 0
+        self._asks: int = 0
+        self._bid_prices: array = array('d', bytes(8 * depth))
+        self._bid_sizes: array = array('d', bytes(8 * depth))
+        self._bid_totals: array = array('d', bytes(8 * depth))
+        self._ask_prices: array = array('d', bytes(8 * depth))
+        self._ask_sizes: array = array('d', bytes(8 * depth))
+        self._ask_totals: array = array('d', bytes(8 * depth))
+        self._views: tuple[memoryview, ...] = tuple(memoryview(arr) for arr in (
+            self._bid_prices, self._bid_sizes, self._ask_prices, self._ask_sizes
+        ))
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"OrderBook(contract_id={self.contract_id}, bid={self.best_bid}, "
+            f"ask={self.best_ask}, timestamp={self.timestamp})"
+        )
+
+    # -Instance Methods: Private
+    def _apply_side(
+        self, levels: list[PriceLevel],
+        prices: array, sizes: array, totals: array
+    ) -> int:
+        '''Overwrite one side of the book in place, best level first'''
+        count = min(len(levels), self.depth)
+        total = 0.0
+        for i in range(count):
+            level = levels[i]
+            size = level.size
+            total += size
+            prices[i] = level.price
+            sizes[i] = size
+            totals[i] = total
+        return count
+
+    # -Instance Methods: Public
+    def apply(self, dom: DOMStruct) -> None:
+        '''Apply a md/subscribeDOM ladder update to the book'''
+        self.timestamp = dom.timestamp
+        self._bids = self._apply_side(
+            dom.bids, self._bid_prices, self._bid_sizes, self._bid_totals
+        )
+        self._asks = self._apply_side(
+            dom.offers, self._ask_prices, self._ask_sizes, self._ask_totals
+        )
+        self.updates += 1
+
+    def ask_depth(self, levels: int | None = None) -> float:
+        '''Cumulative offer size over the best levels'''
+        levels = self._asks if levels is None else min(levels, self._asks)
+        return self._ask_totals[levels - 1] if levels > 0 else 0.0
+
+    def bid_depth(self, levels: int | None = None) -> float:
+        '''Cumulative bid size over the best levels'''
+        levels = self._bids if levels is None else min(levels, self._bids)
+        return self._bid_totals[levels - 1] if levels > 0 else 0.0
+
+    def clear(self) -> None:
+        '''Empty the book until the next DOM update'''
+        self._bids = 0
+        self._asks = 0
+        self.timestamp = None
+
+    def imbalance(self, levels: int | None = None) -> float:
+        '''Bid/offer size imbalance over the best levels, from -1.0 to 1.0'''
+        bid, ask = self.bid_depth(levels), self.ask_depth(levels)
+        total = bid + ask
+        return (bid - ask) / total if total else 0.0
+
+    def view(self) -> BookView:
+        '''Zero-copy snapshot view of the populated price levels'''
+        bid_prices, bid_sizes, ask_prices, ask_sizes = self._views
+        return BookView(
+            self.timestamp, bid_prices[:self._bids], bid_sizes[:self._bids],
+            ask_prices[:self._asks], ask_sizes[:self._asks]
+        )
+
+    # -Properties
+    @property
+    def best_ask(self) -> float | None:
+        return self._ask_prices[0] if self._asks else None
+
+    @property
+    def best_ask_size(self) -> float:
+        return self._ask_sizes[0] if self._asks else 0.0
+
+    @property
+    def best_bid(self) -> float | None:
+        return self._bid_prices[0] if self._bids else None
+
+    @property
+    def best_bid_size(self) -> float:
+        return self._bid_sizes[0] if self._bids else 0.0
+
+    @property
+    def mid(self) -> float | None:
+        if not (self._bids and self._asks):
+            return None
+        return (self._bid_prices[0] + self._ask_prices[0]) / 2
+
+    @property
+    def spread(self) -> float | None:
+        if not (self._bids and self._asks):
+            return None
+        return self._ask_prices[0] - self._bid_prices[0]
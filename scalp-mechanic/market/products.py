@@ -0,0 +1,74 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Product Specs       ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import re
+
+## Constants
+_CONTRACT = re.compile(r"^([A-Z0-9]+?)([FGHJKMNQUVXZ])(\d{1,2})$")
+# -Name, point value, tick size, round turn commission per contract
+SPECS = (
+    ('ES', 50.0, 0.25, 4.64),
+    ('MES', 5.0, 0.25, 1.60),
+    ('NQ', 20.0, 0.25, 4.64),
+    ('MNQ', 2.0, 0.25, 1.60),
+)
+
+
+## Classes
+class Product:
+    """Futures product point value, tick size and round turn commission"""
+    __slots__ = ('name', 'point_value', 'tick_size', 'commission')
+
+    # -Constructor
+    def __init__(
+        self, name: str, point_value: float, tick_size: float, commission: float
+    ) -> Product:
+        self.name: str = name
+        self.point_value: float = point_value
+        self.tick_size: float = tick_size
+        self.commission: float = commission
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"Product(name={self.name}, point_value={self.point_value}, "
+            f"tick_size={self.tick_size}, commission={self.commission})"
+        )
+
+    # -Properties
+    @property
+    def tick_value(self) -> float:
+        return self.tick_size * self.point_value
+
+
+## Functions
+def product_name(symbol: str) -> str:
+    """Product of a contract symbol, e.g. 'MESM2' -> 'MES'"""
+    match = _CONTRACT.match(symbol.upper())
+    return match.group(1) if match else symbol.upper()
+
+
+def product_of(symbol: str) -> Product | None:
+    """Product spec of a contract or product symbol"""
+    return PRODUCTS.get(product_name(symbol))
+
+
+def register(name: str, point_value: float, tick_size: float) -> Product:
+    """Add or update product spec from exchange metadata, keeping known commissions"""
+    product = PRODUCTS.get(name)
+    if product is None:
+        product = PRODUCTS[name] = Product(name, point_value, tick_size, 0.0)
+    else:
+        product.point_value = point_value
+        product.tick_size = tick_size
+    return product
+
+
+## Body
+PRODUCTS: dict[str, Product] = {spec[0]: Product(*spec) for spec in SPECS}
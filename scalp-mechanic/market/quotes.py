@@ -0,0 +1,138 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Quote Cache Classes ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import logging
+from typing import Callable
+
+from utils.codec import QuoteStruct
+
+## Constants
+log = logging.getLogger(__name__)
+# -Quote entry name, entry key, Quote field
+_ENTRIES = (
+    ('Bid', 'price', 'bid'), ('Bid', 'size', 'bid_size'),
+    ('Offer', 'price', 'offer'), ('Offer', 'size', 'offer_size'),
+    ('Trade', 'price', 'trade'), ('Trade', 'size', 'trade_size'),
+    ('TotalTradeVolume', 'size', 'volume'),
+    ('OpenInterest', 'size', 'open_interest'),
+    ('OpeningPrice', 'price', 'open'),
+    ('HighPrice', 'price', 'high'),
+    ('LowPrice', 'price', 'low'),
+    ('SettlementPrice', 'price', 'settlement'),
+)
+FIELDS = tuple(field for _, _, field in _ENTRIES)
+
+
+## Classes
+class Quote:
+    """Last value of a contract's quote fields"""
+    __slots__ = ('contract_id', 'timestamp') + FIELDS
+
+    # -Constructor
+    def __init__(self, contract_id: int) -> Quote:
+        self.contract_id: int = contract_id
+        self.timestamp: str | None = None
+        for field in FIELDS:
+            setattr(self, field, None)
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"Quote(contract_id={self.contract_id}, bid={self.bid}, "
+            f"offer={self.offer}, trade={self.trade}, timestamp={self.timestamp})"
+        )
+
+
+class QuoteCache:
+    """Per-contract last-value quote cache with change-only notification"""
+
+    # -Constructor
+    def __init__(self) -> QuoteCache:
+        self._quotes: dict[int, Quote] = {}
+        self._subscribers: tuple[Callable[[Quote, dict], None], ...] = ()
+        self._contract_subscribers: dict[int, tuple[Callable, ...]] = {}
+
+    # -Dunder Methods
+    def __contains__(self, contract_id: int) -> bool:
+        return contract_id in self._quotes
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    # -Instance Methods: Private
+    def _notify(
+        self, callbacks: tuple[Callable, ...], quote: Quote, changed: dict
+    ) -> None:
+        '''Call subscribers with the changed quote fields'''
+        for callback in callbacks:
+            try:
+                callback(quote, changed)
+            except Exception:
+                log.exception(f"Quote subscriber '{callback.__qualname__}' failed")
+
+    # -Instance Methods: Public
+    def clear(self, contract_id: int | None = None) -> None:
+        '''Forget cached quotes so the next update is reported in full'''
+        if contract_id is None:
+            self._quotes.clear()
+        else:
+            self._quotes.pop(contract_id, None)
+
+    def get(self, contract_id: int) -> Quote | None:
+        '''Latest quote for contract'''
+        return self._quotes.get(contract_id)
+
+    def subscribe(
+        self, callback: Callable[[Quote, dict], None], contract_id: int | None = None
+    ) -> None:
+        '''Call back with (quote, changed fields) on every quote change'''
+        if contract_id is None:
+            self._subscribers += (callback,)
+        else:
+            callbacks = self._contract_subscribers.get(contract_id, ())
+            self._contract_subscribers[contract_id] = callbacks + (callback,)
+
+    def unsubscribe(
+        self, callback: Callable[[Quote, dict], None], contract_id: int | None = None
+    ) -> None:
+        '''Stop calling back on quote changes'''
+        if contract_id is None:
+            self._subscribers = tuple(c for c in self._subscribers if c != callback)
+            return None
+        callbacks = tuple(
+            c for c in self._contract_subscribers.get(contract_id, ()) if c != callback
+        )
+        if callbacks:
+            self._contract_subscribers[contract_id] = callbacks
+        else:
+            self._contract_subscribers.pop(contract_id, None)
+
+    def update(self, quote: QuoteStruct) -> dict[str, float]:
+        '''Apply md/subscribeQuote payload and return the changed fields'''
+        contract_id = quote.contractId
+        last = self._quotes.get(contract_id)
+        if last is None:
+            last = self._quotes[contract_id] = Quote(contract_id)
+        last.timestamp = quote.timestamp
+        entries = quote.entries
+        changed = {}
+        for name, key, field in _ENTRIES:
+            entry = entries.get(name)
+            if entry is None:
+                continue
+            value = getattr(entry, key)
+            if getattr(last, field) != value:
+                setattr(last, field, value)
+                changed[field] = value
+        if changed:
+            self._notify(self._subscribers, last, changed)
+            callbacks = self._contract_subscribers.get(contract_id)
+            if callbacks:
+                self._notify(callbacks, last, changed)
+        return changed
@@ -0,0 +1,259 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Tick Recorder       ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import logging
+import mmap
+import os
+import struct
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import IntEnum
+from pathlib import Path
+from time import time_ns
+from typing import Iterator
+
+import numpy as np
+
+from utils import timestamp_to_seconds
+from utils.codec import DOMStruct, PriceLevel, QuoteStruct
+
+## Constants
+log = logging.getLogger(__name__)
+FLUSH_ROWS = 8192
+FLUSH_BYTES = 1 << 20
+FRAMES = "frames.bin"
+# -Column name, array typecode, NumPy dtype
+COLUMNS = (
+    ('timestamp', 'q', np.int64),
+    ('contract', 'i', np.int32),
+    ('price', 'd', np.float64),
+    ('size', 'i', np.int32),
+    ('side', 'b', np.int8),
+)
+_FRAME_HEADER = struct.Struct('<qI')
+
+
+## Functions
+def _nanoseconds(timestamp: str) -> int:
+    """ISO timestamp as integer POSIX nanoseconds, exact to the microsecond"""
+    return round(timestamp_to_seconds(timestamp) * 1e6) * 1000
+
+
+## Classes
+class SIDE(IntEnum):
+    """Recorded row side Enum"""
+    TRADE = 0
+    BID = 1
+    ASK = 2
+    DOM_BID = 3
+    DOM_ASK = 4
+
+
+_QUOTE_SIDES = (('Trade', SIDE.TRADE), ('Bid', SIDE.BID), ('Offer', SIDE.ASK))
+
+
+class TickRecorder:
+    """Append-only fixed-width columnar recorder for market data, written off the event loop"""
+
+    # -Constructor
+    def __init__(
+        self, directory: str | Path, flush_rows: int = FLUSH_ROWS,
+        flush_bytes: int = FLUSH_BYTES
+    ) -> TickRecorder:
+        self.directory: Path = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.flush_rows: int = flush_rows
+        self.flush_bytes: int = flush_bytes
+        self.rows: int = 0
+        self.frames: int = 0
+        self._ladders: dict[tuple[int, SIDE], dict[float, float]] = {}
+        self._buffers: tuple[array, ...] = self._new_buffers()
+        self._frame_buffer: bytearray = bytearray()
+        self._files = tuple(
+            open(self.directory / f"{name}.bin", 'ab') for name, _, _ in COLUMNS
+        )
+        self._frames = open(self.directory / FRAMES, 'ab')
+        # -A single writer keeps batches in order on disk
+        self._writer: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tick-recorder"
+        )
+
+    # -Dunder Methods
+    def __enter__(self) -> TickRecorder:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"TickRecorder(directory={self.directory}, rows={self.rows}, "
+            f"frames={self.frames})"
+        )
+
+    # -Instance Methods: Private
+    def _append(
+        self, timestamp: int, contract_id: int, price: float, size: float, side: int
+    ) -> None:
+        '''Buffer one row'''
+        timestamps, contracts, prices, sizes, sides = self._buffers
+        timestamps.append(timestamp)
+        contracts.append(contract_id)
+        prices.append(price)
+        sizes.append(int(size))
+        sides.append(side)
+        self.rows += 1
+
+    def _append_ladder(
+        self, timestamp: int, contract_id: int, levels: list[PriceLevel], side: SIDE
+    ) -> None:
+        '''Buffer levels changed since the contract's last ladder, size 0 if removed'''
+        last = self._ladders.get((contract_id, side), {})
+        ladder = {level.price: level.size for level in levels}
+        for price, size in ladder.items():
+            if last.get(price) != size:
+                self._append(timestamp, contract_id, price, size, side)
+        for price in last.keys() - ladder.keys():
+            self._append(timestamp, contract_id, price, 0, side)
+        self._ladders[(contract_id, side)] = ladder
+
+    @staticmethod
+    def _new_buffers() -> tuple[array, ...]:
+        '''Empty column buffers'''
+        return tuple(array(code) for _, code, _ in COLUMNS)
+
+    def _write(self, buffers: tuple[array, ...], frames: bytearray) -> None:
+        '''Write a batch of rows and frames to disk on the writer thread'''
+        try:
+            for buffer, file in zip(buffers, self._files):
+                buffer.tofile(file)
+                file.flush()
+            self._frames.write(frames)
+            self._frames.flush()
+        except OSError:
+            log.exception(f"TickRecorder unable to write to '{self.directory}'")
+
+    # -Instance Methods: Public
+    def close(self) -> None:
+        '''Flush, wait for pending writes and close every file'''
+        if self._frames.closed:
+            return None
+        self.flush()
+        self._writer.shutdown(wait=True)
+        for file in self._files:
+            file.close()
+        self._frames.close()
+
+    def flush(self) -> Future:
+        '''Hand buffered rows and frames to the writer; returns the write Future'''
+        buffers, frames = self._buffers, self._frame_buffer
+        self._buffers, self._frame_buffer = self._new_buffers(), bytearray()
+        return self._writer.submit(self._write, buffers, frames)
+
+    def record_dom(self, dom: DOMStruct) -> None:
+        '''Record the levels a md/subscribeDOM payload changed'''
+        timestamp = _nanoseconds(dom.timestamp)
+        self._append_ladder(timestamp, dom.contractId, dom.bids, SIDE.DOM_BID)
+        self._append_ladder(timestamp, dom.contractId, dom.offers, SIDE.DOM_ASK)
+        if len(self._buffers[0]) >= self.flush_rows:
+            self.flush()
+
+    def record_frame(self, data: str) -> None:
+        '''Buffer raw WebSocket frame with its receive time'''
+        raw = data.encode()
+        self._frame_buffer += _FRAME_HEADER.pack(time_ns(), len(raw))
+        self._frame_buffer += raw
+        self.frames += 1
+        if len(self._frame_buffer) >= self.flush_bytes:
+            self.flush()
+
+    def record_quote(self, quote: QuoteStruct) -> None:
+        '''Record trade, bid and offer entries of a md/subscribeQuote payload'''
+        timestamp = _nanoseconds(quote.timestamp)
+        entries = quote.entries
+        for name, side in _QUOTE_SIDES:
+            entry = entries.get(name)
+            if entry is not None:
+                self._append(timestamp, quote.contractId, entry.price, entry.size, side)
+        if len(self._buffers[0]) >= self.flush_rows:
+            self.flush()
+
+
+class TickReader:
+    """Zero-copy memory-mapped reader for TickRecorder files"""
+
+    # -Constructor
+    def __init__(self, directory: str | Path) -> TickReader:
+        self.directory: Path = Path(directory)
+        self._maps: dict[str, mmap.mmap] = {}
+        self._columns: dict[str, np.ndarray] = {}
+        for name, _, dtype in COLUMNS:
+            self._columns[name] = self._map(f"{name}.bin", dtype)
+        rows = min(len(column) for column in self._columns.values())
+        for name in self._columns:
+            self._columns[name] = self._columns[name][:rows]
+
+    # -Dunder Methods
+    def __enter__(self) -> TickReader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._columns[name]
+
+    def __len__(self) -> int:
+        return len(self._columns['timestamp'])
+
+    def __repr__(self) -> str:
+        return f"TickReader(directory={self.directory}, rows={len(self)})"
+
+    # -Instance Methods: Private
+    def _map(self, filename: str, dtype: np.dtype) -> np.ndarray:
+        '''Memory-map a column file as a read-only NumPy array'''
+        path = self.directory / filename
+        if not path.exists() or os.path.getsize(path) == 0:
+            return np.empty(0, dtype=dtype)
+        with open(path, 'rb') as file:
+            self._maps[filename] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        size = np.dtype(dtype).itemsize
+        count = len(self._maps[filename]) // size
+        return np.frombuffer(self._maps[filename], dtype=dtype, count=count)
+
+    # -Instance Methods: Public
+    def close(self) -> None:
+        '''Release column arrays and their memory maps'''
+        self._columns.clear()
+        for map_ in self._maps.values():
+            try:
+                map_.close()
+            except BufferError:
+                log.warning("TickReader map still referenced by a column view")
+        self._maps.clear()
+
+    def contract(self, contract_id: int) -> dict[str, np.ndarray]:
+        '''Rows for a single contract'''
+        mask = self._columns['contract'] == contract_id
+        return {name: column[mask] for name, column in self._columns.items()}
+
+    def frames(self) -> Iterator[tuple[int, str]]:
+        '''Yield (receive time ns, raw frame) records'''
+        path = self.directory / FRAMES
+        if not path.exists() or os.path.getsize(path) == 0:
+            return None
+        with open(path, 'rb') as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as map_:
+            offset, end = 0, len(map_)
+            while offset + _FRAME_HEADER.size <= end:
+                received, length = _FRAME_HEADER.unpack_from(map_, offset)
+                offset += _FRAME_HEADER.size
+                yield received, map_[offset:offset + length].decode()
+                offset += length
@@ -0,0 +1,153 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Market Subscription Manager   ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+import logging
+from enum import Enum
+from typing import TYPE_CHECKING, Iterable
+
+from utils import urls
+if TYPE_CHECKING:
+    from profile.session import WebSocket
+
+## Constants
+log = logging.getLogger(__name__)
+Key = tuple[int | str, 'FEED']
+
+
+## Classes
+class FEED(Enum):
+    """Market data feed Enum"""
+    QUOTE = 'quote'
+    DOM = 'dom'
+    HISTOGRAM = 'histogram'
+
+
+_URLS = {
+    FEED.QUOTE: (urls.wss_market_sub, urls.wss_market_usub),
+    FEED.DOM: (urls.wss_market_dom_sub, urls.wss_market_dom_usub),
+    FEED.HISTOGRAM: (urls.wss_market_histogram_sub, urls.wss_market_histogram_usub),
+}
+
+
+class SubscriptionManager:
+    """Reference counted market data subscriptions per symbol and feed"""
+
+    # -Constructor
+    def __init__(self, websocket: WebSocket | None = None) -> SubscriptionManager:
+        self.websocket: WebSocket | None = websocket
+        self._counts: dict[Key, int] = {}
+        self._pending: dict[Key, asyncio.Task] = {}
+
+    # -Dunder Methods
+    def __contains__(self, key: Key) -> bool:
+        return key in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __repr__(self) -> str:
+        return f"SubscriptionManager(subscriptions={len(self._counts)})"
+
+    # -Instance Methods: Private
+    def _release(self, key: Key) -> bool:
+        '''Drop one reference to key; returns True if it was the last'''
+        count = self._counts.get(key, 0)
+        if count > 1:
+            self._counts[key] = count - 1
+            return False
+        self._counts.pop(key, None)
+        pending = self._pending.get(key)
+        if pending is not None and pending.done():
+            del self._pending[key]
+        return bool(count)
+
+    def _request(self, key: Key, subscribe: bool) -> asyncio.Task:
+        '''Queue a (un)subscribe request for key behind any in flight for it'''
+        previous = self._pending.get(key)
+        task = asyncio.get_running_loop().create_task(
+            self._send(key, subscribe, previous)
+        )
+        self._pending[key] = task
+
+        def done(task: asyncio.Task) -> None:
+            if self._pending.get(key) is not task:
+                return None
+            # -A failed subscribe stays pending until every reference is released
+            failed = subscribe and not task.cancelled() and task.result() is not True
+            if failed and key in self._counts:
+                return None
+            del self._pending[key]
+        task.add_done_callback(done)
+        return task
+
+    async def _send(
+        self, key: Key, subscribe: bool, previous: asyncio.Task | None
+    ) -> bool:
+        '''Send (un)subscribe request, returning True once it succeeded'''
+        if previous is not None:
+            await asyncio.wait((previous,))
+        symbol, feed = key
+        url = _URLS[feed][0 if subscribe else 1]
+        try:
+            res = await self.websocket.request(url, body={"symbol": symbol})
+            ok = res['s'] == 200
+        except Exception as exc:
+            log.warning(f"Subscription '{url}' {symbol} failed: {exc!r}")
+            ok = False
+        return ok
+
+    # -Instance Methods: Public
+    def count(self, symbol: int | str, feed: FEED) -> int:
+        '''Number of consumers of symbol feed'''
+        return self._counts.get((symbol, feed), 0)
+
+    async def subscribe(
+        self, symbols: Iterable[int | str], feeds: Iterable[FEED] = tuple(FEED)
+    ) -> bool:
+        '''Add a reference to every symbol feed, requesting new ones concurrently'''
+        feeds = tuple(feeds)
+        keys, tasks = [], []
+        for symbol in symbols:
+            for feed in feeds:
+                key = (symbol, feed)
+                count = self._counts.get(key, 0)
+                self._counts[key] = count + 1
+                if not count:
+                    tasks.append(self._request(key, True))
+                elif key in self._pending:
+                    tasks.append(self._pending[key])
+                else:
+                    continue
+                keys.append(key)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # -Only this caller's reference is dropped, others release their own
+        for key, result in zip(keys, results):
+            if result is not True:
+                self._release(key)
+        return all(result is True for result in results)
+
+    async def unsubscribe(
+        self, symbols: Iterable[int | str], feeds: Iterable[FEED] = tuple(FEED)
+    ) -> bool:
+        '''Drop a reference to every symbol feed, releasing unused ones concurrently'''
+        feeds = tuple(feeds)
+        tasks = []
+        for symbol in symbols:
+            for feed in feeds:
+                key = (symbol, feed)
+                if self._release(key):
+                    tasks.append(self._request(key, False))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return all(result is True for result in results)
+
+    # -Properties
+    @property
+    def subscriptions(self) -> dict[Key, int]:
+        return dict(self._counts)
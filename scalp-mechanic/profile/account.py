@@ -8,13 +8,18 @@
 ## Imports
 from __future__ import annotations
 import logging
+from time import perf_counter_ns
 from typing import TYPE_CHECKING
 
-from .session import Session
+from .orders import ACTIONS, ORDER_TYPES, OrderTemplate, price_fields
+from .session import Session, WebSocket
 from utils import urls
-from utils.typing import AccountDict
+from utils.errors import OrderException, RiskException
+from utils.stats import Histogram
+from utils.typing import AccountDict, OrderResultDict
 if TYPE_CHECKING:
     from . import Profile
+    from .risk import RiskGate
 
 ## Constants
 log = logging.getLogger(__name__)
@@ -29,6 +34,7 @@ class Account:
         self, id_: int, profile_id: int, name: str,
         session: Session, endpoint: urls.ENDPOINT, *,
         nickname: str | None = None,  # loop: asyncio.AbstractEventLoop | None = None,
+        websocket: WebSocket | None = None,
     ) -> Account:
         self.id: int = id_
         self.profile_id: int = profile_id
@@ -37,6 +43,10 @@ class Account:
         self.endpoint: urls.ENDPOINT = endpoint
         #self._loop: asyncio.AbstractEventLoop = loop if loop else self._session.loop
         self._session: Session = session
+        self.websocket: WebSocket | None = websocket
+        self.latency: Histogram = Histogram()
+        self._templates: dict[tuple[str, str, str, str], OrderTemplate] = {}
+        self.risk: RiskGate | None = None
 
     # -Dunder Methods
     def __repr__(self) -> str:
@@ -44,6 +54,109 @@ class Account:
         str_ += f", nickname={self.nickname})" if self.nickname else ")"
         return str_
 
+    # -Instance Methods: Private
+    def _check(
+        self, symbol: str, action: str, qty: int, price: float | None = None
+    ) -> None:
+        '''Raise if the pre-trade risk gate rejects the order'''
+        if self.risk is None:
+            return None
+        reason = self.risk.check(symbol, action, qty, price)
+        if reason is not None:
+            raise RiskException(self.id, reason.value)
+
+    async def _send(self, url: str, body: str) -> OrderResultDict:
+        '''Send pre-serialized order request and record its send-to-ack latency'''
+        if self.websocket is None:
+            raise OrderException(url, 0, "no account WebSocket")
+        start = perf_counter_ns()
+        res = await self.websocket.request_encoded(url, body)
+        elapsed = perf_counter_ns() - start
+        self.latency.record(elapsed)
+        log.debug(f"Account[{self.id}] '{url}' acknowledged in {elapsed / 1e3:.0f}us")
+        if res['s'] != 200:
+            raise OrderException(url, res['s'], res.get('d'))
+        return res.get('d', {})
+
+    # -Instance Methods: Public
+    async def cancel_order(self, order_id: int) -> OrderResultDict:
+        '''Cancel working order'''
+        return await self._send(
+            urls.wss_order_cancel, f'{{"orderId":{int(order_id)},"isAutomated":true}}'
+        )
+
+    async def modify_order(
+        self, order_id: int, qty: int, order_type: str = "Limit", *,
+        price: float | None = None, stop_price: float | None = None
+    ) -> OrderResultDict:
+        '''Change working order quantity, type and prices'''
+        if order_type not in ORDER_TYPES:
+            raise ValueError(f"Unknown order type '{order_type}'")
+        if self.risk is not None:
+            reason = self.risk.check_modify(
+                order_id, qty, price if price is not None else stop_price
+            )
+            if reason is not None:
+                raise RiskException(self.id, reason.value)
+        return await self._send(urls.wss_order_modify, (
+            f'{{"orderId":{int(order_id)},"orderQty":{int(qty)},'
+            f'"orderType":"{order_type}"{price_fields(order_type, price, stop_price)},'
+            f'"isAutomated":true}}'
+        ))
+
+    async def place_oco(
+        self, symbol: str, action: str, qty: int, price: float, stop_price: float, *,
+        time_in_force: str = "Day"
+    ) -> OrderResultDict:
+        '''Place limit order one-cancels-other with a same side stop order'''
+        template = self.template(symbol, action, "Limit", time_in_force)
+        self._check(symbol, action, qty, price)
+        return await self._send(urls.wss_order_oco, template.oco(qty, price, stop_price))
+
+    async def place_order(
+        self, symbol: str, action: str, qty: int, order_type: str = "Market", *,
+        price: float | None = None, stop_price: float | None = None,
+        time_in_force: str = "Day"
+    ) -> OrderResultDict:
+        '''Place order'''
+        template = self.template(symbol, action, order_type, time_in_force)
+        self._check(symbol, action, qty, price if price is not None else stop_price)
+        return await self._send(
+            urls.wss_order_place, template.order(qty, price, stop_price)
+        )
+
+    async def place_oso(
+        self, symbol: str, action: str, qty: int, order_type: str = "Market", *,
+        price: float | None = None, stop_price: float | None = None,
+        take_profit: float | None = None, stop_loss: float | None = None,
+        time_in_force: str = "Day"
+    ) -> OrderResultDict:
+        '''Place order that sends take profit and/or stop loss brackets once filled'''
+        template = self.template(symbol, action, order_type, time_in_force)
+        self._check(symbol, action, qty, price if price is not None else stop_price)
+        return await self._send(urls.wss_order_oso, template.oso(
+            qty, price, stop_price, take_profit=take_profit, stop_loss=stop_loss
+        ))
+
+    def prepare(self, symbol: str, *, time_in_force: str = "Day") -> None:
+        '''Build every order template for symbol ahead of trading'''
+        for action in ACTIONS:
+            for order_type in ORDER_TYPES:
+                self.template(symbol, action, order_type, time_in_force)
+
+    def template(
+        self, symbol: str, action: str, order_type: str = "Market",
+        time_in_force: str = "Day"
+    ) -> OrderTemplate:
+        '''Get or build pre-serialized order template'''
+        key = (symbol, action, order_type, time_in_force)
+        template = self._templates.get(key)
+        if template is None:
+            template = self._templates[key] = OrderTemplate(
+                self.id, self.name, symbol, action, order_type, time_in_force
+            )
+        return template
+
     # Class Methods
     @classmethod
     async def from_profile(
@@ -55,4 +168,5 @@ class Account:
             account['id'], account['userId'], account['name'],
             profile.session, endpoint,
             nickname=account['nickname'] if 'nickname' in account else None,
+            websocket=profile.websocket(endpoint),
         )
@@ -0,0 +1,157 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Account Directory   ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+import logging
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from .account import Account
+from utils import urls
+from utils.typing import AccountDict
+if TYPE_CHECKING:
+    from . import Profile
+    from .entities import EntityStore
+
+## Constants
+log = logging.getLogger(__name__)
+ACCOUNT_TTL = 300.0
+_ENDPOINTS = (urls.ENDPOINT.LIVE, urls.ENDPOINT.DEMO)
+
+
+## Classes
+class AccountDirectory:
+    """Live+demo accounts fetched concurrently once and indexed by id, name and nickname"""
+
+    # -Constructor
+    def __init__(self, profile: Profile, ttl: float = ACCOUNT_TTL) -> AccountDirectory:
+        self.ttl: float = ttl
+        self._profile: Profile = profile
+        self._fetched: float | None = None
+        self._refresh: asyncio.Task | None = None
+        self._ids: dict[int, Account] = {}
+        self._names: dict[str, Account] = {}
+        self._nicknames: dict[str, Account] = {}
+
+    # -Dunder Methods
+    def __contains__(self, id_: int) -> bool:
+        return id_ in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"AccountDirectory(accounts={len(self._ids)}, stale={self.stale})"
+
+    # -Instance Methods: Private
+    async def _fetch(self) -> None:
+        '''Fetch account lists of both endpoints concurrently, stale until one succeeds'''
+        results = await asyncio.gather(*(
+            self._profile.rest(endpoint).list('account') for endpoint in _ENDPOINTS
+        ), return_exceptions=True)
+        fetched = False
+        for endpoint, result in zip(_ENDPOINTS, results):
+            if isinstance(result, BaseException):
+                log.error(f"AccountDirectory {endpoint.name} accounts failed: {result!r}")
+                continue
+            fetched = True
+            ids = set()
+            for account in result or ():
+                self._put(account, endpoint)
+                ids.add(account['id'])
+            for account in self.accounts:
+                if account.endpoint == endpoint and account.id not in ids:
+                    self._remove(account.id)
+        if fetched:
+            self._fetched = monotonic()
+
+    def _put(self, account: AccountDict, endpoint: urls.ENDPOINT) -> Account:
+        '''Add account or update it in place, keeping its templates and risk gate'''
+        current = self._ids.get(account['id'])
+        if current is None:
+            current = Account(
+                account['id'], account['userId'], account['name'],
+                self._profile.session, endpoint,
+                nickname=account.get('nickname'),
+            )
+            self._ids[current.id] = current
+        else:
+            self._unindex(current)
+            current.name = account['name']
+            current.nickname = account.get('nickname')
+        if current.websocket is None:
+            current.websocket = self._profile.websocket(endpoint)
+        self._names[current.name] = current
+        if current.nickname:
+            self._nicknames[current.nickname] = current
+        return current
+
+    def _remove(self, id_: int) -> Account | None:
+        '''Drop account from every index'''
+        account = self._ids.pop(id_, None)
+        if account is not None:
+            self._unindex(account)
+        return account
+
+    def _unindex(self, account: Account) -> None:
+        '''Drop account name and nickname entries'''
+        if self._names.get(account.name) is account:
+            del self._names[account.name]
+        if account.nickname and self._nicknames.get(account.nickname) is account:
+            del self._nicknames[account.nickname]
+
+    # -Instance Methods: Public
+    def attach(self, store: EntityStore, endpoint: urls.ENDPOINT) -> None:
+        '''Apply account deltas from the entity store of endpoint'''
+
+        def on_account(entity_type: str, event_type: str, account: AccountDict) -> None:
+            if event_type == "Deleted":
+                self._remove(account['id'])
+            else:
+                self._put(account, endpoint)
+        store.subscribe(on_account, 'account')
+        for account in store.all('account'):
+            on_account('account', "Created", account)
+
+    async def ensure(self) -> None:
+        '''Refresh accounts if never fetched or older than the TTL'''
+        if self.stale:
+            await self.refresh()
+
+    def get(
+        self, *, id_: int | None = None,
+        name: str | None = None, nickname: str | None = None
+    ) -> Account | None:
+        '''Cached account by id, name, or nickname'''
+        if id_ is not None:
+            return self._ids.get(id_)
+        if name is not None and name in self._names:
+            return self._names[name]
+        if nickname is not None:
+            return self._nicknames.get(nickname)
+        return None
+
+    def invalidate(self) -> None:
+        '''Force the next lookup to refresh'''
+        self._fetched = None
+
+    async def refresh(self) -> None:
+        '''Fetch accounts, sharing one request between concurrent callers'''
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.ensure_future(self._fetch())
+        await asyncio.shield(self._refresh)
+
+    # -Properties
+    @property
+    def accounts(self) -> tuple[Account, ...]:
+        return tuple(self._ids.values())
+
+    @property
+    def stale(self) -> bool:
+        return self._fetched is None or monotonic() - self._fetched > self.ttl
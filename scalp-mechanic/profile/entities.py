@@ -0,0 +1,218 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Entity Store        ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import logging
+from typing import Any, Callable
+
+from utils.typing import PropsDict
+
+## Constants
+log = logging.getLogger(__name__)
+INDEXES = (
+    ('order', 'accountId'), ('order', 'contractId'),
+    ('position', 'accountId'), ('position', 'contractId'),
+    ('fill', 'orderId'), ('orderVersion', 'orderId'),
+)
+WORKING = frozenset((
+    "Working", "PendingNew", "PendingReplace", "PendingCancel", "Suspended"
+))
+Callback = Callable[[str, str, dict], None]
+
+
+## Functions
+def singular(name: str) -> str:
+    """Entity type of a user/syncrequest snapshot key, e.g. 'orderStrategies'"""
+    if name.endswith('ies'):
+        return name[:-3] + 'y'
+    if name.endswith('ses'):
+        return name[:-2]
+    if name.endswith('s'):
+        return name[:-1]
+    return name
+
+
+## Classes
+class EntityStore:
+    """In-memory Tradovate entities kept from user/syncrequest and props events"""
+
+    # -Constructor
+    def __init__(self) -> EntityStore:
+        self._entities: dict[str, dict[int, dict]] = {}
+        self._indexes: dict[str, dict[str, dict[Any, dict[int, dict]]]] = {}
+        self._subscribers: dict[str | None, tuple[Callback, ...]] = {}
+        for entity_type, field in INDEXES:
+            self.add_index(entity_type, field)
+
+    # -Dunder Methods
+    def __contains__(self, key: tuple[str, int]) -> bool:
+        return key[1] in self._entities.get(key[0], ())
+
+    def __repr__(self) -> str:
+        counts = ', '.join(
+            f"{entity_type}={len(entities)}"
+            for entity_type, entities in self._entities.items()
+        )
+        return f"EntityStore({counts})"
+
+    # -Instance Methods: Private
+    def _delete(self, entity_type: str, id_: int) -> dict | None:
+        '''Remove entity from its table and indexes'''
+        entity = self._entities.get(entity_type, {}).pop(id_, None)
+        if entity is None:
+            return None
+        for field, index in self._indexes.get(entity_type, {}).items():
+            bucket = index.get(entity.get(field))
+            if bucket is not None:
+                bucket.pop(id_, None)
+                if not bucket:
+                    del index[entity.get(field)]
+        return entity
+
+    def _notify(self, entity_type: str, event_type: str, entity: dict) -> None:
+        '''Call back entity type and catch-all subscribers'''
+        callbacks = self._subscribers.get(entity_type, ()) + self._subscribers.get(None, ())
+        for callback in callbacks:
+            try:
+                callback(entity_type, event_type, entity)
+            except Exception:
+                log.exception(f"Entity subscriber '{callback.__qualname__}' failed")
+
+    def _put(self, entity_type: str, entity: dict) -> dict | None:
+        '''Insert or replace entity, moving it between index buckets; returns previous'''
+        id_ = entity['id']
+        table = self._entities.setdefault(entity_type, {})
+        previous = table.get(id_)
+        table[id_] = entity
+        for field, index in self._indexes.get(entity_type, {}).items():
+            value = entity.get(field)
+            if previous is not None:
+                old = previous.get(field)
+                if old != value and old in index:
+                    index[old].pop(id_, None)
+                    if not index[old]:
+                        del index[old]
+            index.setdefault(value, {})[id_] = entity
+        return previous
+
+    # -Instance Methods: Public
+    def add_index(self, entity_type: str, field: str) -> None:
+        '''Index entity type by field, including entities already stored'''
+        indexes = self._indexes.setdefault(entity_type, {})
+        if field in indexes:
+            return None
+        index = indexes[field] = {}
+        for id_, entity in self._entities.get(entity_type, {}).items():
+            index.setdefault(entity.get(field), {})[id_] = entity
+
+    def all(self, entity_type: str) -> tuple[dict, ...]:
+        '''Every stored entity of type'''
+        return tuple(self._entities.get(entity_type, {}).values())
+
+    def apply(self, props: PropsDict) -> None:
+        '''Apply a props event Created/Updated/Deleted delta'''
+        entity_type, event_type = props['entityType'], props['eventType']
+        entity = props['entity']
+        if event_type == "Deleted":
+            entity = self._delete(entity_type, entity['id']) or entity
+        else:
+            self._put(entity_type, entity)
+        self._notify(entity_type, event_type, entity)
+
+    def by(self, entity_type: str, field: str, value: Any) -> tuple[dict, ...]:
+        '''Entities of type whose indexed field equals value'''
+        return tuple(self._indexes[entity_type][field].get(value, {}).values())
+
+    def clear(self) -> None:
+        '''Drop every entity, keeping indexes and subscribers'''
+        self._entities.clear()
+        for indexes in self._indexes.values():
+            for index in indexes.values():
+                index.clear()
+
+    def get(self, entity_type: str, id_: int) -> dict | None:
+        '''Entity of type by id'''
+        return self._entities.get(entity_type, {}).get(id_)
+
+    def load(self, snapshot: dict[str, list[dict]]) -> None:
+        '''Reconcile with a user/syncrequest snapshot, notifying every difference'''
+        for key, entities in snapshot.items():
+            if not isinstance(entities, list):
+                continue
+            entity_type = singular(key)
+            stale = set(self._entities.get(entity_type, ()))
+            for entity in entities:
+                stale.discard(entity['id'])
+                previous = self._put(entity_type, entity)
+                if previous is None:
+                    self._notify(entity_type, "Created", entity)
+                elif previous != entity:
+                    self._notify(entity_type, "Updated", entity)
+            for id_ in stale:
+                self._notify(entity_type, "Deleted", self._delete(entity_type, id_))
+
+    def net_position(self, contract_id: int, account_id: int | None = None) -> int:
+        '''Net position in contract, across accounts unless account_id is given'''
+        return sum(
+            position.get('netPos', 0)
+            for position in self.by('position', 'contractId', contract_id)
+            if account_id is None or position.get('accountId') == account_id
+        )
+
+    def remaining_qty(self, order_id: int) -> int:
+        '''Quantity of order's latest version not yet filled'''
+        versions = self.by('orderVersion', 'orderId', order_id)
+        if not versions:
+            return 0
+        qty = max(versions, key=lambda version: version['id']).get('orderQty', 0)
+        filled = sum(
+            fill.get('qty', 0) for fill in self.by('fill', 'orderId', order_id)
+            if fill.get('active', True)
+        )
+        return max(qty - filled, 0)
+
+    def subscribe(self, callback: Callback, entity_type: str | None = None) -> None:
+        '''Call back (entity type, event type, entity) on changes of entity type or any'''
+        callbacks = self._subscribers.get(entity_type, ())
+        self._subscribers[entity_type] = callbacks + (callback,)
+
+    def unsubscribe(self, callback: Callback, entity_type: str | None = None) -> None:
+        '''Stop calling back on changes'''
+        self._subscribers[entity_type] = tuple(
+            c for c in self._subscribers.get(entity_type, ()) if c != callback
+        )
+
+    def working_qty(
+        self, account_id: int, contract_id: int, exclude: int | None = None
+    ) -> tuple[int, int]:
+        '''Unfilled (buy, sell) quantity of working orders, without order exclude'''
+        buy = sell = 0
+        for order in self.working_orders(account_id, contract_id):
+            if order['id'] == exclude:
+                continue
+            if order.get('action') == "Buy":
+                buy += self.remaining_qty(order['id'])
+            else:
+                sell += self.remaining_qty(order['id'])
+        return buy, sell
+
+    def working_orders(
+        self, account_id: int | None = None, contract_id: int | None = None
+    ) -> tuple[dict, ...]:
+        '''Orders still working, by account and/or contract'''
+        if account_id is not None:
+            orders = self.by('order', 'accountId', account_id)
+        elif contract_id is not None:
+            orders = self.by('order', 'contractId', contract_id)
+        else:
+            orders = self.all('order')
+        return tuple(
+            order for order in orders
+            if order.get('ordStatus') in WORKING
+            and (contract_id is None or order.get('contractId') == contract_id)
+        )
@@ -0,0 +1,94 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Order Templates     ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from utils import codec
+
+## Constants
+ACTIONS = ("Buy", "Sell")
+ORDER_TYPES = ("Market", "Limit", "Stop", "StopLimit")
+_OPPOSITE = {"Buy": "Sell", "Sell": "Buy"}
+
+
+## Functions
+def price_fields(order_type: str, price: float | None, stop_price: float | None) -> str:
+    """Serialized price/stopPrice fields for order type"""
+    if order_type == "Limit":
+        return f',"price":{float(price)!r}'
+    if order_type == "Stop":
+        return f',"stopPrice":{float(stop_price)!r}'
+    if order_type == "StopLimit":
+        return f',"price":{float(price)!r},"stopPrice":{float(stop_price)!r}'
+    return ""
+
+
+## Classes
+class OrderTemplate:
+    """Pre-serialized order request body for one account, contract, action and type"""
+    __slots__ = ('symbol', 'action', 'order_type', '_head', '_exit')
+
+    # -Constructor
+    def __init__(
+        self, account_id: int, account_spec: str, symbol: str, action: str,
+        order_type: str, time_in_force: str = "Day"
+    ) -> OrderTemplate:
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown order action '{action}'")
+        if order_type not in ORDER_TYPES:
+            raise ValueError(f"Unknown order type '{order_type}'")
+        self.symbol: str = symbol
+        self.action: str = action
+        self.order_type: str = order_type
+        head = codec.dumps({
+            'accountSpec': account_spec, 'accountId': account_id,
+            'action': action, 'symbol': symbol, 'orderType': order_type,
+            'timeInForce': time_in_force, 'isAutomated': True,
+        })
+        self._head: str = head[:-1] + ',"orderQty":'
+        self._exit: str = f'{{"action":"{_OPPOSITE[action]}","orderType":'
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"OrderTemplate(symbol={self.symbol}, action={self.action}, "
+            f"order_type={self.order_type})"
+        )
+
+    # -Instance Methods
+    def oco(self, qty: int, price: float, stop_price: float) -> str:
+        '''order/placeOCO body: this limit order, cancelled by a same side stop'''
+        return (
+            f'{self._head}{int(qty)},"price":{float(price)!r},"other":'
+            f'{{"action":"{self.action}","orderType":"Stop",'
+            f'"stopPrice":{float(stop_price)!r}}}}}'
+        )
+
+    def order(
+        self, qty: int, price: float | None = None, stop_price: float | None = None
+    ) -> str:
+        '''order/placeOrder body'''
+        return (
+            f'{self._head}{int(qty)}'
+            f'{price_fields(self.order_type, price, stop_price)}}}'
+        )
+
+    def oso(
+        self, qty: int, price: float | None = None, stop_price: float | None = None, *,
+        take_profit: float | None = None, stop_loss: float | None = None
+    ) -> str:
+        '''order/placeOSO body: this order with limit and/or stop exit brackets'''
+        body = f'{self._head}{int(qty)}{price_fields(self.order_type, price, stop_price)}'
+        brackets = []
+        if take_profit is not None:
+            brackets.append(f'{self._exit}"Limit","price":{float(take_profit)!r}}}')
+        if stop_loss is not None:
+            brackets.append(f'{self._exit}"Stop","stopPrice":{float(stop_loss)!r}}}')
+        for i, bracket in enumerate(brackets, 1):
+            body += f',"bracket{i}":{bracket}'
+        return body + '}'
@@ -0,0 +1,273 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate P&L Engine          ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import logging
+from datetime import date
+from time import time
+from typing import TYPE_CHECKING
+
+from market.products import Product, product_of
+from utils import timestamp_to_seconds, trading_day, urls
+from utils.typing import FillDict
+if TYPE_CHECKING:
+    from market import Quote
+    from .entities import EntityStore
+
+## Constants
+log = logging.getLogger(__name__)
+DAILY_TARGET = 200.0
+_SIDES = {"Buy": 1, "Sell": -1}
+
+
+## Classes
+class PositionPnL:
+    """Average price position and P&L of one contract in one account"""
+    __slots__ = (
+        'account', 'contract_id', 'product', 'net', 'avg_price', 'mark',
+        'realized', 'unrealized', 'commission', 'carried'
+    )
+
+    # -Constructor
+    def __init__(
+        self, account: AccountPnL, contract_id: int, product: Product
+    ) -> PositionPnL:
+        self.account: AccountPnL = account
+        self.contract_id: int = contract_id
+        self.product: Product = product
+        self.net: int = 0
+        self.avg_price: float = 0.0
+        self.mark: float | None = None
+        self.realized: float = 0.0
+        self.unrealized: float = 0.0
+        self.commission: float = 0.0
+        # -Held from an earlier trading day and not yet marked at a live price
+        self.carried: bool = False
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"PositionPnL(contract_id={self.contract_id}, net={self.net}, "
+            f"avg_price={self.avg_price}, realized={self.realized:.2f}, "
+            f"unrealized={self.unrealized:.2f})"
+        )
+
+    # -Instance Methods
+    def fill(self, qty: int, price: float, day: date | None = None) -> None:
+        '''Apply signed fill quantity at price, counting daily totals if day is today'''
+        account = self.account
+        account.roll()
+        today = day is None or day == account.day
+        if not today:
+            self.carried = True
+        elif self.carried:
+            # -Today's first fill price rebases the carried position before it counts
+            self.update(price)
+            self.carried = False
+        net = self.net
+        if not net or (net > 0) == (qty > 0):
+            self.avg_price = (
+                (self.avg_price * abs(net) + price * abs(qty)) / (abs(net) + abs(qty))
+            )
+        else:
+            closed = min(abs(qty), abs(net))
+            side = 1 if net > 0 else -1
+            realized = closed * (price - self.avg_price) * side * self.product.point_value
+            self.realized += realized
+            account.realized += realized
+            if today:
+                account.day_realized += realized
+            if abs(qty) > abs(net):
+                self.avg_price = price
+        self.net = net + qty
+        if not self.net:
+            self.avg_price = 0.0
+        commission = abs(qty) * self.product.commission / 2
+        self.commission += commission
+        account.commission += commission
+        if today:
+            account.day_commission += commission
+        self.update(price if self.mark is None else self.mark)
+
+    def update(self, price: float) -> None:
+        '''Mark position to price, moving the day baseline along while carried'''
+        self.mark = price
+        unrealized = (price - self.avg_price) * self.net * self.product.point_value
+        change = unrealized - self.unrealized
+        self.account.unrealized += change
+        if self.carried:
+            self.account.day_unrealized += change
+        self.unrealized = unrealized
+
+
+class AccountPnL:
+    """Realized, unrealized and commission totals of one account, lifetime and per trading day"""
+    __slots__ = (
+        'endpoint', 'account_id', 'target', 'positions',
+        'realized', 'unrealized', 'commission',
+        'day', 'rollover', 'day_realized', 'day_commission', 'day_unrealized'
+    )
+
+    # -Constructor
+    def __init__(
+        self, endpoint: urls.ENDPOINT, account_id: int, target: float = DAILY_TARGET
+    ) -> AccountPnL:
+        self.endpoint: urls.ENDPOINT = endpoint
+        self.account_id: int = account_id
+        self.target: float = target
+        self.positions: dict[int, PositionPnL] = {}
+        self.realized: float = 0.0
+        self.unrealized: float = 0.0
+        self.commission: float = 0.0
+        self.day: date | None = None
+        self.rollover: float = 0.0
+        self.day_realized: float = 0.0
+        self.day_commission: float = 0.0
+        self.day_unrealized: float = 0.0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"AccountPnL(account_id={self.account_id}, endpoint={self.endpoint.name}, "
+            f"day={self.day}, daily_net={self.daily_net:.2f}, net={self.net:.2f}, "
+            f"unrealized={self.unrealized:.2f})"
+        )
+
+    # -Instance Methods
+    def roll(self, now: float | None = None) -> bool:
+        '''Reset daily totals once the trading day has rolled over'''
+        now = time() if now is None else now
+        if now < self.rollover:
+            return False
+        self.day, self.rollover = trading_day(now)
+        self.day_realized = 0.0
+        self.day_commission = 0.0
+        # -Open positions carry over, so the day counts only their change from here
+        self.day_unrealized = self.unrealized
+        return True
+
+    # -Properties
+    @property
+    def daily_net(self) -> float:
+        self.roll()
+        return (
+            self.day_realized + self.unrealized - self.day_unrealized - self.day_commission
+        )
+
+    @property
+    def net(self) -> float:
+        return self.realized + self.unrealized - self.commission
+
+    @property
+    def target_reached(self) -> bool:
+        self.roll()
+        return self.day_realized - self.day_commission >= self.target
+
+
+class PnLEngine:
+    """Incremental position and P&L engine fed by fills and quotes"""
+
+    # -Constructor
+    def __init__(self, target: float = DAILY_TARGET) -> PnLEngine:
+        self.target: float = target
+        self._accounts: dict[tuple[urls.ENDPOINT, int], AccountPnL] = {}
+        self._contracts: dict[int, Product] = {}
+        self._marks: dict[int, tuple[PositionPnL, ...]] = {}
+        self._fills: set[tuple[urls.ENDPOINT, int]] = set()
+        self._pending: dict[int, list[tuple[urls.ENDPOINT, int, FillDict]]] = {}
+        self._unmatched: dict[tuple[urls.ENDPOINT, int], list[FillDict]] = {}
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"PnLEngine(accounts={len(self._accounts)}, contracts={len(self._contracts)})"
+
+    # -Instance Methods: Private
+    def _position(self, account: AccountPnL, contract_id: int) -> PositionPnL:
+        '''Get or create account position in contract'''
+        position = account.positions.get(contract_id)
+        if position is None:
+            position = PositionPnL(account, contract_id, self._contracts[contract_id])
+            account.positions[contract_id] = position
+            self._marks[contract_id] = self._marks.get(contract_id, ()) + (position,)
+        return position
+
+    # -Instance Methods: Public
+    def account(self, endpoint: urls.ENDPOINT, account_id: int) -> AccountPnL:
+        '''Get or create P&L of account'''
+        key = (endpoint, account_id)
+        account = self._accounts.get(key)
+        if account is None:
+            account = self._accounts[key] = AccountPnL(endpoint, account_id, self.target)
+        return account
+
+    def add_contract(self, contract_id: int, symbol: str) -> Product | None:
+        '''Register contract product, applying fills received before it was known'''
+        product = product_of(symbol)
+        if product is None:
+            log.warning(f"PnLEngine unknown product for contract '{symbol}'")
+            return None
+        self._contracts[contract_id] = product
+        for endpoint, account_id, fill in self._pending.pop(contract_id, ()):
+            self.apply_fill(endpoint, account_id, fill)
+        return product
+
+    def apply_fill(
+        self, endpoint: urls.ENDPOINT, account_id: int, fill: FillDict
+    ) -> None:
+        '''Apply a fill entity to its account position once'''
+        key = (endpoint, fill['id'])
+        if key in self._fills or not fill.get('active', True):
+            return None
+        contract_id = fill['contractId']
+        if contract_id not in self._contracts:
+            self._pending.setdefault(contract_id, []).append((endpoint, account_id, fill))
+            return None
+        self._fills.add(key)
+        position = self._position(self.account(endpoint, account_id), contract_id)
+        day = None
+        if fill.get('timestamp'):
+            seconds = timestamp_to_seconds(fill['timestamp'].replace('Z', '+00:00'))
+            day = trading_day(seconds)[0]
+        position.fill(_SIDES[fill['action']] * fill['qty'], fill['price'], day)
+
+    def attach(self, store: EntityStore, endpoint: urls.ENDPOINT) -> None:
+        '''Apply fills created in the entity store of endpoint, holding those of unknown orders'''
+
+        def on_fill(entity_type: str, event_type: str, fill: FillDict) -> None:
+            if event_type == "Deleted":
+                return None
+            order = store.get('order', fill['orderId'])
+            if order is None:
+                log.debug(f"PnLEngine fill {fill['id']} held for order {fill['orderId']}")
+                self._unmatched.setdefault((endpoint, fill['orderId']), []).append(fill)
+                return None
+            self.apply_fill(endpoint, order['accountId'], fill)
+
+        def on_order(entity_type: str, event_type: str, order: dict) -> None:
+            if event_type == "Deleted":
+                return None
+            for fill in self._unmatched.pop((endpoint, order['id']), ()):
+                self.apply_fill(endpoint, order['accountId'], fill)
+        store.subscribe(on_order, 'order')
+        store.subscribe(on_fill, 'fill')
+        for fill in store.all('fill'):
+            on_fill('fill', "Created", fill)
+
+    def update_quote(self, quote: Quote, changed: dict[str, float]) -> None:
+        '''Mark positions in the quote contract to its last trade'''
+        positions = self._marks.get(quote.contract_id)
+        if positions is None or 'trade' not in changed:
+            return None
+        for position in positions:
+            position.update(changed['trade'])
+            position.carried = False
+
+    # -Properties
+    @property
+    def accounts(self) -> tuple[AccountPnL, ...]:
+        return tuple(self._accounts.values())
@@ -0,0 +1,123 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Token Renewal       ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+import logging
+from time import perf_counter_ns
+from typing import Any, Callable
+
+from .session import Session, WebSocket
+from utils.stats import Histogram
+
+## Constants
+log = logging.getLogger(__name__)
+RENEW_LEAD = 600.0
+RETRY_DELAY = 5.0
+RETRY_MAX_DELAY = 60.0
+
+
+## Classes
+class TokenRenewal:
+    """Background access token renewal that re-authorizes WebSockets in place"""
+
+    # -Constructor
+    def __init__(
+        self, session: Session,
+        websockets: Callable[[], tuple[tuple[WebSocket] | None, tuple[WebSocket] | None]],
+        *, lead: float = RENEW_LEAD
+    ) -> TokenRenewal:
+        self.lead: float = lead
+        self.renewals: int = 0
+        self.failures: int = 0
+        self.latency: Histogram = Histogram()
+        self._session: Session = session
+        self._websockets: Callable[
+            [], tuple[tuple[WebSocket] | None, tuple[WebSocket] | None]
+        ] = websockets
+        self._task: asyncio.Task | None = None
+        self._renewing: asyncio.Task | None = None
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"TokenRenewal(running={self.running}, renewals={self.renewals}, "
+            f"failures={self.failures})"
+        )
+
+    # -Instance Methods: Private
+    async def _renew(self) -> None:
+        '''Renew Session token, re-authorize WebSockets and record the latency'''
+        account, market = self._websockets()
+        start = perf_counter_ns()
+        await self._session.renew_access_token(
+            account_websockets=account, market_websockets=market
+        )
+        self.latency.record(perf_counter_ns() - start)
+        self.renewals += 1
+        log.debug(f"TokenRenewal renewed, expires in {self.expires_in:.0f}s")
+
+    async def _run(self) -> None:
+        '''Renewal loop, retrying failures with backoff until stopped or the token expires'''
+        delay = RETRY_DELAY
+        wait = max(0.0, self.expires_in - self.lead)
+        while True:
+            await asyncio.sleep(wait)
+            try:
+                await self.renew()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.failures += 1
+                if self._session.token_expired:
+                    log.critical(f"TokenRenewal token expired, renewal failed: {exc!r}")
+                    return None
+                log.error(f"TokenRenewal failed, retrying in {delay:g}s: {exc!r}")
+                wait = delay
+                delay = min(delay * 2, RETRY_MAX_DELAY)
+                continue
+            delay = RETRY_DELAY
+            wait = max(RETRY_DELAY, self.expires_in - self.lead)
+
+    # -Instance Methods: Public
+    async def renew(self) -> None:
+        '''Renew now, sharing a renewal already in progress'''
+        if self._renewing is None or self._renewing.done():
+            self._renewing = asyncio.ensure_future(self._renew())
+        await asyncio.shield(self._renewing)
+
+    def start(self) -> None:
+        '''Start background renewal'''
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    def stop(self) -> None:
+        '''Stop background renewal'''
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    # -Properties
+    @property
+    def expires_in(self) -> float:
+        if self._session.token_expiration is None:
+            return 0.0
+        return self._session.token_duration.total_seconds()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            'expires_in': self.expires_in,
+            'renewals': self.renewals,
+            'failures': self.failures,
+            'latency': self.latency.summary(),
+        }
@@ -0,0 +1,128 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate REST Entity Client  ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+import logging
+from typing import Any
+
+import aiohttp
+
+from .session import Session
+from utils import urls
+
+## Constants
+log = logging.getLogger(__name__)
+BATCH_WINDOW = 0.002
+BATCH_SIZE = 100
+
+
+## Classes
+class EntityClient:
+    """Tradovate REST entity lookups, batched into /items and deduped while in flight"""
+
+    # -Constructor
+    def __init__(
+        self, session: Session, endpoint: urls.ENDPOINT, *,
+        window: float = BATCH_WINDOW, batch_size: int = BATCH_SIZE
+    ) -> EntityClient:
+        self.endpoint: urls.ENDPOINT = endpoint
+        self.window: float = window
+        self.batch_size: int = batch_size
+        self.requests: int = 0
+        self.lookups: int = 0
+        self._session: Session = session
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._items: dict[tuple[str, int], asyncio.Future] = {}
+        self._batches: dict[str, list[int]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"EntityClient(endpoint={self.endpoint.name}, requests={self.requests}, "
+            f"lookups={self.lookups})"
+        )
+
+    # -Instance Methods: Private
+    def _flush(self, entity: str) -> None:
+        '''Send the pending batch of entity ids as one /items request'''
+        timer = self._timers.pop(entity, None)
+        if timer is not None:
+            timer.cancel()
+        ids = self._batches.pop(entity, None)
+        if ids:
+            task = asyncio.ensure_future(self._resolve(entity, ids))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _get(self, url: str) -> Any:
+        '''GET url, sharing the response with identical requests already in flight'''
+        future = self._inflight.get(url)
+        if future is None:
+            self.requests += 1
+            future = self._inflight[url] = asyncio.ensure_future(self._session.get(url))
+            future.add_done_callback(lambda _: self._inflight.pop(url, None))
+        return await asyncio.shield(future)
+
+    async def _resolve(self, entity: str, ids: list[int]) -> None:
+        '''Fetch a batch of entity ids and resolve every waiting lookup'''
+        try:
+            results = await self._get(urls.get_items(self.endpoint, entity, ids))
+        except Exception as exc:
+            log.error(f"EntityClient {entity} items {ids} failed: {exc!r}")
+            for id_ in ids:
+                future = self._items.pop((entity, id_), None)
+                if future is not None and not future.done():
+                    future.set_exception(exc)
+            return None
+        found = {result['id']: result for result in results or ()}
+        for id_ in ids:
+            future = self._items.pop((entity, id_), None)
+            if future is not None and not future.done():
+                future.set_result(found.get(id_))
+
+    # -Instance Methods: Public
+    async def deps(self, entity: str, master_id: int) -> list[dict]:
+        '''Entities depending on master entity, e.g. contracts of a contractMaturity'''
+        return await self._get(urls.get_deps(self.endpoint, entity, master_id))
+
+    async def find(self, entity: str, name: str) -> dict | None:
+        '''Entity by name, e.g. a contract by symbol, None if there is none'''
+        try:
+            return await self._get(urls.get_find(self.endpoint, entity, name))
+        except aiohttp.ClientResponseError as exc:
+            if exc.status != 404:
+                raise
+            log.warning(f"EntityClient {entity} '{name}' not found")
+            return None
+
+    async def item(self, entity: str, id_: int) -> dict | None:
+        '''Entity by id, batched with other lookups made within the window'''
+        self.lookups += 1
+        key = (entity, id_)
+        future = self._items.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._items[key] = loop.create_future()
+            batch = self._batches.setdefault(entity, [])
+            batch.append(id_)
+            if len(batch) >= self.batch_size:
+                self._flush(entity)
+            elif entity not in self._timers:
+                self._timers[entity] = loop.call_later(self.window, self._flush, entity)
+        return await asyncio.shield(future)
+
+    async def items(self, entity: str, ids: list[int]) -> tuple[dict | None, ...]:
+        '''Entities by ids, in order, coalesced into as few requests as possible'''
+        return tuple(await asyncio.gather(*(self.item(entity, id_) for id_ in ids)))
+
+    async def list(self, entity: str) -> list[dict]:
+        '''Every entity of a type'''
+        return await self._get(urls.get_list(self.endpoint, entity))
@@ -0,0 +1,172 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Pre-Trade Risk      ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import logging
+from enum import Enum
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from market.products import product_of
+if TYPE_CHECKING:
+    from market import QuoteCache
+    from .entities import EntityStore
+    from .pnl import AccountPnL
+
+## Constants
+log = logging.getLogger(__name__)
+_SIDES = {"Buy": 1, "Sell": -1}
+
+
+## Classes
+class REJECT(Enum):
+    """Pre-trade risk rejection reason Enum"""
+    INVALID_QTY = 'invalid_qty'
+    UNKNOWN_CONTRACT = 'unknown_contract'
+    UNKNOWN_ORDER = 'unknown_order'
+    ORDER_RATE = 'order_rate'
+    DAILY_LOSS = 'daily_loss'
+    MAX_POSITION = 'max_position'
+    NO_QUOTE = 'no_quote'
+    PRICE_BAND = 'price_band'
+
+
+class RiskLimits:
+    """Pre-trade risk limits of one account"""
+    __slots__ = ('max_position', 'max_daily_loss', 'max_orders', 'rate_window', 'band_ticks')
+
+    # -Constructor
+    def __init__(
+        self, *, max_position: int = 2, max_daily_loss: float = 200.0,
+        max_orders: int = 10, rate_window: float = 1.0, band_ticks: int = 20
+    ) -> RiskLimits:
+        self.max_position: int = max_position
+        self.max_daily_loss: float = max_daily_loss
+        self.max_orders: int = max_orders
+        self.rate_window: float = rate_window
+        self.band_ticks: int = band_ticks
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"RiskLimits(max_position={self.max_position}, "
+            f"max_daily_loss={self.max_daily_loss}, max_orders={self.max_orders}/"
+            f"{self.rate_window}s, band_ticks={self.band_ticks})"
+        )
+
+
+class RiskGate:
+    """Pre-trade checks against live position, working order and quote caches"""
+
+    # -Constructor
+    def __init__(
+        self, pnl: AccountPnL, quotes: QuoteCache, limits: RiskLimits | None = None,
+        orders: EntityStore | None = None
+    ) -> RiskGate:
+        self.pnl: AccountPnL = pnl
+        self.quotes: QuoteCache = quotes
+        self.limits: RiskLimits = limits if limits else RiskLimits()
+        self.orders: EntityStore | None = orders
+        self.checked: int = 0
+        self.rejected: dict[REJECT, int] = {reason: 0 for reason in REJECT}
+        self._contracts: dict[str, tuple[int, float]] = {}
+        self._symbols: dict[int, str] = {}
+        self._tokens: float = float(self.limits.max_orders)
+        self._refill: float = self.limits.max_orders / self.limits.rate_window
+        self._last: float = monotonic()
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"RiskGate(account_id={self.pnl.account_id}, checked={self.checked}, "
+            f"rejected={sum(self.rejected.values())})"
+        )
+
+    # -Instance Methods: Private
+    def _reject(self, reason: REJECT) -> REJECT:
+        '''Count and log rejection'''
+        self.rejected[reason] += 1
+        log.warning(f"RiskGate account {self.pnl.account_id} rejected '{reason.value}'")
+        return reason
+
+    # -Instance Methods: Public
+    def add_contract(self, contract_id: int, symbol: str) -> bool:
+        '''Precompute contract id and price band for symbol'''
+        product = product_of(symbol)
+        if product is None:
+            return False
+        band = self.limits.band_ticks * product.tick_size
+        self._contracts[symbol] = (contract_id, band)
+        self._symbols[contract_id] = symbol
+        return True
+
+    def check(
+        self, symbol: str, action: str, qty: int, price: float | None = None, *,
+        replaces: int | None = None
+    ) -> REJECT | None:
+        '''Reason to reject the order, or None to send it; replaces is a modified order id'''
+        self.checked += 1
+        if qty <= 0:
+            return self._reject(REJECT.INVALID_QTY)
+        contract = self._contracts.get(symbol)
+        if contract is None:
+            return self._reject(REJECT.UNKNOWN_CONTRACT)
+        contract_id, band = contract
+        # -Order Rate
+        now = monotonic()
+        self._tokens = min(
+            self.limits.max_orders, self._tokens + (now - self._last) * self._refill
+        )
+        self._last = now
+        if self._tokens < 1:
+            return self._reject(REJECT.ORDER_RATE)
+        # -Exposure, reducing orders always pass so positions can be flattened
+        position = self.pnl.positions.get(contract_id)
+        net = position.net if position else 0
+        side = _SIDES[action]
+        after = net + side * qty
+        opening = abs(after) > abs(net)
+        if opening:
+            if self.pnl.daily_net <= -self.limits.max_daily_loss:
+                return self._reject(REJECT.DAILY_LOSS)
+            # -Worst case, every working order on the same side fills as well
+            if self.orders is not None:
+                buy, sell = self.orders.working_qty(
+                    self.pnl.account_id, contract_id, replaces
+                )
+                after += buy if side > 0 else -sell
+            if abs(after) > self.limits.max_position:
+                return self._reject(REJECT.MAX_POSITION)
+        # -Price Band
+        if opening or price is not None:
+            quote = self.quotes.get(contract_id)
+            if quote is None or quote.trade is None:
+                return self._reject(REJECT.NO_QUOTE)
+            if price is not None and abs(price - quote.trade) > band:
+                return self._reject(REJECT.PRICE_BAND)
+        self._tokens -= 1
+        return None
+
+    def check_modify(
+        self, order_id: int, qty: int, price: float | None = None
+    ) -> REJECT | None:
+        '''Reason to reject modifying working order to qty and price, or None to send it'''
+        order = self.orders.get('order', order_id) if self.orders is not None else None
+        if order is None:
+            self.checked += 1
+            return self._reject(REJECT.UNKNOWN_ORDER)
+        symbol = self._symbols.get(order['contractId'], "")
+        return self.check(symbol, order['action'], qty, price, replaces=order_id)
+
+    # -Properties
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            'checked': self.checked,
+            **{reason.value: count for reason, count in self.rejected.items()},
+        }
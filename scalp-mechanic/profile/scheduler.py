@@ -0,0 +1,243 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Request Scheduler   ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+import logging
+from bisect import insort
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from time import monotonic, perf_counter_ns
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+
+from utils.stats import Histogram
+
+## Constants
+log = logging.getLogger(__name__)
+MAX_INFLIGHT = 16
+MAX_PENALTIES = 3
+PENALTY_DELAY = 1.0
+
+
+## Classes
+class LANE(IntEnum):
+    """Request priority lane Enum, lower lanes are dispatched first"""
+    AUTH = 0
+    ORDER = 1
+    ACCOUNT = 2
+    BULK = 3
+
+
+# -Endpoint class lanes, every other class is BULK
+LANES: dict[str, LANE] = {
+    'auth': LANE.AUTH, 'order': LANE.ORDER, 'orderStrategy': LANE.ORDER,
+    'account': LANE.ACCOUNT, 'cashBalance': LANE.ACCOUNT, 'position': LANE.ACCOUNT,
+    'fill': LANE.ACCOUNT, 'user': LANE.ACCOUNT,
+}
+
+
+class TokenBucket:
+    """Token bucket rate limiter with penalty pauses, unlimited without a rate"""
+    __slots__ = ('rate', 'burst', 'tokens', 'last', 'paused_until')
+
+    # -Constructor
+    def __init__(self, rate: float | None = None, burst: int = 1) -> TokenBucket:
+        self.rate: float | None = rate
+        self.burst: int = burst
+        self.tokens: float = float(burst)
+        self.last: float = monotonic()
+        self.paused_until: float = 0.0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self.rate}, burst={self.burst}, tokens={self.tokens:.1f})"
+
+    # -Instance Methods
+    def delay(self, now: float) -> float:
+        '''Seconds until a token is available'''
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.rate is None:
+            return 0.0
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def pause(self, seconds: float) -> None:
+        '''Hold every request of the bucket for seconds, then resume with one token'''
+        self.paused_until = max(self.paused_until, monotonic() + seconds)
+        self.tokens = 1.0
+        self.last = self.paused_until
+
+    def take(self) -> None:
+        '''Consume a token'''
+        if self.rate is not None:
+            self.tokens -= 1
+
+
+class RequestScheduler:
+    """HTTP request scheduler with priority lanes, optional rate limits and penalty retries"""
+
+    # -Constructor
+    def __init__(
+        self, *, max_inflight: int = MAX_INFLIGHT,
+        rates: dict[LANE, tuple[float, int]] | None = None
+    ) -> RequestScheduler:
+        self.max_inflight: int = max_inflight
+        # -Lanes without a (rate per second, burst) are only paced by server penalties
+        self.rates: dict[LANE, tuple[float, int]] = dict(rates) if rates else {}
+        self.penalties: int = 0
+        self.waits: dict[LANE, Histogram] = {lane: Histogram() for lane in LANE}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._inflight: int = 0
+        self._seq: int = 0
+        self._waiting: list[tuple[LANE, int, str, asyncio.Future]] = []
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"RequestScheduler(inflight={self._inflight}, waiting={len(self._waiting)}, "
+            f"penalties={self.penalties})"
+        )
+
+    # -Instance Methods: Private
+    async def _acquire(self, lane: LANE, class_: str) -> None:
+        '''Wait for a connection slot and a token of the endpoint class'''
+        bucket = self._bucket(class_, lane)
+        if (
+            not self._waiting and self._inflight < self.max_inflight
+            and not bucket.delay(monotonic())
+        ):
+            bucket.take()
+            self._inflight += 1
+            self.waits[lane].record(0)
+            return None
+        start = perf_counter_ns()
+        future = asyncio.get_running_loop().create_future()
+        self._seq += 1
+        insort(self._waiting, (lane, self._seq, class_, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+        self.waits[lane].record(perf_counter_ns() - start)
+
+    def _bucket(self, class_: str, lane: LANE) -> TokenBucket:
+        '''Get or create endpoint class token bucket'''
+        bucket = self._buckets.get(class_)
+        if bucket is None:
+            bucket = self._buckets[class_] = TokenBucket(*self.rates.get(lane, ()))
+        return bucket
+
+    def _dispatch(self) -> None:
+        '''Start waiting requests in lane order as slots and tokens allow'''
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        now = monotonic()
+        wait = None
+        waiting = []
+        for entry in self._waiting:
+            lane, _, class_, future = entry
+            if future.done():
+                continue
+            if self._inflight >= self.max_inflight:
+                waiting.append(entry)
+                continue
+            bucket = self._buckets[class_]
+            delay = bucket.delay(now)
+            if delay:
+                wait = delay if wait is None else min(wait, delay)
+                waiting.append(entry)
+                continue
+            bucket.take()
+            self._inflight += 1
+            future.set_result(None)
+        self._waiting = waiting
+        if waiting and wait is not None and self._inflight < self.max_inflight:
+            self._wakeup = asyncio.get_running_loop().call_later(wait, self._dispatch)
+
+    def _release(self) -> None:
+        '''Free a connection slot'''
+        self._inflight -= 1
+        if self._waiting:
+            self._dispatch()
+
+    # -Instance Methods: Public
+    def pause(self, class_: str, seconds: float) -> None:
+        '''Hold every request of the endpoint class for seconds'''
+        self._bucket(class_, LANES.get(class_, LANE.BULK)).pause(seconds)
+
+    async def submit(
+        self, class_: str, call: Callable[[str | None], Awaitable[Any]]
+    ) -> Any:
+        '''Run call(ticket) when allowed, retrying once the penalty time has passed'''
+        lane = LANES.get(class_, LANE.BULK)
+        ticket = None
+        for attempt in range(MAX_PENALTIES + 1):
+            await self._acquire(lane, class_)
+            try:
+                result = await call(ticket)
+            except aiohttp.ClientResponseError as exc:
+                if exc.status != 429 or attempt == MAX_PENALTIES:
+                    raise
+                delay = retry_after(exc.headers.get('Retry-After') if exc.headers else None)
+            else:
+                if (
+                    not isinstance(result, dict) or 'p-ticket' not in result
+                    or result.get('p-captcha') or attempt == MAX_PENALTIES
+                ):
+                    return result
+                ticket = result['p-ticket']
+                delay = float(result.get('p-time', PENALTY_DELAY))
+            finally:
+                self._release()
+            self.penalties += 1
+            log.warning(f"RequestScheduler '{class_}' penalized, retrying in {delay}s")
+            self.pause(class_, delay)
+
+    # -Properties
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            'inflight': self._inflight,
+            'waiting': len(self._waiting),
+            'penalties': self.penalties,
+            'waits': {lane.name: hist.summary() for lane, hist in self.waits.items()},
+        }
+
+
+## Functions
+def retry_after(value: str | None) -> float:
+    """Seconds to wait from a Retry-After header in seconds or HTTP-date form"""
+    if not value:
+        return PENALTY_DELAY
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return PENALTY_DELAY
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+def endpoint_class(url: str) -> str:
+    """Endpoint class of a Tradovate REST URL, e.g. '.../v1/order/placeorder' -> 'order'"""
+    path = url.split('/v1/', 1)[-1]
+    return path.split('/', 1)[0]
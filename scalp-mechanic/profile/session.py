@@ -8,24 +8,41 @@
 ## Imports
 from __future__ import annotations
 import asyncio
-import json
 import logging
 from asyncio import AbstractEventLoop
 from datetime import datetime, timedelta, timezone
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 from aiohttp import ClientWebSocketResponse as ClientWebSocket
 
-from utils import timestamp_to_datetime, urls
+from .scheduler import LANE, MAX_INFLIGHT, RequestScheduler, endpoint_class
+from utils import codec, timestamp_to_datetime, urls
 from utils.errors import (
     LoginInvalidException, LoginCaptchaException,
     WebSocketOpenException, WebSocketAuthorizationException,
     WebSocketClosedException
 )
-from utils.typing import CredentialAuthDict
+from utils.typing import CredentialAuthDict, ResponseDict
+if TYPE_CHECKING:
+    from market import TickRecorder
 
 ## Constants
 log = logging.getLogger(__name__)
+REQUEST_TIMEOUT = 10.0
+REAUTHORIZE_RETRIES = 2
+REAUTHORIZE_DELAY = 1.0
+CONNECTION_LIMIT = 32
+CONNECTION_LIMIT_PER_HOST = 8
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60.0
+_REPLAYED = ("md/subscribe", "user/syncrequest")
+_UNSUBSCRIBE = "md/unsubscribe"
+_CLOSED = (
+    aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING,
+    aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR
+)
 
 
 ## Classes
@@ -33,16 +50,34 @@ class Session:
     """Tradovate Session"""
 
     # -Constructor
-    def __init__(self, *, loop: AbstractEventLoop | None = None) -> Session:
+    def __init__(
+        self, *, loop: AbstractEventLoop | None = None,
+        rates: dict[LANE, tuple[float, int]] | None = None,
+        max_inflight: int = MAX_INFLIGHT
+    ) -> Session:
         self.authenticated: asyncio.Event = asyncio.Event()
         self.token_expiration: datetime | None = None
+        self.access_token: str | None = None
+        self.md_access_token: str | None = None
+        self._headers: dict[str, str] = {}
         self._aiosession: aiohttp.ClientSession | None = None
         self._loop: AbstractEventLoop = loop if loop else asyncio.get_event_loop()
+        self.scheduler: RequestScheduler = RequestScheduler(
+            max_inflight=max_inflight, rates=rates
+        )
         self._loop.create_task(self.__ainit__(), name="session-init")
 
     # -Dunder Methods
     async def __ainit__(self) -> None:
-        self._aiosession = aiohttp.ClientSession(loop=self._loop, raise_for_status=True)
+        connector = aiohttp.TCPConnector(
+            limit=CONNECTION_LIMIT, limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL, keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+        self._aiosession = aiohttp.ClientSession(
+            loop=self._loop, connector=connector, raise_for_status=True,
+            # -Looked up per call so a later codec.use() also applies to REST bodies
+            json_serialize=lambda obj: codec.dumps(obj)
+        )
 
     def __repr__(self) -> str:
         str_ = f"Session(authenticated={self.authenticated.is_set()}"
@@ -51,18 +86,66 @@ class Session:
         return str_ + ")"
 
     # -Instance Methods: Private
-    async def _update_authorization(
-        self, res: aiohttp.ClientResponse
+    async def _authorize_websockets(
+        self, account_websockets: tuple[WebSocket] | None,
+        market_websockets: tuple[WebSocket] | None
+    ) -> None:
+        '''Authorize WebSockets with the current access tokens, retrying failures'''
+        websockets = [
+            (websocket, self.access_token) for websocket in account_websockets or ()
+        ] + [
+            (websocket, self.md_access_token) for websocket in market_websockets or ()
+        ]
+        for attempt in range(REAUTHORIZE_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(REAUTHORIZE_DELAY)
+            results = await asyncio.gather(*(
+                websocket.authorize(token) for websocket, token in websockets
+            ), return_exceptions=True)
+            failed = []
+            for (websocket, token), result in zip(websockets, results):
+                if isinstance(result, Exception):
+                    log.error(
+                        f"Session WebSocket[{websocket.id}] authorization failed: {result!r}"
+                    )
+                    failed.append((websocket, token))
+            websockets = failed
+            if not websockets:
+                return None
+        # -Reconnect on a fresh connection, which authorizes with the new token
+        for websocket, token in websockets:
+            log.error(f"Session WebSocket[{websocket.id}] dropped for reconnect")
+            websocket.token = token
+            await websocket.abort()
+
+    async def _send(
+        self, method: str, url: str, json: dict | None, ticket: str | None,
+        *args, **kwargs
+    ) -> Any:
+        '''Send HTTP request, adding the penalty ticket of a retried request'''
+        if ticket is not None and json is not None:
+            json = {**json, 'p-ticket': ticket}
+        headers = self._headers
+        if 'headers' in kwargs:
+            headers = {**headers, **kwargs.pop('headers')}
+        res = await self._aiosession.request(
+            method, url, *args, json=json, headers=headers, **kwargs
+        )
+        return await res.json(loads=codec.loads)
+
+    def _update_authorization(
+        self, res_dict: dict[str, str], *, renewal: bool = False
     ) -> dict[str, str]:
-        '''Updates Session authorization fields'''
-        res_dict = await res.json()
+        '''Updates Session authorization fields, a failed renewal keeps the current token'''
         # -Invalid Credentials
         if 'errorText' in res_dict:
-            self.authenticated.clear()
+            if not renewal:
+                self.authenticated.clear()
             raise LoginInvalidException(res_dict['errorText'])
         # -Captcha Limiting
         if 'p-ticket' in res_dict:
-            self.authenticated.clear()
+            if not renewal:
+                self.authenticated.clear()
             raise LoginCaptchaException(
                 res_dict['p-ticket'], int(res_dict['p-time']),
                 bool(res_dict['p-captcha'])
@@ -71,9 +154,10 @@ class Session:
         log.debug("Session event 'authorized'")
         self.authenticated.set()
         self.token_expiration = timestamp_to_datetime(res_dict['expirationTime'])
-        self._aiosession.headers.update({
-            'AUTHORIZATION': "Bearer " + res_dict['accessToken']
-        })
+        self.access_token = res_dict['accessToken']
+        self.md_access_token = res_dict.get('mdAccessToken', self.md_access_token)
+        # -Swapped whole, so a request sends either the old or the new header
+        self._headers = {'AUTHORIZATION': "Bearer " + self.access_token}
         return res_dict
 
     # -Instance Methods: Public
@@ -85,15 +169,29 @@ class Session:
         '''Return an aiohttp WebSocket'''
         return await self._aiosession.ws_connect(url, *args, **kwargs)
 
-    async def get(self, url, *args, **kwargs) -> dict[str, str]:
-        res = await self._aiosession.request('GET', url, *args, **kwargs)
-        return await res.json()
+    async def get(self, url: str, *args, **kwargs) -> dict[str, str]:
+        '''Scheduled HTTP GET, passing extra arguments on to aiohttp'''
+        return await self.request('GET', url, *args, **kwargs)
 
-    async def renew_access_token(self) -> None:
-        '''Renew Session authorization'''
+    async def renew_access_token(
+        self, *, account_websockets: tuple[WebSocket] | None = None,
+        market_websockets: tuple[WebSocket] | None = None,
+    ) -> None:
+        '''Renew Session authorization and re-authorize WebSockets in place'''
         log.debug("Session event 'renew'")
-        res = await self._aiosession.post(urls.http_auth_renew)
-        await self._update_authorization(res)
+        self._update_authorization(
+            await self.request('POST', urls.http_auth_renew), renewal=True
+        )
+        await self._authorize_websockets(account_websockets, market_websockets)
+
+    async def request(
+        self, method: str, url: str, *args, json: dict | None = None, **kwargs
+    ) -> Any:
+        '''Scheduled HTTP request, paced per endpoint class and retried on penalty'''
+        return await self.scheduler.submit(
+            endpoint_class(url),
+            lambda ticket: self._send(method, url, json, ticket, *args, **kwargs)
+        )
 
     async def request_access_token(
         self, auth: CredentialAuthDict, *,
@@ -102,14 +200,10 @@ class Session:
     ) -> int:
         '''Request Session authorization'''
         log.debug("Session event 'request'")
-        res = await self._aiosession.post(urls.http_auth_request, json=auth)
-        res_dict = await self._update_authorization(res)
-        if account_websockets:
-            for account_websocket in account_websockets:
-                await account_websocket.authorize(res_dict['accessToken'])
-        if market_websockets:
-            for market_websocket in market_websockets:
-                await market_websocket.authorize(res_dict['mdAccessToken'])
+        res_dict = self._update_authorization(
+            await self.request('POST', urls.http_auth_request, json=auth)
+        )
+        await self._authorize_websockets(account_websockets, market_websockets)
         return res_dict['userId']
 
     # -Property
@@ -140,16 +234,27 @@ class WebSocket:
         self.connected: asyncio.Event = asyncio.Event()
         self.authenticated: asyncio.Event = asyncio.Event()
         self._request: int = 0
+        self._pending: dict[int, asyncio.Future] = {}
+        self._replay: dict[tuple[str, str], tuple[str, str]] = {}
+        self.token: str | None = None
+        self.reconnects: int = 0
+        self.recorder: TickRecorder | None = None
+        self.timing: bool = False
+        self.received_ns: int = 0
+        self.decoded_ns: int = 0
+        self._heartbeat_task: asyncio.Task | None = None
         self._aiowebsocket: ClientWebSocket = websocket
         self._loop: AbstractEventLoop = loop if loop else asyncio.get_event_loop()
-        self._loop.create_task(self.__ainit__(), name=f"websocket[{self.id}]-init")
+        self._opening: asyncio.Task = self._loop.create_task(
+            self.__ainit__(), name=f"websocket[{self.id}]-init"
+        )
 
     # -Dunder Methods
     async def __ainit__(self) -> None:
         if await self._aiowebsocket.receive_str() != 'o':
             raise WebSocketOpenException(self.url)
         self.connected.set()
-        self._loop.create_task(
+        self._heartbeat_task = self._loop.create_task(
             self._heartbeat(), name=f"websocket[{self.id}]-heartbeat"
         )
 
@@ -161,46 +266,140 @@ class WebSocket:
 
     # -Instance Methods: Private
     async def _heartbeat(self) -> None:
-        '''Send heartbeat packet to aiowebsocket'''
+        '''Send heartbeat packet to aiowebsocket until it closes'''
         while self.connected.is_set():
             await asyncio.sleep(2.5)
-            await self._aiowebsocket.send_str("[]")
+            if self._aiowebsocket.closed:
+                return None
+            try:
+                await self._aiowebsocket.send_str("[]")
+            except ConnectionError as exc:
+                log.debug(f"WebSocket[{self.id}] heartbeat stopped: {exc!r}")
+                return None
+
+    async def _stop_heartbeat(self) -> None:
+        '''Cancel the heartbeat task and wait for it to finish'''
+        task, self._heartbeat_task = self._heartbeat_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def _fail_pending(self, exc: Exception) -> None:
+        '''Fail every pending request future with exception'''
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
 
-    async def _socket_send(self, url: str, query: str = "", body: str = "") -> None:
+    async def _socket_request(
+        self, url: str, query: str = "", body: str = "",
+        timeout: float | None = REQUEST_TIMEOUT
+    ) -> ResponseDict:
+        '''Send formatted request string and await its correlated response'''
+        id_, future = await self._socket_send(url, query, body)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(id_, None)
+
+    async def _socket_send(
+        self, url: str, query: str = "", body: str = ""
+    ) -> tuple[int, asyncio.Future]:
         '''Send formatted request string to aiowebsocket'''
-        req = f"{url}\n{self._request}\n{query}\n{body}"
+        id_ = self._request
         self._request += 1
-        await self._aiowebsocket.send_str(req)
+        future = self._loop.create_future()
+        self._pending[id_] = future
+        try:
+            await self._aiowebsocket.send_str(f"{url}\n{id_}\n{query}\n{body}")
+        except BaseException:
+            self._pending.pop(id_, None)
+            raise
+        return id_, future
 
     # -Instance Methods: Public
     async def authorize(self, token: str) -> None:
         '''Request WebSocket authorization'''
-        await self._socket_send(urls.wss_auth, body=token)
-        ws_res = (await self.poll_message())[0]
-        if not ws_res or ws_res['s'] != 200:
+        ws_res = await self._socket_request(urls.wss_auth, body=token)
+        if ws_res['s'] != 200:
             raise WebSocketAuthorizationException(self.url, token)
+        self.token = token
         self.authenticated.set()
 
     async def close(self) -> None:
-        if self.connected.is_set():
-            await self._aiowebsocket.close()
         self.connected.clear()
         self.authenticated.clear()
+        await self._stop_heartbeat()
+        if not self._aiowebsocket.closed:
+            await self._aiowebsocket.close()
+        self._fail_pending(WebSocketClosedException(self.url))
 
-    async def poll_message(self) -> None:
-        '''Recieve dictionary object or None from aiowebsocket'''
+    async def poll_message(self) -> list[dict] | None:
+        '''Recieve every uncorrelated message of a frame or None from aiowebsocket'''
         ws_res = await self._aiowebsocket.receive()
+        if self.timing:
+            self.received_ns = perf_counter_ns()
+        if ws_res.type in _CLOSED:
+            self._fail_pending(WebSocketClosedException(self.url))
+            raise WebSocketClosedException(self.url)
         init_ = ws_res.data[0]
         if init_ == 'a':
-            return json.loads(ws_res.data[1:])
+            if self.recorder is not None:
+                self.recorder.record_frame(ws_res.data)
+            messages = []
+            for msg in codec.loads(ws_res.data[1:]):
+                future = self._pending.pop(msg['i'], None) if 'i' in msg else None
+                if future is None:
+                    messages.append(msg)
+                elif not future.done():
+                    future.set_result(msg)
+            if self.timing:
+                self.decoded_ns = perf_counter_ns()
+            return messages
         elif init_ == 'c':
+            self._fail_pending(WebSocketClosedException(self.url))
             raise WebSocketClosedException(self.url)
         return None
 
+    async def abort(self) -> None:
+        '''Drop the aiowebsocket connection without marking it intentionally closed'''
+        await self._aiowebsocket.close()
+
+    async def reopen(self, websocket: ClientWebSocket) -> None:
+        '''Resume on a new aiowebsocket after a disconnect'''
+        await self.close()
+        self._aiowebsocket = websocket
+        await self.__ainit__()
+
+    async def restore(self) -> list[tuple[str, ResponseDict]]:
+        '''Re-authorize and replay active subscriptions; returns (endpoint, response)'''
+        if self.token:
+            await self.authorize(self.token)
+        replay = tuple(self._replay.items())
+        results = await asyncio.gather(*(
+            self._socket_request(url, query, body)
+            for (_, body), (url, query) in replay
+        ), return_exceptions=True)
+        responses = []
+        for ((endpoint, body), _), result in zip(replay, results):
+            if isinstance(result, Exception) or result['s'] != 200:
+                log.warning(f"WebSocket[{self.id}] replay '{endpoint}' {body} failed")
+            else:
+                responses.append((endpoint, result))
+        self.reconnects += 1
+        return responses
+
+    async def request_encoded(
+        self, url: str, body: str, *, timeout: float | None = REQUEST_TIMEOUT
+    ) -> ResponseDict:
+        '''Send a pre-serialized request body and await its response'''
+        return await self._socket_request(url, "", body, timeout)
+
     async def request(
-        self, url: str, *, body: dict[str, str] | None = None, **kwargs
-    ) -> None:
-        '''Send a formatted request to aiowebsocket'''
+        self, url: str, *, body: dict[str, str] | None = None,
+        timeout: float | None = REQUEST_TIMEOUT, **kwargs
+    ) -> ResponseDict:
+        '''Send a formatted request to aiowebsocket and await its response'''
         log.debug(f"WebSocket[{self.id}] event '{url}'")
         if kwargs:
             fields = []
@@ -211,8 +410,18 @@ class WebSocket:
             query = '&'.join(fields)
         else:
             query = ""
-        body = json.dumps(body) if body else ""
-        await self._socket_send(url, query, body)
+        body = codec.dumps(body) if body else ""
+        endpoint = url.lower()
+        if endpoint.startswith(_REPLAYED):
+            self._replay[(endpoint, body)] = (url, query)
+        elif endpoint.startswith(_UNSUBSCRIBE):
+            self._replay.pop(("md/subscribe" + endpoint[len(_UNSUBSCRIBE):], body), None)
+        return await self._socket_request(url, query, body, timeout)
+
+    async def wait_connected(self) -> None:
+        '''Wait for the open handshake, raising its error if it failed'''
+        if not self.connected.is_set():
+            await asyncio.shield(self._opening)
 
     # -Class Methods
     @classmethod
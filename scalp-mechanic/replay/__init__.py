@@ -0,0 +1,9 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Replay Module                 ##
+##-------------------------------##
+
+## Imports
+from .server import ReplayServer
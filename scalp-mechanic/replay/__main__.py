@@ -0,0 +1,48 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Replay Server Entry Point     ##
+##-------------------------------##
+
+"""
+Serve a TickRecorder session as a local Tradovate stand-in.
+
+Usage (from the scalp-mechanic directory):
+    python -m replay RECORDING [--speed N | --fast] [--port N]
+
+Point a Client at it with urls.set_host("127.0.0.1:PORT", secure=False).
+"""
+
+## Imports
+import argparse
+import asyncio
+import logging
+
+from replay import ReplayServer
+
+
+## Functions
+async def serve(args: argparse.Namespace) -> None:
+    """Run ReplayServer until cancelled"""
+    server = ReplayServer.from_recording(
+        args.recording, speed=None if args.fast else args.speed,
+        host=args.host, port=args.port
+    )
+    async with server:
+        print(f"Replaying {args.recording} on {server.address}")
+        await asyncio.Event().wait()
+
+
+## Body
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+parser.add_argument('recording')
+parser.add_argument('--speed', type=float, default=1.0)
+parser.add_argument('--fast', action='store_true', help="as fast as possible")
+parser.add_argument('--host', default="127.0.0.1")
+parser.add_argument('--port', type=int, default=8000)
+logging.basicConfig(level=logging.INFO)
+try:
+    asyncio.run(serve(parser.parse_args()))
+except KeyboardInterrupt:
+    pass
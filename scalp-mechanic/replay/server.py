@@ -0,0 +1,283 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Replay Server       ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable
+
+from aiohttp import WSMsgType, web
+
+from market import TickReader
+from utils import codec
+from utils.typing import AccountDict
+
+## Constants
+log = logging.getLogger(__name__)
+HEARTBEAT = 2.5
+TOKEN_DURATION = timedelta(minutes=80)
+USER_ID = 1
+DEFAULT_ACCOUNTS: list[AccountDict] = [
+    {'id': 1, 'userId': USER_ID, 'name': "REPLAY1", 'accountType': "Customer",
+     'active': True, 'archived': False},
+]
+_MASTERS = {
+    'contract': 'contractMaturityId', 'contractMaturity': 'productId',
+    'order': 'accountId', 'position': 'accountId', 'fill': 'orderId',
+}
+_MD_SUBSCRIBE = (
+    "md/subscribequote", "md/subscribedom", "md/subscribehistogram", "md/getchart"
+)
+
+
+## Classes
+class ReplayServer:
+    """Local Tradovate stand-in server replaying recorded frames"""
+
+    # -Constructor
+    def __init__(
+        self, frames: Iterable[tuple[int, str]] = (), *,
+        speed: float | None = 1.0, host: str = "127.0.0.1", port: int = 0,
+        accounts: list[AccountDict] | None = None, snapshot: dict | None = None,
+        entities: dict[str, list[dict]] | None = None,
+    ) -> ReplayServer:
+        self.speed: float | None = speed
+        self.host: str = host
+        self.port: int = port
+        self.accounts: list[AccountDict] = accounts if accounts else DEFAULT_ACCOUNTS
+        self.snapshot: dict = snapshot if snapshot else {
+            'users': [{'id': USER_ID, 'name': "replay"}], 'accounts': self.accounts,
+            'orders': [], 'positions': [], 'fills': [], 'cashBalances': [],
+        }
+        self.entities: dict[str, list[dict]] = {
+            **(entities if entities else {}), 'account': self.accounts,
+        }
+        self.frames_sent: int = 0
+        self.requests: int = 0
+        self.tokens: int = 0
+        self._frames: list[tuple[int, str]] = []
+        self._websockets: set[web.WebSocketResponse] = set()
+        self._chart: int = 0
+        self._order: int = 0
+        self._runner: web.AppRunner | None = None
+        self.load(frames)
+
+    # -Dunder Methods
+    async def __aenter__(self) -> ReplayServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    def __repr__(self) -> str:
+        return (
+            f"ReplayServer(address={self.address}, frames={len(self._frames)}, "
+            f"speed={self.speed})"
+        )
+
+    # -Instance Methods: Private
+    def _app(self) -> web.Application:
+        '''Build aiohttp application routes'''
+        app = web.Application()
+        app.router.add_get("/v1/websocket", self._websocket)
+        app.router.add_post("/v1/auth/accesstokenrequest", self._access_token)
+        app.router.add_post("/v1/auth/renewaccesstoken", self._access_token)
+        app.router.add_get("/v1/auth/me", self._me)
+        for path in ("list", "item", "items", "deps", "find"):
+            app.router.add_get(f"/v1/{{entity}}/{path}", self._entity)
+            app.router.add_get(f"/v1/{{entity}}/{path}/", self._entity)
+        return app
+
+    async def _access_token(self, request: web.Request) -> web.Response:
+        '''HTTP access token request and renewal'''
+        self.requests += 1
+        self.tokens += 1
+        expiration = datetime.now(timezone.utc) + TOKEN_DURATION
+        return web.json_response({
+            'accessToken': f"replay-access-token-{self.tokens}",
+            'mdAccessToken': f"replay-md-access-token-{self.tokens}",
+            'expirationTime': expiration.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+            'userStatus': "Active", 'userId': USER_ID, 'name': "replay",
+            'hasLive': True,
+        }, dumps=codec.dumps)
+
+    async def _entity(self, request: web.Request) -> web.Response:
+        '''HTTP entity list, item, items, deps and find'''
+        self.requests += 1
+        entities = self.entities.get(request.match_info['entity'], [])
+        path = request.path.rstrip('/').rsplit('/', 1)[-1]
+        if path == "item" or path == "find":
+            key, value = (
+                ('id', int(request.query['id'])) if path == "item"
+                else ('name', request.query['name'])
+            )
+            entity = next((e for e in entities if e.get(key) == value), None)
+            if entity is None:
+                raise web.HTTPNotFound()
+            return web.json_response(entity, dumps=codec.dumps)
+        if path == "items":
+            ids = {int(i) for i in request.query['ids'].split(',')}
+            entities = [e for e in entities if e['id'] in ids]
+        elif path == "deps":
+            field = _MASTERS.get(request.match_info['entity'])
+            master_id = int(request.query['masterid'])
+            entities = [e for e in entities if e.get(field) == master_id]
+        return web.json_response(entities, dumps=codec.dumps)
+
+    async def _heartbeat(self, ws: web.WebSocketResponse) -> None:
+        '''Send server heartbeat frames'''
+        while not ws.closed:
+            await asyncio.sleep(HEARTBEAT)
+            await ws.send_str('h')
+
+    async def _me(self, request: web.Request) -> web.Response:
+        '''HTTP profile details'''
+        self.requests += 1
+        return web.json_response({
+            'userId': USER_ID, 'fullName': "Replay User", 'email': "replay@localhost",
+            'emailVerified': True, 'isTrial': False,
+        }, dumps=codec.dumps)
+
+    def _next_order(self) -> int:
+        '''Next simulated order or command id'''
+        self._order += 1
+        return self._order
+
+    async def _playback(self, ws: web.WebSocketResponse) -> None:
+        '''Send recorded frames, paced by their receive times and speed'''
+        if not self._frames:
+            return None
+        loop = asyncio.get_running_loop()
+        start, first = loop.time(), self._frames[0][0]
+        for received, frame in self._frames:
+            if ws.closed:
+                break
+            if self.speed:
+                delay = (received - first) / 1e9 / self.speed - (loop.time() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await ws.send_str(self.encode_frame(frame))
+            self.frames_sent += 1
+        log.debug(f"ReplayServer playback finished, {self.frames_sent} frames sent")
+
+    def _reply(self, url: str, body: str) -> tuple[int, object]:
+        '''Status and data for a WebSocket request'''
+        endpoint = url.lower()
+        if endpoint == "authorize":
+            return (200, None) if body else (401, "Access is denied")
+        if endpoint == "user/syncrequest":
+            return 200, self.snapshot
+        if endpoint == "md/getchart":
+            self._chart += 2
+            return 200, {'historicalId': self._chart - 1, 'realtimeId': self._chart}
+        if endpoint.startswith(("md/", "replay/")):
+            return 200, None
+        if endpoint in ("order/modifyorder", "order/cancelorder"):
+            return 200, {'commandId': self._next_order()}
+        if endpoint == "order/placeorder":
+            return 200, {'orderId': self._next_order()}
+        if endpoint == "order/placeoso":
+            ids = [self._next_order() for _ in range(3)]
+            return 200, {'orderId': ids[0], 'oso1Id': ids[1], 'oso2Id': ids[2]}
+        if endpoint == "order/placeoco":
+            return 200, {'orderId': self._next_order(), 'ocoId': self._next_order()}
+        return 404, f"Unknown endpoint '{url}'"
+
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        '''SockJS-like Tradovate WebSocket endpoint'''
+        ws = web.WebSocketResponse(autoping=True)
+        await ws.prepare(request)
+        self._websockets.add(ws)
+        await ws.send_str('o')
+        tasks = [asyncio.create_task(self._heartbeat(ws))]
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                if msg.data == "[]":
+                    continue
+                url, id_, _query, body = msg.data.split('\n', 3)
+                self.requests += 1
+                status, data = self._reply(url, body)
+                res = {'s': status, 'i': int(id_)}
+                if data is not None:
+                    res['d'] = data
+                await ws.send_str('a' + codec.dumps([res]))
+                if url.lower() in _MD_SUBSCRIBE and len(tasks) == 1:
+                    tasks.append(asyncio.create_task(self._playback(ws)))
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._websockets.discard(ws)
+        return ws
+
+    # -Instance Methods: Public
+    async def close_websockets(self, code: int = 1000, reason: str = "") -> None:
+        '''Send 'c' frame and close every connected WebSocket'''
+        for ws in tuple(self._websockets):
+            await ws.send_str('c' + codec.dumps([code, reason]))
+            await ws.close()
+
+    def encode_frame(self, frame: str) -> str:
+        '''Final form of a recorded frame as sent; override to stamp frames'''
+        return frame
+
+    def load(self, frames: Iterable[tuple[int, str]]) -> None:
+        '''Load (receive time ns, raw frame) records, dropping recorded replies'''
+        self._frames = []
+        for received, frame in frames:
+            if not frame.startswith('a'):
+                continue
+            messages = [msg for msg in codec.loads(frame[1:]) if 'i' not in msg]
+            if messages:
+                self._frames.append((received, 'a' + codec.dumps(messages)))
+
+    async def start(self) -> None:
+        '''Start listening'''
+        self._runner = web.AppRunner(self._app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        log.debug(f"ReplayServer listening on {self.address}")
+
+    async def stop(self) -> None:
+        '''Close every WebSocket and stop listening'''
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # -Class Methods
+    @classmethod
+    def from_recording(cls, directory: str | Path, **kwargs) -> ReplayServer:
+        '''Create ReplayServer from a TickRecorder directory'''
+        with TickReader(directory) as reader:
+            return cls(reader.frames(), **kwargs)
+
+    @classmethod
+    def from_frames(
+        cls, frames: Iterable[str], rate: float | None = None, **kwargs
+    ) -> ReplayServer:
+        '''Create ReplayServer from raw frames sent at rate frames/second'''
+        interval = int(1e9 / rate) if rate else 0
+        return cls(
+            ((i * interval, frame) for i, frame in enumerate(frames)),
+            speed=1.0 if rate else None, **kwargs
+        )
+
+    # -Properties
+    @property
+    def address(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    @property
+    def wss_url(self) -> str:
+        return f"ws://{self.address}/v1/websocket"
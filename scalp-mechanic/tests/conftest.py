@@ -0,0 +1,14 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Test Configuration            ##
+##-------------------------------##
+
+## Imports
+import sys
+from pathlib import Path
+
+## Body
+# -Modules import flat from the scalp-mechanic directory, as when run from it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
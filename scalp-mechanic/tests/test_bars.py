@@ -0,0 +1,89 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Bar Series Tests              ##
+##-------------------------------##
+
+## Imports
+import math
+
+import numpy as np
+
+from market.bars import BAR, BarBuilder, BarSeries
+
+
+## Functions
+def series(closes: list[float], capacity: int) -> BarSeries:
+    """Series of flat bars one second apart closing at closes"""
+    bars = BarSeries(capacity)
+    for i, close in enumerate(closes):
+        bars.append(float(i), close, close, close, close, 1.0, 1.0)
+    return bars
+
+
+def test_ring_buffer_wraps_contiguously():
+    """Past capacity the oldest bars are overwritten and columns stay in order"""
+    bars = series([float(i) for i in range(7)], capacity=4)
+    assert len(bars) == 4
+    assert bars.close.tolist() == [3.0, 4.0, 5.0, 6.0]
+    assert bars.column('timestamp', 2).tolist() == [5.0, 6.0]
+    assert bars.close.base is bars._data
+    assert bars.last('close') == 6.0
+
+
+def test_set_and_pop_newest_bar():
+    """The newest bar can be rewritten in place or dropped"""
+    bars = series([1.0, 2.0], capacity=2)
+    bars.set(1.0, 2.0, 5.0, 2.0, 4.0, 3.0, 2.0)
+    assert bars.high.tolist() == [1.0, 5.0]
+    bars.pop()
+    assert bars.close.tolist() == [1.0]
+    bars.append(2.0, 9.0, 9.0, 9.0, 9.0, 1.0, 1.0)
+    assert bars.close.tolist() == [1.0, 9.0]
+
+
+def test_last_of_empty_series_is_nan():
+    """An empty series has no newest value"""
+    bars = BarSeries(4)
+    assert math.isnan(bars.last('close'))
+    bars.append(0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0)
+    bars.clear()
+    assert math.isnan(bars.last('close'))
+    assert len(bars.close) == 0
+
+
+def test_view_shares_buffer():
+    """A view drops the newest bars without copying, even once wrapped"""
+    bars = series([float(i) for i in range(6)], capacity=4)
+    view = bars.view(1)
+    assert view.close.tolist() == [2.0, 3.0, 4.0]
+    assert view.last('close') == 4.0
+    assert np.shares_memory(view.close, bars.close)
+    assert len(bars.view(5)) == 0
+    assert math.isnan(bars.view(5).last('close'))
+
+
+def test_closed_excludes_forming_bar():
+    """Builder closed bars leave out the bar still forming"""
+    builder = BarBuilder(BAR.TICK, 2, capacity=8)
+    for price in (1.0, 2.0, 3.0):
+        builder.update_tick(0.0, price, 1)
+    assert len(builder.bars) == 2
+    assert builder.closed.close.tolist() == [2.0]
+    assert np.shares_memory(builder.closed.close, builder.bars.close)
+    builder.update_tick(0.0, 4.0, 1)
+    assert builder.closed is builder.bars
+
+
+def test_time_bars_close_on_bucket_change():
+    """Time bars start on bucket boundaries and close when the bucket changes"""
+    builder = BarBuilder(BAR.TIME, 60, capacity=8)
+    closes = []
+    builder.subscribe(lambda bars: closes.append(bars.last('close')))
+    assert not builder.update_tick(61.0, 10.0, 1)
+    assert not builder.update_tick(119.0, 12.0, 2)
+    assert builder.update_tick(120.0, 11.0, 1)
+    assert closes == [12.0]
+    assert builder.bars.timestamp.tolist() == [60.0, 120.0]
+    assert builder.bars.volume.tolist() == [3.0, 1.0]
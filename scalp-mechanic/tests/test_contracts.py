@@ -0,0 +1,123 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Contract Cache Tests          ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+import json
+from time import time
+
+from market.contracts import VERSION, ContractCache, ContractInfo
+
+## Constants
+ENTITIES = {
+    'contract': [{'id': 2665267, 'name': "ESM9", 'contractMaturityId': 50}],
+    'contractMaturity': [
+        {'id': 50, 'productId': 7, 'expirationDate': "2099-06-17T13:30:00Z"}
+    ],
+    'product': [{'id': 7, 'name': "ES", 'tickSize': 0.25, 'valuePerPoint': 50.0}],
+}
+
+
+## Classes
+class ContractRest:
+    """Entity client stand-in answering lookups from ENTITIES"""
+
+    # -Constructor
+    def __init__(self) -> ContractRest:
+        self.calls: list[tuple[str, int | str]] = []
+
+    # -Instance Methods
+    async def find(self, entity: str, name: str) -> dict | None:
+        '''Entity by name after yielding once'''
+        self.calls.append((entity, name))
+        await asyncio.sleep(0)
+        return next((e for e in ENTITIES[entity] if e['name'] == name), None)
+
+    async def item(self, entity: str, id_: int) -> dict | None:
+        '''Entity by id after yielding once'''
+        self.calls.append((entity, id_))
+        await asyncio.sleep(0)
+        return next((e for e in ENTITIES[entity] if e['id'] == id_), None)
+
+
+## Functions
+def info(id_: int = 1, name: str = "MESZ6", expiration: float | None = None):
+    """Contract info expiring in an hour unless given"""
+    expiration = time() + 3600.0 if expiration is None else expiration
+    return ContractInfo(id_, name, "MES", 0.25, 5.0, expiration)
+
+
+def test_resolve_fetches_once_and_saves(tmp_path):
+    """A miss is fetched once for concurrent callers, then hits and persists"""
+    path = tmp_path / 'contracts.json'
+    rest = ContractRest()
+    cache = ContractCache(path, rest)
+
+    async def main():
+        first = await asyncio.gather(cache.resolve("ESM9"), cache.resolve("ESM9"))
+        return first, await cache.resolve(2665267)
+    (a, b), c = asyncio.run(main())
+    assert a is b is c
+    assert (a.product, a.tick_size, a.point_value) == ("ES", 0.25, 50.0)
+    assert len(rest.calls) == 3
+    assert (cache.hits, cache.misses) == (1, 2)
+    saved = json.loads(path.read_text())
+    assert saved == {'version': VERSION, 'contracts': [a.row()]}
+
+
+def test_load_restores_saved_contracts(tmp_path):
+    """A new cache on the same path resolves saved contracts without REST"""
+    path = tmp_path / 'contracts.json'
+    asyncio.run(ContractCache(path, ContractRest()).resolve("ESM9"))
+    rest = ContractRest()
+    cache = ContractCache(path, rest)
+    assert len(cache) == 1
+    assert asyncio.run(cache.resolve("ESM9")).id == 2665267
+    assert rest.calls == []
+
+
+def test_unknown_contract_resolves_none():
+    """Unknown symbols and a cache without REST resolve to None"""
+    assert asyncio.run(ContractCache(rest=ContractRest()).resolve("NOPE")) is None
+    assert asyncio.run(ContractCache().resolve("ESM9")) is None
+
+
+def test_expired_contracts_dropped():
+    """Expired contracts are not returned and are dropped from every index"""
+    cache = ContractCache()
+    cache._add(info(expiration=time() - 1.0))
+    assert cache.get("MESZ6") is None
+    assert 1 not in cache
+    assert len(cache) == 0
+
+
+def test_save_and_load_skip_expired(tmp_path):
+    """Expired contracts are neither written nor loaded"""
+    path = tmp_path / 'contracts.json'
+    cache = ContractCache(path)
+    cache._add(info(1, "MESZ6"))
+    cache._add(info(2, "MESH6", expiration=time() - 1.0))
+    cache.save()
+    assert [row[0] for row in json.loads(path.read_text())['contracts']] == [1]
+    path.write_text(json.dumps({'version': VERSION, 'contracts': [
+        info(1, "MESZ6").row(), info(2, "MESH6", time() - 1.0).row(),
+    ]}))
+    assert ContractCache(path).contracts[0].id == 1
+    assert len(ContractCache(path)) == 1
+
+
+def test_load_ignores_bad_files(tmp_path):
+    """Missing, unreadable, other version and malformed rows load nothing"""
+    path = tmp_path / 'contracts.json'
+    assert len(ContractCache(path)) == 0
+    path.write_text("not json")
+    assert len(ContractCache(path)) == 0
+    path.write_text(json.dumps({'version': VERSION + 1, 'contracts': [info().row()]}))
+    assert len(ContractCache(path)) == 0
+    path.write_text(json.dumps({'version': VERSION, 'contracts': [[1, "MESZ6"]]}))
+    assert len(ContractCache(path)) == 0
@@ -0,0 +1,151 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Account Directory Tests       ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+
+from profile.directory import AccountDirectory
+from profile.entities import EntityStore
+from utils import urls
+
+
+## Classes
+class AccountRest:
+    """Entity client stand-in listing the accounts of one endpoint"""
+
+    # -Constructor
+    def __init__(self, accounts: list[dict] | Exception) -> AccountRest:
+        self.accounts: list[dict] | Exception = accounts
+        self.calls: int = 0
+
+    # -Instance Methods
+    async def list(self, entity_type: str) -> list[dict]:
+        '''Accounts after yielding once, so concurrent callers overlap'''
+        assert entity_type == 'account'
+        self.calls += 1
+        await asyncio.sleep(0)
+        if isinstance(self.accounts, Exception):
+            raise self.accounts
+        return self.accounts
+
+
+class AccountProfile:
+    """Profile stand-in with one entity client and websocket per endpoint"""
+
+    # -Constructor
+    def __init__(
+        self, live: list[dict] | Exception, demo: list[dict] | Exception
+    ) -> AccountProfile:
+        self.session: None = None
+        self.rests: dict[urls.ENDPOINT, AccountRest] = {
+            urls.ENDPOINT.LIVE: AccountRest(live), urls.ENDPOINT.DEMO: AccountRest(demo),
+        }
+
+    # -Instance Methods
+    def rest(self, endpoint: urls.ENDPOINT) -> AccountRest:
+        '''Entity client of endpoint'''
+        return self.rests[endpoint]
+
+    def websocket(self, endpoint: urls.ENDPOINT) -> str:
+        '''Marker standing in for the websocket of endpoint'''
+        return endpoint.name
+
+
+## Functions
+def account(id_: int, name: str, nickname: str | None = None) -> dict:
+    """Account entity"""
+    return {'id': id_, 'userId': 1, 'name': name, 'nickname': nickname}
+
+
+def test_refresh_indexes_both_endpoints():
+    """Live and demo accounts are indexed by id, name and nickname"""
+    profile = AccountProfile([account(1, "LIVE1")], [account(2, "DEMO2", "practice")])
+    directory = AccountDirectory(profile)
+    assert directory.stale
+    asyncio.run(directory.ensure())
+    assert not directory.stale
+    assert len(directory) == 2
+    live, demo = directory.get(id_=1), directory.get(id_=2)
+    assert (live.endpoint, live.websocket) == (urls.ENDPOINT.LIVE, "LIVE")
+    assert (demo.endpoint, demo.websocket) == (urls.ENDPOINT.DEMO, "DEMO")
+    assert directory.get(name="DEMO2") is demo
+    assert directory.get(nickname="practice") is demo
+    assert directory.get(name="NONE") is None
+
+
+def test_concurrent_lookups_share_one_fetch():
+    """Concurrent callers wait on the same request, fresh ones make none"""
+    profile = AccountProfile([account(1, "LIVE1")], [])
+    directory = AccountDirectory(profile)
+
+    async def main():
+        await asyncio.gather(directory.ensure(), directory.ensure(), directory.refresh())
+        await directory.ensure()
+    asyncio.run(main())
+    assert profile.rests[urls.ENDPOINT.LIVE].calls == 1
+    assert profile.rests[urls.ENDPOINT.DEMO].calls == 1
+
+
+def test_refresh_updates_in_place_and_drops_missing():
+    """Refetched accounts keep their object, accounts no longer listed are dropped"""
+    live = AccountRest([account(1, "LIVE1"), account(3, "LIVE3")])
+    profile = AccountProfile([], [])
+    profile.rests[urls.ENDPOINT.LIVE] = live
+    directory = AccountDirectory(profile)
+    asyncio.run(directory.refresh())
+    first = directory.get(id_=1)
+    live.accounts = [account(1, "RENAMED", "main")]
+    directory.invalidate()
+    asyncio.run(directory.ensure())
+    assert directory.get(name="RENAMED") is first
+    assert directory.get(nickname="main") is first
+    assert directory.get(name="LIVE1") is None
+    assert 3 not in directory
+
+
+def test_failed_endpoint_keeps_its_accounts():
+    """An endpoint failing to list leaves its cached accounts and the other endpoint"""
+    profile = AccountProfile([account(1, "LIVE1")], [account(2, "DEMO2")])
+    directory = AccountDirectory(profile)
+    asyncio.run(directory.refresh())
+    profile.rests[urls.ENDPOINT.DEMO].accounts = ConnectionError("down")
+    profile.rests[urls.ENDPOINT.LIVE].accounts = []
+    asyncio.run(directory.refresh())
+    assert 1 not in directory
+    assert 2 in directory
+    assert not directory.stale
+
+
+def test_all_endpoints_failing_stays_stale():
+    """Nothing fetched leaves the directory stale"""
+    error = ConnectionError("down")
+    directory = AccountDirectory(AccountProfile(error, error))
+    asyncio.run(directory.refresh())
+    assert directory.stale
+    assert len(directory) == 0
+
+
+def test_attach_applies_store_deltas():
+    """Account entities in the store are added, renamed and deleted"""
+    directory = AccountDirectory(AccountProfile([], []))
+    store = EntityStore()
+    store.load({'accounts': [account(2, "DEMO2")]})
+    directory.attach(store, urls.ENDPOINT.DEMO)
+    demo = directory.get(name="DEMO2")
+    assert demo.endpoint == urls.ENDPOINT.DEMO
+    store.apply({
+        'entityType': 'account', 'eventType': "Updated",
+        'entity': account(2, "RENAMED", "practice"),
+    })
+    assert directory.get(nickname="practice") is demo
+    assert directory.get(name="DEMO2") is None
+    store.apply({
+        'entityType': 'account', 'eventType': "Deleted", 'entity': account(2, "RENAMED"),
+    })
+    assert 2 not in directory
+    assert directory.get(nickname="practice") is None
@@ -0,0 +1,113 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Entity Store Tests            ##
+##-------------------------------##
+
+## Imports
+from profile.entities import EntityStore, singular
+
+
+## Functions
+def order(
+    id_: int, account_id: int = 1, contract_id: int = 5, status: str = "Working"
+) -> dict:
+    """Order entity"""
+    return {
+        'id': id_, 'accountId': account_id, 'contractId': contract_id, 'ordStatus': status
+    }
+
+
+def store_with_events() -> tuple[EntityStore, list[tuple[str, str, int]]]:
+    """Empty store recording (entity type, event type, id) of every change"""
+    store = EntityStore()
+    events = []
+    store.subscribe(lambda entity_type, event_type, entity: events.append(
+        (entity_type, event_type, entity['id'])
+    ))
+    return store, events
+
+
+def test_singular():
+    """Snapshot keys map to entity types"""
+    assert singular('orders') == 'order'
+    assert singular('orderStrategies') == 'orderStrategy'
+    assert singular('cashBalances') == 'cashBalance'
+    assert singular('positions') == 'position'
+
+
+def test_update_moves_index_bucket():
+    """An updated field moves the entity between index buckets"""
+    store, _ = store_with_events()
+    store.apply({'entityType': 'order', 'eventType': "Created", 'entity': order(1)})
+    store.apply({
+        'entityType': 'order', 'eventType': "Updated", 'entity': order(1, contract_id=6)
+    })
+    assert store.by('order', 'contractId', 5) == ()
+    assert [o['id'] for o in store.by('order', 'contractId', 6)] == [1]
+    assert 5 not in store._indexes['order']['contractId']
+
+
+def test_delete_drops_from_indexes():
+    """Deleted entities leave every index and empty buckets are removed"""
+    store, events = store_with_events()
+    store.apply({'entityType': 'order', 'eventType': "Created", 'entity': order(1)})
+    store.apply({'entityType': 'order', 'eventType': "Deleted", 'entity': {'id': 1}})
+    assert ('order', 1) not in store
+    assert store.by('order', 'accountId', 1) == ()
+    assert store._indexes['order']['accountId'] == {}
+    assert events == [('order', "Created", 1), ('order', "Deleted", 1)]
+
+
+def test_load_reconciles_snapshot():
+    """A snapshot notifies created, updated and removed entities only"""
+    store, events = store_with_events()
+    store.load({'orders': [order(1), order(2), order(3)]})
+    events.clear()
+    store.load({
+        'orders': [order(1), order(2, status="Filled"), order(4, contract_id=6)],
+        'userId': 1,
+    })
+    assert sorted(events) == [
+        ('order', "Created", 4), ('order', "Deleted", 3), ('order', "Updated", 2)
+    ]
+    assert sorted(o['id'] for o in store.by('order', 'contractId', 5)) == [1, 2]
+    assert [o['id'] for o in store.by('order', 'contractId', 6)] == [4]
+    assert [o['id'] for o in store.working_orders(account_id=1)] == [1, 4]
+
+
+def test_add_index_covers_stored_entities():
+    """A new index includes entities stored before it was added"""
+    store = EntityStore()
+    store.load({'cashBalances': [{'id': 1, 'accountId': 7}, {'id': 2, 'accountId': 8}]})
+    store.add_index('cashBalance', 'accountId')
+    assert [b['id'] for b in store.by('cashBalance', 'accountId', 7)] == [1]
+
+
+def test_net_position_and_working_orders():
+    """Position and order queries read from the indexes"""
+    store = EntityStore()
+    store.load({
+        'positions': [
+            {'id': 1, 'accountId': 1, 'contractId': 5, 'netPos': 2},
+            {'id': 2, 'accountId': 2, 'contractId': 5, 'netPos': -3},
+        ],
+        'orders': [order(1), order(2, status="Filled"), order(3, account_id=2)],
+    })
+    assert store.net_position(5) == -1
+    assert store.net_position(5, account_id=1) == 2
+    assert [o['id'] for o in store.working_orders(contract_id=5)] == [1, 3]
+    assert [o['id'] for o in store.working_orders(account_id=2, contract_id=5)] == [3]
+
+
+def test_clear_keeps_indexes_and_subscribers():
+    """Clearing drops entities but indexing and notification keep working"""
+    store, events = store_with_events()
+    store.load({'orders': [order(1)]})
+    store.clear()
+    assert store.all('order') == ()
+    assert store.by('order', 'accountId', 1) == ()
+    store.load({'orders': [order(2)]})
+    assert [o['id'] for o in store.by('order', 'accountId', 1)] == [2]
+    assert events[-1] == ('order', "Created", 2)
@@ -0,0 +1,129 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Inbound Frame Queue Tests     ##
+##-------------------------------##
+
+## Imports
+import asyncio
+
+import pytest
+
+from utils.inbound import OVERFLOW, FrameQueue
+
+
+## Functions
+def quotes(*quotes: tuple[int, float]) -> list[dict]:
+    """Frame of one md message with (contract id, bid) quotes"""
+    return [{'e': 'md', 'd': {'quotes': [
+        {'contractId': id_, 'timestamp': str(bid), 'entries': {'Bid': {'price': bid}}}
+        for id_, bid in quotes
+    ]}}]
+
+
+def props(id_: int) -> list[dict]:
+    """Frame of one props event"""
+    return [{'e': 'props', 'd': {'id': id_}}]
+
+
+def drain(queue: FrameQueue) -> list[list[dict]]:
+    """Every queued frame, oldest first"""
+    frames = []
+    while len(queue):
+        frames.append(queue.get_nowait()[0])
+    return frames
+
+
+def test_block_waits_for_reader():
+    """A full blocking queue holds the writer until a frame is read"""
+    async def main():
+        queue = FrameQueue(1, OVERFLOW.BLOCK)
+        await queue.put(props(1))
+        writer = asyncio.ensure_future(queue.put(props(2)))
+        await asyncio.sleep(0.01)
+        assert not writer.done()
+        first = await queue.get()
+        await writer
+        second = await queue.get()
+        return queue, [first[0], second[0]]
+    queue, frames = asyncio.run(main())
+    assert frames == [props(1), props(2)]
+    assert queue.stats['blocked'] == 1
+    assert queue.dropped == 0
+
+
+def test_drop_oldest_keeps_newest():
+    """A full drop-oldest queue discards its oldest frame for the new one"""
+    async def main():
+        queue = FrameQueue(2, OVERFLOW.DROP_OLDEST)
+        for id_ in range(4):
+            await queue.put(props(id_))
+        return queue
+    queue = asyncio.run(main())
+    assert drain(queue) == [props(2), props(3)]
+    assert queue.dropped == 2
+    assert queue.max_depth == 2
+
+
+def test_conflate_merges_quotes():
+    """A full conflating queue merges quotes into the queued quote of the contract"""
+    async def main():
+        queue = FrameQueue(1, OVERFLOW.CONFLATE)
+        await queue.put(quotes((1, 10.0)))
+        await queue.put(quotes((1, 10.25)))
+        return queue
+    queue = asyncio.run(main())
+    frames = drain(queue)
+    assert len(frames) == 1
+    quote = frames[0][0]['d']['quotes'][0]
+    assert quote['entries']['Bid']['price'] == 10.25
+    assert quote['timestamp'] == "10.25"
+    assert queue.conflated == 1
+    assert queue.dropped == 0
+
+
+def test_conflate_queues_the_rest():
+    """Quotes of unqueued contracts and other events still queue, dropping the oldest"""
+    async def main():
+        queue = FrameQueue(1, OVERFLOW.CONFLATE)
+        await queue.put(quotes((1, 10.0)))
+        await queue.put(quotes((1, 10.25), (2, 20.0)) + props(1))
+        return queue
+    queue = asyncio.run(main())
+    frames = drain(queue)
+    assert queue.conflated == 1
+    assert queue.dropped == 1
+    assert frames[0][0]['d']['quotes'] == [
+        {'contractId': 2, 'timestamp': "20.0", 'entries': {'Bid': {'price': 20.0}}}
+    ]
+    assert frames[0][1] == props(1)[0]
+
+
+def test_read_quote_not_conflated():
+    """Quotes already read are not merged into"""
+    async def main():
+        queue = FrameQueue(1, OVERFLOW.CONFLATE)
+        await queue.put(quotes((1, 10.0)))
+        read = queue.get_nowait()[0]
+        await queue.put(quotes((1, 10.25)))
+        await queue.put(quotes((1, 10.5)))
+        return queue, read
+    queue, read = asyncio.run(main())
+    assert read[0]['d']['quotes'][0]['entries']['Bid']['price'] == 10.0
+    assert drain(queue)[0][0]['d']['quotes'][0]['entries']['Bid']['price'] == 10.5
+
+
+def test_clear_counts_dropped():
+    """Clearing counts every queued frame as dropped"""
+    async def main():
+        queue = FrameQueue(4)
+        for id_ in range(3):
+            await queue.put(props(id_))
+        queue.clear()
+        return queue
+    queue = asyncio.run(main())
+    assert len(queue) == 0
+    assert queue.dropped == 3
+    with pytest.raises(IndexError):
+        queue.get_nowait()
@@ -0,0 +1,97 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Indicator Parity Tests        ##
+##-------------------------------##
+
+## Imports
+import numpy as np
+import pytest
+
+from market import (
+    ATR, BAR, EMA, RSI, VWAP, BarBuilder, BarSeries, IndicatorEngine, RollingStd
+)
+from market.bars import COLUMNS
+
+## Constants
+INDICATORS = (
+    lambda: EMA(9), VWAP, lambda: ATR(14), lambda: RSI(14), lambda: RollingStd(20),
+)
+
+
+## Functions
+def random_bars(count: int = 600, seed: int = 1) -> BarSeries:
+    """Random-walk bars on a 0.25 tick grid"""
+    rng = np.random.default_rng(seed)
+    bars = BarSeries(count)
+    close = 5000.0
+    for i in range(count):
+        open_ = close
+        close = open_ + 0.25 * rng.integers(-8, 9)
+        high = max(open_, close) + 0.25 * rng.integers(0, 4)
+        low = min(open_, close) - 0.25 * rng.integers(0, 4)
+        bars.append(60.0 * i, open_, high, low, close, float(rng.integers(1, 500)), 1)
+    return bars
+
+
+def incremental(indicator, bars: BarSeries, start: int = 0) -> np.ndarray:
+    """Indicator values updated bar by bar, as on every bar close"""
+    columns = [bars.column(name) for name in COLUMNS]
+    bar = BarSeries(1)
+    out = []
+    for i in range(start, len(bars)):
+        bar.append(*(column[i] for column in columns))
+        out.append(indicator.update_bar(bar))
+    return np.array(out)
+
+
+@pytest.mark.parametrize('factory', INDICATORS)
+def test_batch_matches_incremental(factory):
+    """Vectorized and bar by bar updates produce the same series"""
+    bars = random_bars()
+    batch, stepped = factory(), factory()
+    expected = batch.batch_bars(bars)
+    np.testing.assert_allclose(incremental(stepped, bars), expected, rtol=1e-9)
+    assert stepped.value == pytest.approx(batch.value, rel=1e-9)
+
+
+@pytest.mark.parametrize('factory', INDICATORS)
+def test_incremental_continues_batch(factory):
+    """Bar by bar updates pick up where a warm-up batch left off"""
+    bars = random_bars()
+    half = bars.view(len(bars) // 2)
+    full, warmed = factory(), factory()
+    expected = full.batch_bars(bars)
+    warmed.batch_bars(half)
+    resumed = incremental(warmed, bars, len(half))
+    np.testing.assert_allclose(resumed, expected[len(half):], rtol=1e-9)
+
+
+def test_engine_warm_up_then_bar_close():
+    """An attached engine warms up from closed bars and updates on each close"""
+    bars = random_bars(60)
+    builder = BarBuilder(BAR.TICK, 1, capacity=64)
+    reference = EMA(9)
+    for close in bars.close[:40]:
+        builder.update_tick(0.0, close, 1)
+        reference.update(close)
+    engine = IndicatorEngine(ema=EMA(9))
+    engine.attach(builder)
+    assert engine['ema'] == pytest.approx(reference.value)
+    for close in bars.close[40:]:
+        builder.update_tick(0.0, close, 1)
+        reference.update(close)
+    assert engine['ema'] == pytest.approx(reference.value)
+    engine.detach(builder)
+    builder.update_tick(0.0, 0.0, 1)
+    assert engine['ema'] == pytest.approx(reference.value)
+
+
+def test_reset_clears_state():
+    """A reset indicator computes as if new"""
+    bars = random_bars(100)
+    used, fresh = RSI(14), RSI(14)
+    used.batch_bars(bars)
+    used.reset()
+    np.testing.assert_allclose(used.batch_bars(bars), fresh.batch_bars(bars))
@@ -0,0 +1,89 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Order Book Tests              ##
+##-------------------------------##
+
+## Imports
+import pytest
+
+from market import OrderBook
+from utils import codec
+
+## Constants
+CONTRACT = 77
+
+
+## Functions
+def dom(bids: list[tuple[float, float]], offers: list[tuple[float, float]]):
+    """Typed DOM payload of the test contract, best level first"""
+    return codec.decode_dom({
+        'contractId': CONTRACT, 'timestamp': "2026-01-01T00:00:00Z",
+        'bids': [{'price': price, 'size': size} for price, size in bids],
+        'offers': [{'price': price, 'size': size} for price, size in offers],
+    })
+
+
+def test_best_levels_spread_and_mid():
+    """Top of book reads the first level of each side"""
+    book = OrderBook(CONTRACT)
+    book.apply(dom([(10.0, 4), (9.75, 6)], [(10.25, 2), (10.5, 8)]))
+    assert (book.best_bid, book.best_bid_size) == (10.0, 4)
+    assert (book.best_ask, book.best_ask_size) == (10.25, 2)
+    assert book.spread == 0.25
+    assert book.mid == 10.125
+    assert book.updates == 1
+
+
+def test_depth_and_imbalance():
+    """Cumulative depth and imbalance cover the requested levels"""
+    book = OrderBook(CONTRACT)
+    book.apply(dom([(10.0, 4), (9.75, 6)], [(10.25, 2), (10.5, 8)]))
+    assert book.bid_depth(1) == 4
+    assert book.bid_depth() == 10
+    assert book.ask_depth(5) == 10
+    assert book.imbalance(1) == pytest.approx(2 / 6)
+    assert book.imbalance() == 0.0
+
+
+def test_update_replaces_ladder():
+    """A shorter ladder replaces the previous levels"""
+    book = OrderBook(CONTRACT)
+    book.apply(dom([(10.0, 4), (9.75, 6)], [(10.25, 2)]))
+    book.apply(dom([(9.75, 1)], []))
+    assert book.best_bid == 9.75
+    assert book.bid_depth() == 1
+    assert book.best_ask is None
+    assert book.spread is None
+    assert book.ask_depth() == 0.0
+
+
+def test_depth_limit():
+    """Levels past the book depth are ignored"""
+    book = OrderBook(CONTRACT, depth=2)
+    book.apply(dom([(10.0, 1), (9.75, 1), (9.5, 1)], []))
+    assert book.bid_depth() == 2
+    assert len(book.view().bid_prices) == 2
+
+
+def test_view_is_zero_copy():
+    """Views read the book's arrays in place"""
+    book = OrderBook(CONTRACT)
+    book.apply(dom([(10.0, 4)], [(10.25, 2)]))
+    view = book.view()
+    assert list(view.bid_prices) == [10.0]
+    book.apply(dom([(10.5, 3)], [(10.75, 1)]))
+    assert list(view.bid_prices) == [10.5]
+    assert list(view.ask_sizes) == [1.0]
+
+
+def test_clear_empties_book():
+    """A cleared book has no levels until the next update"""
+    book = OrderBook(CONTRACT)
+    book.apply(dom([(10.0, 4)], [(10.25, 2)]))
+    book.clear()
+    assert book.best_bid is None
+    assert book.mid is None
+    assert book.timestamp is None
+    assert book.imbalance() == 0.0
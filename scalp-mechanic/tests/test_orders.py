@@ -0,0 +1,150 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Order Template Tests          ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+import json
+
+import pytest
+
+from profile.account import Account
+from profile.orders import OrderTemplate
+from profile.risk import REJECT
+from utils import urls
+from utils.errors import OrderException, RiskException
+
+## Constants
+HEAD = {
+    'accountSpec': "DEMO1", 'accountId': 1, 'symbol': "MESZ6",
+    'timeInForce': "Day", 'isAutomated': True,
+}
+
+
+## Classes
+class OrderSocket:
+    """Account WebSocket stand-in acknowledging every order request"""
+
+    # -Constructor
+    def __init__(self, status: int = 200) -> OrderSocket:
+        self.status: int = status
+        self.sent: list[tuple[str, dict]] = []
+
+    # -Instance Methods
+    async def request_encoded(self, url: str, body: str) -> dict:
+        '''Record the decoded body and acknowledge it'''
+        self.sent.append((url, json.loads(body)))
+        return {'s': self.status, 'd': {'orderId': len(self.sent)}}
+
+
+class RejectAll:
+    """Risk gate rejecting every order"""
+
+    # -Instance Methods
+    def check(self, *args, **kwargs) -> REJECT:
+        '''Always reject'''
+        return REJECT.ORDER_RATE
+
+
+## Functions
+def template(action: str = "Buy", order_type: str = "Market") -> OrderTemplate:
+    """Template of the demo account trading MESZ6"""
+    return OrderTemplate(1, "DEMO1", "MESZ6", action, order_type)
+
+
+def account(websocket: OrderSocket | None = None) -> Account:
+    """Demo account sending orders over websocket"""
+    return Account(1, 1, "DEMO1", None, urls.ENDPOINT.DEMO, websocket=websocket)
+
+
+@pytest.mark.parametrize('order_type, fields', [
+    ("Market", {}),
+    ("Limit", {'price': 5000.25}),
+    ("Stop", {'stopPrice': 4990.0}),
+    ("StopLimit", {'price': 4990.5, 'stopPrice': 4990.0}),
+])
+def test_order_body(order_type, fields):
+    """Order bodies carry only the price fields of their type"""
+    body = template("Sell", order_type).order(
+        2, price=fields.get('price'), stop_price=fields.get('stopPrice')
+    )
+    assert json.loads(body) == {
+        **HEAD, 'action': "Sell", 'orderType': order_type, 'orderQty': 2, **fields
+    }
+
+
+def test_oco_body():
+    """OCO bodies pair the limit order with a same side stop"""
+    body = json.loads(template("Buy", "Limit").oco(1, 4995.0, 5005.0))
+    assert body == {
+        **HEAD, 'action': "Buy", 'orderType': "Limit", 'orderQty': 1, 'price': 4995.0,
+        'other': {'action': "Buy", 'orderType': "Stop", 'stopPrice': 5005.0},
+    }
+
+
+def test_oso_brackets():
+    """OSO bodies add opposite side exits for the brackets given"""
+    both = json.loads(template().oso(1, take_profit=5010.0, stop_loss=4990.0))
+    assert both['bracket1'] == {'action': "Sell", 'orderType': "Limit", 'price': 5010.0}
+    assert both['bracket2'] == {
+        'action': "Sell", 'orderType': "Stop", 'stopPrice': 4990.0
+    }
+    stop_only = json.loads(template("Sell").oso(1, stop_loss=5010.0))
+    assert stop_only['bracket1'] == {
+        'action': "Buy", 'orderType': "Stop", 'stopPrice': 5010.0
+    }
+    assert 'bracket2' not in stop_only
+
+
+def test_template_validates_action_and_type():
+    """Unknown actions and order types are refused"""
+    with pytest.raises(ValueError):
+        template("Hold")
+    with pytest.raises(ValueError):
+        template("Buy", "Trailing")
+
+
+def test_account_caches_templates():
+    """Accounts build each template once and prepare builds them ahead of time"""
+    demo = account()
+    demo.prepare("MESZ6")
+    assert len(demo._templates) == 8
+    limit = demo.template("MESZ6", "Buy", "Limit")
+    assert demo.template("MESZ6", "Buy", "Limit") is limit
+    assert len(demo._templates) == 8
+
+
+def test_place_and_modify_send_bodies():
+    """Orders are sent pre-serialized and their acknowledgement latency recorded"""
+    websocket = OrderSocket()
+    demo = account(websocket)
+
+    async def main():
+        await demo.place_order("MESZ6", "Buy", 1, "Limit", price=5000.0)
+        return await demo.modify_order(1, 2, price=5000.25)
+    assert asyncio.run(main()) == {'orderId': 2}
+    (place_url, place), (modify_url, modify) = websocket.sent
+    assert place_url == urls.wss_order_place
+    assert place['price'] == 5000.0
+    assert modify_url == urls.wss_order_modify
+    assert modify == {
+        'orderId': 1, 'orderQty': 2, 'orderType': "Limit", 'price': 5000.25,
+        'isAutomated': True,
+    }
+    assert demo.latency.count == 2
+
+
+def test_rejections_raise():
+    """Risk rejections raise before sending and failed acknowledgements raise"""
+    rejected = account(OrderSocket())
+    rejected.risk = RejectAll()
+    with pytest.raises(RiskException):
+        asyncio.run(rejected.place_order("MESZ6", "Buy", 1))
+    assert rejected.websocket.sent == []
+    failing = account(OrderSocket(status=400))
+    with pytest.raises(OrderException):
+        asyncio.run(failing.place_order("MESZ6", "Buy", 1))
@@ -0,0 +1,198 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## P&L Engine Tests              ##
+##-------------------------------##
+
+## Imports
+from time import time
+
+import pytest
+
+from market import QuoteCache
+from profile.entities import EntityStore
+from profile.pnl import PnLEngine
+from utils import codec, trading_day, urls
+
+## Constants
+CONTRACT = 77
+SYMBOL = "MESZ6"
+# -MES: $5 per point, $1.60 round turn, so $0.80 per contract per fill
+POINT_VALUE = 5.0
+COMMISSION = 0.80
+_ids = iter(range(1, 1_000_000))
+
+
+## Functions
+def fill(action: str, qty: int, price: float, **fields) -> dict:
+    """Fill entity with a fresh id"""
+    return {
+        'id': next(_ids), 'contractId': CONTRACT, 'action': action,
+        'qty': qty, 'price': price, **fields
+    }
+
+
+def trade(quotes: QuoteCache, price: float) -> None:
+    """Quote a trade of the test contract"""
+    quotes.update(codec.decode_quote({
+        'contractId': CONTRACT, 'timestamp': "2026-01-01T00:00:00Z",
+        'entries': {'Trade': {'price': price, 'size': 1}},
+    }))
+
+
+def engine() -> PnLEngine:
+    """P&L engine knowing the test contract"""
+    pnl = PnLEngine()
+    pnl.add_contract(CONTRACT, SYMBOL)
+    return pnl
+
+
+def test_realized_on_partial_close():
+    """Closing part of a position realizes only the closed quantity"""
+    pnl = engine()
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 2, 5000.0))
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Sell", 1, 5010.0))
+    account = pnl.account(urls.ENDPOINT.DEMO, 1)
+    position = account.positions[CONTRACT]
+    assert position.net == 1
+    assert position.avg_price == 5000.0
+    assert account.realized == pytest.approx(10 * POINT_VALUE)
+    # -Fills keep the last mark, the rest is marked by trade quotes
+    assert account.unrealized == 0.0
+    assert account.commission == pytest.approx(3 * COMMISSION)
+    assert account.net == pytest.approx(50.0 - 3 * COMMISSION)
+
+
+def test_average_price_and_reversal():
+    """Adds average the entry, a reversal realizes the old side and re-enters"""
+    pnl = engine()
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 1, 5000.0))
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 1, 5004.0))
+    position = pnl.account(urls.ENDPOINT.DEMO, 1).positions[CONTRACT]
+    assert position.avg_price == pytest.approx(5002.0)
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Sell", 3, 4998.0))
+    assert position.net == -1
+    assert position.avg_price == 4998.0
+    assert position.realized == pytest.approx(2 * -4 * POINT_VALUE)
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 1, 4990.0))
+    assert position.net == 0
+    assert position.avg_price == 0.0
+    assert position.unrealized == 0.0
+    assert position.realized == pytest.approx(-40.0 + 8 * POINT_VALUE)
+    assert position.commission == pytest.approx(6 * COMMISSION)
+
+
+def test_quote_marks_unrealized():
+    """Trade quotes mark open positions of every account"""
+    pnl = engine()
+    quotes = QuoteCache()
+    quotes.subscribe(pnl.update_quote)
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 2, 5000.0))
+    pnl.apply_fill(urls.ENDPOINT.LIVE, 2, fill("Sell", 1, 5000.0))
+    trade(quotes, 4995.0)
+    assert pnl.account(urls.ENDPOINT.DEMO, 1).unrealized == pytest.approx(-50.0)
+    assert pnl.account(urls.ENDPOINT.LIVE, 2).unrealized == pytest.approx(25.0)
+
+
+def test_fill_applied_once():
+    """Repeated and inactive fills are ignored"""
+    pnl = engine()
+    first = fill("Buy", 1, 5000.0)
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, first)
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, first)
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 1, 5000.0, active=False))
+    assert pnl.account(urls.ENDPOINT.DEMO, 1).positions[CONTRACT].net == 1
+
+
+def test_fill_before_contract_is_deferred():
+    """Fills of an unknown contract are applied once it is registered"""
+    pnl = PnLEngine()
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 1, 5000.0))
+    assert not pnl.account(urls.ENDPOINT.DEMO, 1).positions
+    pnl.add_contract(CONTRACT, SYMBOL)
+    assert pnl.account(urls.ENDPOINT.DEMO, 1).positions[CONTRACT].net == 1
+
+
+def test_previous_day_fill_not_in_daily_totals():
+    """Fills from an earlier trading day count toward lifetime totals only"""
+    pnl = engine()
+    old = "2020-01-02T15:00:00Z"
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 1, 5000.0, timestamp=old))
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Sell", 1, 5010.0, timestamp=old))
+    account = pnl.account(urls.ENDPOINT.DEMO, 1)
+    assert account.realized == pytest.approx(50.0)
+    assert account.day_realized == 0.0
+    assert account.day_commission == 0.0
+    assert account.daily_net == 0.0
+
+
+def test_rollover_resets_daily_totals():
+    """The trading-day rollover zeroes daily P&L and rebases open positions"""
+    pnl = engine()
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 2, 5000.0))
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Sell", 1, 5010.0))
+    account = pnl.account(urls.ENDPOINT.DEMO, 1)
+    assert account.daily_net == pytest.approx(50.0 - 3 * COMMISSION)
+    account.positions[CONTRACT].update(5010.0)
+    today, rollover = trading_day(time())
+    assert account.roll(rollover)
+    assert account.day > today
+    assert account.day_realized == 0.0
+    assert account.day_commission == 0.0
+    assert account.daily_net == 0.0
+    account.positions[CONTRACT].update(5020.0)
+    assert account.daily_net == pytest.approx(10 * POINT_VALUE)
+    assert account.net == pytest.approx(50.0 + 100.0 - 3 * COMMISSION)
+
+
+def test_target_reached_on_daily_realized():
+    """The daily target counts realized P&L after commission"""
+    pnl = PnLEngine(target=40.0)
+    pnl.add_contract(CONTRACT, SYMBOL)
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 1, 5000.0))
+    account = pnl.account(urls.ENDPOINT.DEMO, 1)
+    account.positions[CONTRACT].update(5020.0)
+    assert not account.target_reached
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Sell", 1, 5010.0))
+    assert account.target_reached
+
+
+def test_fill_waits_for_its_order():
+    """Fills listed before their order in a snapshot are applied once it arrives"""
+    pnl = engine()
+    store = EntityStore()
+    pnl.attach(store, urls.ENDPOINT.DEMO)
+    store.load({
+        'fills': [fill("Buy", 1, 5000.0, orderId=9)],
+        'orders': [{'id': 9, 'accountId': 3, 'contractId': CONTRACT}],
+    })
+    assert pnl.account(urls.ENDPOINT.DEMO, 3).positions[CONTRACT].net == 1
+
+
+def test_carried_position_excluded_from_daily():
+    """Overnight P&L of positions carried into the day does not count toward it"""
+    pnl = engine()
+    quotes = QuoteCache()
+    quotes.subscribe(pnl.update_quote)
+    old = "2020-01-02T15:00:00Z"
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 1, 5000.0, timestamp=old))
+    account = pnl.account(urls.ENDPOINT.DEMO, 1)
+    trade(quotes, 4990.0)
+    assert account.net == pytest.approx(-50.0 - COMMISSION)
+    assert account.daily_net == 0.0
+    trade(quotes, 4980.0)
+    assert account.daily_net == pytest.approx(-50.0)
+
+
+def test_carried_position_rebased_by_todays_fill():
+    """Today's first fill on a carried position rebases it, so only later moves count"""
+    pnl = engine()
+    old = "2020-01-02T15:00:00Z"
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Buy", 2, 5000.0, timestamp=old))
+    pnl.apply_fill(urls.ENDPOINT.DEMO, 1, fill("Sell", 1, 4990.0))
+    account = pnl.account(urls.ENDPOINT.DEMO, 1)
+    assert account.day_realized == pytest.approx(-50.0)
+    assert account.daily_net == pytest.approx(-COMMISSION)
+    account.positions[CONTRACT].update(4980.0)
+    assert account.daily_net == pytest.approx(-50.0 - COMMISSION)
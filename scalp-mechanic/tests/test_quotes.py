@@ -0,0 +1,86 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Quote Cache Tests             ##
+##-------------------------------##
+
+## Imports
+from market import QuoteCache
+from utils import codec
+
+
+## Functions
+def quote(contract_id: int = 77, **entries: dict) -> codec.QuoteStruct:
+    """Typed quote payload with entries"""
+    return codec.decode_quote({
+        'contractId': contract_id, 'timestamp': "2026-01-01T00:00:00Z",
+        'entries': entries,
+    })
+
+
+def test_first_update_reports_every_field():
+    """The first quote of a contract reports all of its fields"""
+    cache = QuoteCache()
+    changed = cache.update(quote(
+        Bid={'price': 10.0, 'size': 4}, Offer={'price': 10.25, 'size': 2},
+        TotalTradeVolume={'size': 100},
+    ))
+    assert changed == {
+        'bid': 10.0, 'bid_size': 4, 'offer': 10.25, 'offer_size': 2, 'volume': 100
+    }
+    assert cache.get(77).bid == 10.0
+    assert 77 in cache
+
+
+def test_only_changed_fields_reported():
+    """Repeated values are left out of the change set"""
+    cache = QuoteCache()
+    cache.update(quote(Bid={'price': 10.0, 'size': 4}, Offer={'price': 10.25, 'size': 2}))
+    changed = cache.update(quote(
+        Bid={'price': 10.0, 'size': 5}, Offer={'price': 10.25, 'size': 2}
+    ))
+    assert changed == {'bid_size': 5}
+    assert cache.update(quote(Bid={'price': 10.0, 'size': 5})) == {}
+
+
+def test_subscribers_notified_on_change_only():
+    """Subscribers get changes, per-contract subscribers only their contract's"""
+    cache = QuoteCache()
+    every, single = [], []
+    cache.subscribe(lambda q, changed: every.append((q.contract_id, changed)))
+    cache.subscribe(lambda q, changed: single.append(changed), contract_id=78)
+    cache.update(quote(Trade={'price': 10.0, 'size': 1}))
+    cache.update(quote(Trade={'price': 10.0, 'size': 1}))
+    cache.update(quote(78, Trade={'price': 20.0, 'size': 1}))
+    assert every == [
+        (77, {'trade': 10.0, 'trade_size': 1}), (78, {'trade': 20.0, 'trade_size': 1})
+    ]
+    assert single == [{'trade': 20.0, 'trade_size': 1}]
+
+
+def test_unsubscribe_and_failing_subscriber():
+    """A failing subscriber does not stop others, unsubscribed ones are not called"""
+    cache = QuoteCache()
+    calls = []
+
+    def fail(q, changed):
+        raise ValueError(changed)
+    cache.subscribe(fail)
+    cache.subscribe(lambda q, changed: calls.append(changed))
+    cache.update(quote(Bid={'price': 1.0, 'size': 1}))
+    cache.unsubscribe(fail)
+    cache.update(quote(Bid={'price': 2.0, 'size': 1}))
+    assert calls == [{'bid': 1.0, 'bid_size': 1}, {'bid': 2.0}]
+
+
+def test_clear_reports_next_update_in_full():
+    """After a clear the next quote is a new full snapshot"""
+    cache = QuoteCache()
+    cache.update(quote(Bid={'price': 1.0, 'size': 1}))
+    first = cache.get(77)
+    cache.clear(77)
+    assert cache.get(77) is None
+    changed = cache.update(quote(Bid={'price': 1.0, 'size': 1}))
+    assert changed == {'bid': 1.0, 'bid_size': 1}
+    assert cache.get(77) is not first
@@ -0,0 +1,87 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tick Recorder Tests           ##
+##-------------------------------##
+
+## Imports
+from market.recorder import SIDE, TickReader, TickRecorder
+from utils import codec
+
+## Constants
+CONTRACT = 77
+TIMESTAMP = "2026-01-02T15:00:00.250Z"
+TIMESTAMP_NS = 1_767_366_000_250_000_000
+
+
+## Functions
+def dom(bids: list[tuple[float, float]], offers: list[tuple[float, float]]):
+    """Typed DOM payload of the test contract"""
+    return codec.decode_dom({
+        'contractId': CONTRACT, 'timestamp': TIMESTAMP,
+        'bids': [{'price': price, 'size': size} for price, size in bids],
+        'offers': [{'price': price, 'size': size} for price, size in offers],
+    })
+
+
+def test_quote_round_trip(tmp_path):
+    """Recorded quote entries read back as typed columns"""
+    with TickRecorder(tmp_path) as recorder:
+        recorder.record_quote(codec.decode_quote({
+            'contractId': CONTRACT, 'timestamp': TIMESTAMP, 'entries': {
+                'Trade': {'price': 5000.25, 'size': 2},
+                'Bid': {'price': 5000.0, 'size': 10},
+                'TotalTradeVolume': {'size': 1234},
+            },
+        }))
+    with TickReader(tmp_path) as reader:
+        assert len(reader) == 2
+        assert reader['timestamp'].tolist() == [TIMESTAMP_NS] * 2
+        assert reader['price'].tolist() == [5000.25, 5000.0]
+        assert reader['size'].tolist() == [2, 10]
+        assert reader['side'].tolist() == [SIDE.TRADE, SIDE.BID]
+        assert reader.contract(CONTRACT)['price'].tolist() == [5000.25, 5000.0]
+        assert len(reader.contract(1)['price']) == 0
+
+
+def test_dom_records_changed_levels(tmp_path):
+    """Ladder updates record changed levels only and removed levels with size 0"""
+    with TickRecorder(tmp_path) as recorder:
+        recorder.record_dom(dom([(10.0, 1), (9.75, 2)], [(10.25, 3)]))
+        recorder.record_dom(dom([(10.0, 1), (9.75, 5)], [(10.25, 3)]))
+        recorder.record_dom(dom([(9.75, 5)], [(10.25, 3), (10.5, 1)]))
+    with TickReader(tmp_path) as reader:
+        rows = list(zip(
+            reader['price'].tolist(), reader['size'].tolist(), reader['side'].tolist()
+        ))
+    assert rows == [
+        (10.0, 1, SIDE.DOM_BID), (9.75, 2, SIDE.DOM_BID), (10.25, 3, SIDE.DOM_ASK),
+        (9.75, 5, SIDE.DOM_BID),
+        (10.0, 0, SIDE.DOM_BID), (10.5, 1, SIDE.DOM_ASK),
+    ]
+
+
+def test_frames_round_trip(tmp_path):
+    """Raw frames read back in order with their receive times"""
+    with TickRecorder(tmp_path, flush_bytes=16) as recorder:
+        recorder.record_frame('a[{"e":"md","d":{}}]')
+        recorder.record_frame('h')
+    with TickReader(tmp_path) as reader:
+        frames = list(reader.frames())
+    assert [frame for _, frame in frames] == ['a[{"e":"md","d":{}}]', 'h']
+    assert frames[0][0] <= frames[1][0]
+
+
+def test_batches_appended_in_order(tmp_path):
+    """Rows flushed in several batches and sessions append in order"""
+    with TickRecorder(tmp_path, flush_rows=2) as recorder:
+        for price in (1.0, 2.0, 3.0):
+            recorder.record_dom(dom([(price, 1)], []))
+    with TickRecorder(tmp_path) as recorder:
+        recorder.record_dom(dom([(4.0, 1)], []))
+    with TickReader(tmp_path) as reader:
+        bids = reader['price'][reader['side'] == SIDE.DOM_BID]
+        assert bids[reader['size'][reader['side'] == SIDE.DOM_BID] > 0].tolist() == [
+            1.0, 2.0, 3.0, 4.0
+        ]
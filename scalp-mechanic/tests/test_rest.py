@@ -0,0 +1,135 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## REST Entity Client Tests      ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import aiohttp
+
+from profile.rest import EntityClient
+from utils import urls
+
+## Constants
+CONTRACTS = {1000 + i: {'id': 1000 + i, 'name': f"C{i}"} for i in range(10)}
+
+
+## Classes
+class EntitySession:
+    """Session stand-in answering entity GETs from CONTRACTS"""
+
+    # -Constructor
+    def __init__(self, error: Exception | None = None) -> EntitySession:
+        self.error: Exception | None = error
+        self.urls: list[str] = []
+
+    # -Instance Methods
+    async def get(self, url: str) -> dict | list[dict]:
+        '''Record url and answer it after yielding once'''
+        self.urls.append(url)
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        parts = urlsplit(url)
+        path, query = parts.path.rstrip('/'), parse_qs(parts.query)
+        if path.endswith('/items'):
+            ids = [int(id_) for id_ in query['ids'][0].split(',')]
+            return [CONTRACTS[id_] for id_ in ids if id_ in CONTRACTS]
+        if path.endswith('/find'):
+            found = [c for c in CONTRACTS.values() if c['name'] == query['name'][0]]
+            if not found:
+                raise aiohttp.ClientResponseError(None, (), status=404)
+            return found[0]
+        return list(CONTRACTS.values())
+
+
+## Functions
+def client(session: EntitySession, **kwargs) -> EntityClient:
+    """Live entity client over session"""
+    return EntityClient(session, urls.ENDPOINT.LIVE, **kwargs)
+
+
+def requested_ids(url: str) -> list[int]:
+    """Ids of an /items url"""
+    return [int(id_) for id_ in parse_qs(urlsplit(url).query)['ids'][0].split(',')]
+
+
+def test_lookups_in_window_share_one_request():
+    """Item lookups made together go out as one /items request, in order"""
+    session = EntitySession()
+    rest = client(session)
+
+    async def main():
+        return await asyncio.gather(
+            rest.item('contract', 1001), rest.items('contract', [1002, 1003]),
+        )
+    single, pair = asyncio.run(main())
+    assert single == CONTRACTS[1001]
+    assert pair == (CONTRACTS[1002], CONTRACTS[1003])
+    assert len(session.urls) == 1
+    assert requested_ids(session.urls[0]) == [1001, 1002, 1003]
+    assert (rest.requests, rest.lookups) == (1, 3)
+
+
+def test_duplicate_and_missing_ids():
+    """Repeated ids are fetched once and unknown ids resolve to None"""
+    session = EntitySession()
+    rest = client(session)
+    found = asyncio.run(rest.items('contract', [1001, 1001, 99]))
+    assert found == (CONTRACTS[1001], CONTRACTS[1001], None)
+    assert requested_ids(session.urls[0]) == [1001, 99]
+
+
+def test_full_batch_flushes_early():
+    """A batch reaching the batch size is sent without waiting for the window"""
+    session = EntitySession()
+    rest = client(session, window=60.0, batch_size=4)
+
+    async def main():
+        return await asyncio.wait_for(rest.items('contract', list(CONTRACTS)[:8]), 1.0)
+    found = asyncio.run(main())
+    assert found == tuple(CONTRACTS.values())[:8]
+    assert [len(requested_ids(url)) for url in session.urls] == [4, 4]
+
+
+def test_identical_gets_deduped_in_flight():
+    """Identical requests in flight share one response, later ones send again"""
+    session = EntitySession()
+    rest = client(session)
+
+    async def main():
+        first = await asyncio.gather(rest.list('contract'), rest.list('contract'))
+        return first, await rest.list('contract')
+    (a, b), c = asyncio.run(main())
+    assert a is b
+    assert c == a
+    assert len(session.urls) == 2
+    assert rest.requests == 2
+
+
+def test_find_missing_returns_none():
+    """Finding an unknown name returns None instead of raising"""
+    rest = client(EntitySession())
+    assert asyncio.run(rest.find('contract', "C3")) == CONTRACTS[1003]
+    assert asyncio.run(rest.find('contract', "ZZ")) is None
+
+
+def test_failed_batch_fails_every_lookup():
+    """A failed /items request raises in every waiting lookup and is not cached"""
+    session = EntitySession(ConnectionError("down"))
+    rest = client(session)
+
+    async def main():
+        return await asyncio.gather(
+            rest.item('contract', 1001), rest.item('contract', 1002),
+            return_exceptions=True,
+        )
+    assert all(isinstance(r, ConnectionError) for r in asyncio.run(main()))
+    session.error = None
+    assert asyncio.run(rest.item('contract', 1001)) == CONTRACTS[1001]
+    assert rest.requests == 2
@@ -0,0 +1,162 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Pre-Trade Risk Tests          ##
+##-------------------------------##
+
+## Imports
+from market import QuoteCache
+from profile.entities import EntityStore
+from profile.pnl import PnLEngine
+from profile.risk import REJECT, RiskGate, RiskLimits
+from utils import codec, urls
+
+## Constants
+CONTRACT = 77
+SYMBOL = "MESZ6"
+ACCOUNT = 1
+
+
+## Functions
+def gate(
+    orders: EntityStore | None = None, **limits
+) -> tuple[RiskGate, PnLEngine, QuoteCache]:
+    """Risk gate of a demo account trading the test contract, last trade at 5000"""
+    pnl = PnLEngine()
+    pnl.add_contract(CONTRACT, SYMBOL)
+    quotes = QuoteCache()
+    quotes.subscribe(pnl.update_quote)
+    risk = RiskGate(
+        pnl.account(urls.ENDPOINT.DEMO, ACCOUNT), quotes,
+        RiskLimits(**{'max_orders': 100, 'band_ticks': 4, **limits}), orders
+    )
+    risk.add_contract(CONTRACT, SYMBOL)
+    trade(quotes, 5000.0)
+    return risk, pnl, quotes
+
+
+def working(*orders: tuple[int, str, int]) -> EntityStore:
+    """Store of working (id, action, qty) orders of the test contract"""
+    store = EntityStore()
+    store.load({
+        'orders': [{
+            'id': id_, 'accountId': ACCOUNT, 'contractId': CONTRACT,
+            'action': action, 'ordStatus': "Working"
+        } for id_, action, _ in orders],
+        'orderVersions': [
+            {'id': 100 + id_, 'orderId': id_, 'orderQty': qty} for id_, _, qty in orders
+        ],
+    })
+    return store
+
+
+def trade(quotes: QuoteCache, price: float) -> None:
+    """Quote a trade of the test contract"""
+    quotes.update(codec.decode_quote({
+        'contractId': CONTRACT, 'timestamp': "2026-01-01T00:00:00Z",
+        'entries': {'Trade': {'price': price, 'size': 1}},
+    }))
+
+
+def test_accepts_order_within_limits():
+    """An order inside every limit passes"""
+    risk, _, _ = gate()
+    assert risk.check(SYMBOL, "Buy", 1) is None
+    assert risk.check(SYMBOL, "Sell", 1, 5001.0) is None
+    assert risk.checked == 2
+
+
+def test_rejects_unknown_contract():
+    """Symbols without a registered contract are rejected"""
+    risk, _, _ = gate()
+    assert risk.check("NQZ6", "Buy", 1) is REJECT.UNKNOWN_CONTRACT
+
+
+def test_rejects_without_quote():
+    """Opening orders need a last trade to check against"""
+    risk = RiskGate(PnLEngine().account(urls.ENDPOINT.DEMO, ACCOUNT), QuoteCache())
+    risk.add_contract(CONTRACT, SYMBOL)
+    assert risk.check(SYMBOL, "Buy", 1) is REJECT.NO_QUOTE
+
+
+def test_rejects_max_position():
+    """Orders growing the position past the limit are rejected"""
+    risk, pnl, _ = gate(max_position=2)
+    assert risk.check(SYMBOL, "Buy", 3) is REJECT.MAX_POSITION
+    pnl.apply_fill(urls.ENDPOINT.DEMO, ACCOUNT, {
+        'id': 1, 'contractId': CONTRACT, 'action': "Buy", 'qty': 2, 'price': 5000.0
+    })
+    assert risk.check(SYMBOL, "Buy", 1) is REJECT.MAX_POSITION
+    assert risk.check(SYMBOL, "Sell", 2) is None
+
+
+def test_rejects_invalid_qty():
+    """Zero and negative quantities are rejected before any other check"""
+    risk, _, _ = gate()
+    assert risk.check(SYMBOL, "Buy", 0) is REJECT.INVALID_QTY
+    assert risk.check("NQZ6", "Sell", -1) is REJECT.INVALID_QTY
+
+
+def test_max_position_counts_working_orders():
+    """Unfilled working orders on the same side count toward the position limit"""
+    store = working((1, "Buy", 2), (2, "Sell", 3))
+    risk, _, _ = gate(store, max_position=3)
+    assert risk.check(SYMBOL, "Buy", 1) is None
+    assert risk.check(SYMBOL, "Buy", 2) is REJECT.MAX_POSITION
+    store.apply({'entityType': 'fill', 'eventType': "Created", 'entity': {
+        'id': 9, 'orderId': 1, 'contractId': CONTRACT, 'qty': 1, 'active': True
+    }})
+    assert risk.check(SYMBOL, "Buy", 2) is None
+    assert risk.check(SYMBOL, "Sell", 1) is REJECT.MAX_POSITION
+
+
+def test_modify_checked_without_its_own_qty():
+    """Modifies are checked as their order at the new quantity and price"""
+    store = working((1, "Buy", 2), (2, "Buy", 1))
+    risk, _, _ = gate(store, max_position=3)
+    assert risk.check_modify(1, 2) is None
+    assert risk.check_modify(1, 3) is REJECT.MAX_POSITION
+    assert risk.check_modify(1, 1, 5010.0) is REJECT.PRICE_BAND
+    assert risk.check_modify(1, 0) is REJECT.INVALID_QTY
+    assert risk.check_modify(5, 1) is REJECT.UNKNOWN_ORDER
+
+
+def test_rejects_price_outside_band():
+    """Limit prices further than band_ticks from the last trade are rejected"""
+    risk, _, _ = gate()
+    assert risk.check(SYMBOL, "Buy", 1, 5001.25) is REJECT.PRICE_BAND
+    assert risk.check(SYMBOL, "Buy", 1, 4999.0) is None
+
+
+def test_rejects_order_rate():
+    """Orders past max_orders within the window are rejected"""
+    risk, _, _ = gate(max_orders=3, rate_window=60.0)
+    assert [risk.check(SYMBOL, "Buy", 1) for _ in range(3)] == [None] * 3
+    assert risk.check(SYMBOL, "Buy", 1) is REJECT.ORDER_RATE
+
+
+def test_rejects_opening_after_daily_loss():
+    """Past the daily loss limit only reducing orders pass"""
+    risk, pnl, quotes = gate(max_daily_loss=100.0)
+    pnl.apply_fill(urls.ENDPOINT.DEMO, ACCOUNT, {
+        'id': 1, 'contractId': CONTRACT, 'action': "Buy", 'qty': 2, 'price': 5000.0
+    })
+    trade(quotes, 4990.0)
+    assert risk.pnl.daily_net < -100.0
+    assert risk.check(SYMBOL, "Buy", 1) is REJECT.DAILY_LOSS
+    assert risk.check(SYMBOL, "Sell", 5) is REJECT.DAILY_LOSS
+    assert risk.check(SYMBOL, "Sell", 1) is None
+
+
+def test_rejections_counted():
+    """Stats count checks and every rejection reason"""
+    risk, _, _ = gate(max_position=1)
+    risk.check(SYMBOL, "Buy", 2)
+    risk.check("NQZ6", "Buy", 1)
+    risk.check(SYMBOL, "Buy", 1)
+    stats = risk.stats
+    assert stats['checked'] == 3
+    assert stats[REJECT.MAX_POSITION.value] == 1
+    assert stats[REJECT.UNKNOWN_CONTRACT.value] == 1
+    assert stats[REJECT.DAILY_LOSS.value] == 0
@@ -0,0 +1,131 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Event Router Tests            ##
+##-------------------------------##
+
+## Imports
+import asyncio
+
+import pytest
+
+from utils.codec import DOMStruct, QuoteStruct
+from utils.router import Router
+
+## Constants
+QUOTE = {'contractId': 1, 'timestamp': "2026-01-01T00:00:00Z", 'entries': {}}
+DOM = {'contractId': 1, 'timestamp': "2026-01-01T00:00:00Z", 'bids': [], 'offers': []}
+
+
+## Functions
+@pytest.fixture
+def router() -> Router:
+    """Router on its own event loop, closed after the test"""
+    loop = asyncio.new_event_loop()
+    yield Router(loop=loop)
+    loop.close()
+
+
+def md_frame(**data) -> list[dict]:
+    """WebSocket frame with a single md event message"""
+    return [{'e': 'md', 'd': data}]
+
+
+def test_md_items_routed_as_typed_structs(router):
+    """Each md quote and DOM is routed on its own, decoded into its struct"""
+    quotes, doms, histograms = [], [], []
+    router.register('quote', quotes.append)
+    router.register('dom', doms.append)
+    router.register('histogram', histograms.append)
+    router.route_frame(md_frame(quotes=[QUOTE, {**QUOTE, 'contractId': 2}], doms=[DOM]))
+    router.route_frame(md_frame(histograms=[{'contractId': 1}]))
+    assert [quote.contractId for quote in quotes] == [1, 2]
+    assert all(isinstance(quote, QuoteStruct) for quote in quotes)
+    assert isinstance(doms[0], DOMStruct)
+    assert histograms == [{'contractId': 1}]
+
+
+def test_events_and_charts_routed(router):
+    """Plain events route their data, chart events route each chart"""
+    props, charts = [], []
+    router.register('props', props.append)
+    router.register('chart', charts.append)
+    router.route_frame([
+        {'e': 'props', 'd': {'entityType': 'order'}},
+        {'e': 'chart', 'd': {'charts': [{'id': 1}, {'id': 2}]}},
+        {'s': 200, 'i': 4},
+    ])
+    assert props == [{'entityType': 'order'}]
+    assert charts == [{'id': 1}, {'id': 2}]
+
+
+def test_coroutine_handlers_run_in_order():
+    """A frame's coroutine handlers are awaited in order in one task"""
+    calls = []
+
+    async def on_quote(quote):
+        calls.append(('quote', quote.contractId))
+
+    async def on_props(props):
+        calls.append(('props', props))
+
+    async def main():
+        router = Router(loop=asyncio.get_running_loop())
+        router.register('quote', on_quote)
+        router.register('props', on_props)
+        task = router.route_frame(md_frame(quotes=[QUOTE]) + [{'e': 'props', 'd': 1}])
+        await task
+    asyncio.run(main())
+    assert calls == [('quote', 1), ('props', 1)]
+
+
+def test_handler_errors_counted_not_raised(router):
+    """A failing handler is counted and later handlers still run"""
+    calls = []
+
+    def fail(payload):
+        raise ValueError(payload)
+    router.register('clock', fail)
+    router.register('clock', calls.append)
+    router.route_frame([{'e': 'clock', 'd': 1}])
+    assert calls == [1]
+    name = 'test_handler_errors_counted_not_raised.<locals>.fail'
+    assert router.stats[name].errors == 1
+
+
+def test_register_once_and_unknown_event(router):
+    """Repeated registration is ignored and unknown events are refused"""
+    calls = []
+    router.register('clock', calls.append)
+    router.register('clock', calls.append)
+    router.emit('clock', 1)
+    assert calls == [1]
+    with pytest.raises(ValueError):
+        router.register('tick', calls.append)
+
+
+def test_stats_unique_per_handler(router):
+    """Handlers sharing a qualified name keep separate stats"""
+    first, second = [], []
+    router.register('clock', lambda payload: first.append(payload))
+    router.register('clock', lambda payload: second.append(payload))
+    router.emit('clock', 1)
+    stats = router.stats
+    assert len(stats) == 2
+    assert [s.calls for s in stats.values()] == [1, 1]
+    assert first == second == [1]
+
+
+def test_unregister_drops_stats_with_last_event(router):
+    """Stats are kept while a handler is registered for any event"""
+    calls = []
+    router.register('clock', calls.append)
+    router.register('props', calls.append)
+    router.unregister('clock', calls.append)
+    assert len(router.stats) == 1
+    router.emit('clock', 1)
+    router.emit('props', 2)
+    assert calls == [2]
+    router.unregister('props', calls.append)
+    assert router.stats == {}
@@ -0,0 +1,238 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Request Scheduler Tests       ##
+##-------------------------------##
+
+## Imports
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from time import monotonic
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from profile.scheduler import (
+    LANE, MAX_PENALTIES, PENALTY_DELAY, RequestScheduler, TokenBucket,
+    endpoint_class, retry_after
+)
+from profile.session import Session
+
+
+## Functions
+def too_many_requests(retry: str | None = None) -> aiohttp.ClientResponseError:
+    """HTTP 429 error with an optional Retry-After header"""
+    headers = {'Retry-After': retry} if retry is not None else {}
+    return aiohttp.ClientResponseError(None, (), status=429, headers=headers)
+
+
+def test_penalty_ticket_retried_after_p_time():
+    """A p-ticket response is retried with its ticket once p-time has passed"""
+    scheduler = RequestScheduler()
+    tickets = []
+
+    async def call(ticket):
+        tickets.append(ticket)
+        if ticket is None:
+            return {'p-ticket': "T1", 'p-time': 0.05}
+        return {'ok': True}
+
+    async def main():
+        start = monotonic()
+        result = await scheduler.submit('order', call)
+        return result, monotonic() - start
+    result, elapsed = asyncio.run(main())
+    assert result == {'ok': True}
+    assert tickets == [None, "T1"]
+    assert scheduler.penalties == 1
+    assert elapsed >= 0.05
+
+
+def test_captcha_penalty_not_retried():
+    """A p-captcha response is returned instead of retried"""
+    scheduler = RequestScheduler()
+    calls = []
+
+    async def call(ticket):
+        calls.append(ticket)
+        return {'p-ticket': "T1", 'p-time': 0, 'p-captcha': True}
+    result = asyncio.run(scheduler.submit('auth', call))
+    assert result['p-captcha']
+    assert calls == [None]
+    assert scheduler.penalties == 0
+
+
+def test_429_retried_after_retry_after():
+    """HTTP 429 is retried once its Retry-After has passed"""
+    scheduler = RequestScheduler()
+    calls = []
+
+    async def call(ticket):
+        calls.append(ticket)
+        if len(calls) == 1:
+            raise too_many_requests("0.05")
+        return "done"
+
+    async def main():
+        start = monotonic()
+        result = await scheduler.submit('contract', call)
+        return result, monotonic() - start
+    result, elapsed = asyncio.run(main())
+    assert result == "done"
+    assert len(calls) == 2
+    assert elapsed >= 0.05
+
+
+def test_429_raised_after_max_penalties():
+    """Persistent 429 responses are raised once the retries run out"""
+    scheduler = RequestScheduler()
+    calls = []
+
+    async def call(ticket):
+        calls.append(ticket)
+        raise too_many_requests("0")
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(scheduler.submit('order', call))
+    assert len(calls) == MAX_PENALTIES + 1
+    assert scheduler.penalties == MAX_PENALTIES
+
+
+def test_other_errors_not_retried():
+    """Errors other than 429 propagate on the first attempt"""
+    scheduler = RequestScheduler()
+    calls = []
+
+    async def call(ticket):
+        calls.append(ticket)
+        raise aiohttp.ClientResponseError(None, (), status=500)
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(scheduler.submit('order', call))
+    assert len(calls) == 1
+    assert scheduler.stats['inflight'] == 0
+
+
+def test_penalty_pauses_only_its_endpoint_class():
+    """A penalized class holds its own requests, other classes keep flowing"""
+    scheduler = RequestScheduler()
+
+    async def call(ticket):
+        return monotonic()
+
+    async def main():
+        start = monotonic()
+        scheduler.pause('order', 0.1)
+        order, account = await asyncio.gather(
+            scheduler.submit('order', call), scheduler.submit('account', call)
+        )
+        return order - start, account - start
+    order, account = asyncio.run(main())
+    assert order >= 0.1
+    assert account < 0.1
+
+
+def test_waiting_requests_dispatched_by_lane():
+    """Queued requests start in lane order once a slot frees"""
+    scheduler = RequestScheduler(max_inflight=1)
+    started = []
+
+    async def main():
+        release = asyncio.Event()
+
+        async def hold(ticket):
+            await release.wait()
+
+        def record(name):
+            async def call(ticket):
+                started.append(name)
+            return call
+        holder = asyncio.ensure_future(scheduler.submit('contract', hold))
+        await asyncio.sleep(0)
+        waiting = [
+            asyncio.ensure_future(scheduler.submit(class_, record(class_)))
+            for class_ in ('contract', 'account', 'order', 'auth')
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, *waiting)
+    asyncio.run(main())
+    assert started == ['auth', 'order', 'account', 'contract']
+
+
+def test_lane_rate_limit():
+    """A configured lane rate spaces requests past its burst"""
+    scheduler = RequestScheduler(rates={LANE.BULK: (20.0, 1)})
+
+    async def call(ticket):
+        return monotonic()
+
+    async def main():
+        return await asyncio.gather(*(
+            scheduler.submit('contract', call) for _ in range(3)
+        ))
+    times = asyncio.run(main())
+    assert times[2] - times[0] >= 0.09
+
+
+def test_token_bucket_without_rate_only_pauses():
+    """A bucket without a rate never delays unless paused"""
+    bucket = TokenBucket()
+    for _ in range(100):
+        assert bucket.delay(monotonic()) == 0.0
+        bucket.take()
+    bucket.pause(10.0)
+    assert bucket.delay(monotonic()) > 9.0
+
+
+def test_retry_after_forms():
+    """Retry-After accepts seconds and HTTP-dates, falling back to the penalty delay"""
+    assert retry_after("3") == 3.0
+    assert retry_after("-1") == 0.0
+    assert retry_after(None) == PENALTY_DELAY
+    assert retry_after("soon") == PENALTY_DELAY
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25.0 < retry_after(format_datetime(future, usegmt=True)) <= 30.0
+    past = datetime.now(timezone.utc) - timedelta(seconds=30)
+    assert retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_endpoint_class():
+    """Endpoint class is the first path segment after /v1/"""
+    assert endpoint_class("https://live.tradovateapi.com/v1/order/placeorder") == 'order'
+    assert endpoint_class("https://live.tradovateapi.com/v1/auth/me") == 'auth'
+
+
+def test_session_get_passes_arguments_through():
+    """Session.get forwards aiohttp arguments through the scheduler"""
+    async def echo(request):
+        return web.json_response({
+            'query': dict(request.query), 'test': request.headers.get('X-Test'),
+            'authorization': request.headers.get('Authorization'),
+        })
+
+    async def main():
+        app = web.Application()
+        app.router.add_get('/v1/auth/me', echo)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        session = Session(loop=asyncio.get_running_loop())
+        await asyncio.sleep(0)
+        session._headers = {'AUTHORIZATION': "Bearer token"}
+        try:
+            return await session.get(
+                f"http://127.0.0.1:{port}/v1/auth/me",
+                params={'id': 1}, headers={'X-Test': "yes"}
+            ), session.scheduler.stats
+        finally:
+            await session.close()
+            await runner.cleanup()
+    result, stats = asyncio.run(main())
+    assert result == {
+        'query': {'id': "1"}, 'test': "yes", 'authorization': "Bearer token"
+    }
+    assert stats['inflight'] == 0
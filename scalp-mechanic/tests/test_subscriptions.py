@@ -0,0 +1,109 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Subscription Manager Tests    ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+
+from market.subscriptions import FEED, SubscriptionManager
+from utils import urls
+
+
+## Classes
+class FakeWebSocket:
+    """WebSocket answering (un)subscribe requests after a short delay"""
+
+    # -Constructor
+    def __init__(self, failing: set[str] = frozenset()) -> FakeWebSocket:
+        self.failing: set[str] = set(failing)
+        self.requests: list[tuple[str, str]] = []
+
+    # -Instance Methods
+    async def request(self, url: str, body: dict) -> dict:
+        '''Record the request and fail it for failing symbols'''
+        self.requests.append((url, body['symbol']))
+        await asyncio.sleep(0.01)
+        return {'s': 500 if body['symbol'] in self.failing else 200}
+
+
+## Functions
+def test_shared_feed_requested_once():
+    """Concurrent consumers of a feed share one subscribe request"""
+    websocket = FakeWebSocket()
+    manager = SubscriptionManager(websocket)
+
+    async def main():
+        return await asyncio.gather(
+            manager.subscribe(("ESZ6",), (FEED.QUOTE,)),
+            manager.subscribe(("ESZ6",), (FEED.QUOTE,)),
+        )
+    assert asyncio.run(main()) == [True, True]
+    assert websocket.requests == [(urls.wss_market_sub, "ESZ6")]
+    assert manager.count("ESZ6", FEED.QUOTE) == 2
+
+
+def test_unsubscribe_on_last_reference():
+    """Only releasing the last reference sends an unsubscribe"""
+    websocket = FakeWebSocket()
+    manager = SubscriptionManager(websocket)
+
+    async def main():
+        await manager.subscribe(("ESZ6",), (FEED.DOM,))
+        await manager.subscribe(("ESZ6",), (FEED.DOM,))
+        await manager.unsubscribe(("ESZ6",), (FEED.DOM,))
+        assert len(websocket.requests) == 1
+        assert manager.count("ESZ6", FEED.DOM) == 1
+        return await manager.unsubscribe(("ESZ6",), (FEED.DOM,))
+    assert asyncio.run(main())
+    assert websocket.requests[-1] == (urls.wss_market_dom_usub, "ESZ6")
+    assert ("ESZ6", FEED.DOM) not in manager
+
+
+def test_failed_subscribe_drops_only_its_references():
+    """A failed subscribe releases the references that waited on it, not later ones"""
+    websocket = FakeWebSocket(failing={"NQZ6"})
+    manager = SubscriptionManager(websocket)
+
+    async def main():
+        first = asyncio.ensure_future(manager.subscribe(("NQZ6",), (FEED.QUOTE,)))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(manager.subscribe(("NQZ6",), (FEED.QUOTE,)))
+        results = await asyncio.gather(first, second)
+        assert ("NQZ6", FEED.QUOTE) not in manager
+        websocket.failing.clear()
+        results.append(await manager.subscribe(("NQZ6",), (FEED.QUOTE,)))
+        return results
+    assert asyncio.run(main()) == [False, False, True]
+    assert manager.count("NQZ6", FEED.QUOTE) == 1
+    assert len(websocket.requests) == 2
+
+
+def test_failure_keeps_other_feeds():
+    """One failing feed leaves the caller's other feeds subscribed"""
+    websocket = FakeWebSocket(failing={"NQZ6"})
+    manager = SubscriptionManager(websocket)
+    result = asyncio.run(manager.subscribe(("ESZ6", "NQZ6"), (FEED.QUOTE, FEED.DOM)))
+    assert not result
+    assert manager.subscriptions == {("ESZ6", FEED.QUOTE): 1, ("ESZ6", FEED.DOM): 1}
+
+
+def test_resubscribe_queued_behind_unsubscribe():
+    """A subscribe during a pending unsubscribe is sent after it"""
+    websocket = FakeWebSocket()
+    manager = SubscriptionManager(websocket)
+
+    async def main():
+        await manager.subscribe(("ESZ6",), (FEED.QUOTE,))
+        return await asyncio.gather(
+            manager.unsubscribe(("ESZ6",), (FEED.QUOTE,)),
+            manager.subscribe(("ESZ6",), (FEED.QUOTE,)),
+        )
+    assert asyncio.run(main()) == [True, True]
+    assert [url for url, _ in websocket.requests] == [
+        urls.wss_market_sub, urls.wss_market_usub, urls.wss_market_sub
+    ]
+    assert manager.count("ESZ6", FEED.QUOTE) == 1
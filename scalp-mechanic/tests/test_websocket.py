@@ -0,0 +1,140 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## WebSocket Request Tests       ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+import json
+
+import aiohttp
+import pytest
+
+from profile.session import WebSocket
+from utils.errors import WebSocketClosedException
+
+
+## Classes
+class FakeSocket:
+    """aiohttp WebSocket stand-in replaying queued frames"""
+
+    # -Constructor
+    def __init__(self) -> FakeSocket:
+        self.closed: bool = False
+        self.sent: list[str] = []
+        self._frames: asyncio.Queue = asyncio.Queue()
+        self._frames.put_nowait('o')
+
+    # -Instance Methods
+    async def close(self) -> None:
+        '''Close and wake any pending receive'''
+        self.closed = True
+        self._frames.put_nowait(None)
+
+    def reply(self, *messages: dict) -> None:
+        '''Queue an 'a' frame of messages'''
+        self._frames.put_nowait('a' + json.dumps(list(messages)))
+
+    async def receive(self) -> aiohttp.WSMessage:
+        '''Next frame, or a closed message once closed'''
+        data = await self._frames.get()
+        if data is None:
+            return aiohttp.WSMessage(aiohttp.WSMsgType.CLOSED, None, None)
+        return aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, data, None)
+
+    async def receive_str(self) -> str:
+        '''Next frame text'''
+        return (await self.receive()).data
+
+    async def send_str(self, data: str) -> None:
+        '''Record a sent request'''
+        self.sent.append(data)
+
+    def request_ids(self) -> list[int]:
+        '''Ids of the sent requests in order'''
+        return [int(data.split('\n')[1]) for data in self.sent]
+
+
+## Functions
+async def connected() -> tuple[WebSocket, FakeSocket]:
+    """WebSocket over a fake socket past its open handshake"""
+    socket = FakeSocket()
+    websocket = WebSocket("ws://test", socket, loop=asyncio.get_running_loop())
+    await websocket.wait_connected()
+    return websocket, socket
+
+
+def test_replies_matched_by_id():
+    """Out of order replies resolve the request with the same id"""
+    async def main():
+        websocket, socket = await connected()
+        first = asyncio.ensure_future(websocket.request("md/subscribeQuote"))
+        second = asyncio.ensure_future(websocket.request("md/subscribeDOM"))
+        await asyncio.sleep(0)
+        one, two = socket.request_ids()
+        socket.reply({'s': 200, 'i': two, 'd': "dom"}, {'s': 200, 'i': one, 'd': "quote"})
+        assert await websocket.poll_message() == []
+        result = await asyncio.gather(first, second)
+        await websocket.close()
+        return result
+    first, second = asyncio.run(main())
+    assert first['d'] == "quote"
+    assert second['d'] == "dom"
+
+
+def test_events_returned_beside_replies():
+    """Uncorrelated event messages are returned from poll_message"""
+    async def main():
+        websocket, socket = await connected()
+        request = asyncio.ensure_future(websocket.request("user/syncrequest"))
+        await asyncio.sleep(0)
+        socket.reply({'e': 'props', 'd': 1}, {'s': 200, 'i': socket.request_ids()[0]})
+        messages = await websocket.poll_message()
+        reply = await request
+        await websocket.close()
+        return messages, reply
+    messages, reply = asyncio.run(main())
+    assert messages == [{'e': 'props', 'd': 1}]
+    assert reply['s'] == 200
+
+
+def test_timeout_forgets_request():
+    """A request timing out is removed from the pending table"""
+    async def main():
+        websocket, _ = await connected()
+        with pytest.raises(asyncio.TimeoutError):
+            await websocket.request("md/subscribeQuote", body={'symbol': 1}, timeout=0.01)
+        pending = dict(websocket._pending)
+        await websocket.close()
+        return pending
+    assert asyncio.run(main()) == {}
+
+
+def test_close_fails_pending_requests():
+    """Closing the socket fails requests still waiting on a reply"""
+    async def main():
+        websocket, _ = await connected()
+        request = asyncio.ensure_future(websocket.request("md/subscribeQuote"))
+        await asyncio.sleep(0)
+        await websocket.close()
+        with pytest.raises(WebSocketClosedException):
+            await request
+    asyncio.run(main())
+
+
+def test_disconnect_fails_pending_requests():
+    """A closed frame fails pending requests and raises from poll_message"""
+    async def main():
+        websocket, socket = await connected()
+        request = asyncio.ensure_future(websocket.request("md/subscribeQuote"))
+        await asyncio.sleep(0)
+        await socket.close()
+        with pytest.raises(WebSocketClosedException):
+            await websocket.poll_message()
+        with pytest.raises(WebSocketClosedException):
+            await request
+        await websocket.close()
+    asyncio.run(main())
@@ -6,7 +6,13 @@
 ##-------------------------------##
 
 ## Imports
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+## Constants
+# -CME Globex trading day rolls over at 17:00 Chicago time
+SESSION_ZONE = ZoneInfo("America/Chicago")
+SESSION_ROLLOVER = time(17)
 
 
 ## Functions
@@ -15,3 +21,18 @@ def timestamp_to_datetime(
 ) -> datetime:
     """Converts timestamp string into a datetime object"""
     return datetime.strptime(timestamp, timestring)
+
+
+def timestamp_to_seconds(timestamp: str) -> float:
+    """Converts ISO timestamp string into POSIX seconds"""
+    return datetime.fromisoformat(timestamp).timestamp()
+
+
+def trading_day(seconds: float) -> tuple[date, float]:
+    """Trading day of POSIX seconds and the POSIX seconds it rolls over at"""
+    now = datetime.fromtimestamp(seconds, SESSION_ZONE)
+    day = now.date()
+    if now.time() >= SESSION_ROLLOVER:
+        day += timedelta(days=1)
+    rollover = datetime.combine(day, SESSION_ROLLOVER, SESSION_ZONE)
+    return day, rollover.timestamp()
@@ -0,0 +1,143 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## JSON Codec                    ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import json
+from typing import Any, Callable
+
+from utils.typing import DOMDict, QuoteDict
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+## Constants
+BACKENDS: tuple[str] = tuple(
+    name for name, module in (('msgspec', msgspec), ('orjson', orjson), ('json', json))
+    if module is not None
+)
+loads: Callable[[str | bytes], Any] = json.loads
+dumps: Callable[[Any], str] = json.dumps
+backend: str = 'json'
+
+
+## Classes
+if msgspec is not None:
+    class PriceLevel(msgspec.Struct):
+        """Tradovate DOM/quote price level"""
+        price: float = 0.0
+        size: float = 0.0
+
+    class QuoteStruct(msgspec.Struct):
+        """Tradovate quote payload"""
+        contractId: int
+        timestamp: str
+        entries: dict[str, PriceLevel]
+
+    class DOMStruct(msgspec.Struct):
+        """Tradovate DOM payload"""
+        contractId: int
+        timestamp: str
+        bids: list[PriceLevel]
+        offers: list[PriceLevel]
+else:
+    class PriceLevel:
+        """Tradovate DOM/quote price level"""
+        __slots__ = ('price', 'size')
+
+        # -Constructor
+        def __init__(self, price: float = 0.0, size: float = 0.0) -> PriceLevel:
+            self.price: float = price
+            self.size: float = size
+
+        # -Dunder Methods
+        def __repr__(self) -> str:
+            return f"PriceLevel(price={self.price}, size={self.size})"
+
+    class QuoteStruct:
+        """Tradovate quote payload"""
+        __slots__ = ('contractId', 'timestamp', 'entries')
+
+        # -Constructor
+        def __init__(
+            self, contractId: int, timestamp: str, entries: dict[str, PriceLevel]
+        ) -> QuoteStruct:
+            self.contractId: int = contractId
+            self.timestamp: str = timestamp
+            self.entries: dict[str, PriceLevel] = entries
+
+        # -Dunder Methods
+        def __repr__(self) -> str:
+            return f"QuoteStruct(contractId={self.contractId}, timestamp={self.timestamp})"
+
+    class DOMStruct:
+        """Tradovate DOM payload"""
+        __slots__ = ('contractId', 'timestamp', 'bids', 'offers')
+
+        # -Constructor
+        def __init__(
+            self, contractId: int, timestamp: str,
+            bids: list[PriceLevel], offers: list[PriceLevel]
+        ) -> DOMStruct:
+            self.contractId: int = contractId
+            self.timestamp: str = timestamp
+            self.bids: list[PriceLevel] = bids
+            self.offers: list[PriceLevel] = offers
+
+        # -Dunder Methods
+        def __repr__(self) -> str:
+            return f"DOMStruct(contractId={self.contractId}, timestamp={self.timestamp})"
+
+
+## Functions
+def decode_dom(dom: DOMDict) -> DOMStruct:
+    """Convert decoded DOM dictionary into a typed DOM struct"""
+    if msgspec is not None:
+        return msgspec.convert(dom, DOMStruct)
+    return DOMStruct(
+        dom['contractId'], dom['timestamp'],
+        [PriceLevel(level['price'], level['size']) for level in dom['bids']],
+        [PriceLevel(level['price'], level['size']) for level in dom['offers']],
+    )
+
+
+def decode_quote(quote: QuoteDict) -> QuoteStruct:
+    """Convert decoded quote dictionary into a typed quote struct"""
+    if msgspec is not None:
+        return msgspec.convert(quote, QuoteStruct)
+    return QuoteStruct(
+        quote['contractId'], quote['timestamp'], {
+            name: PriceLevel(entry.get('price', 0.0), entry.get('size', 0.0))
+            for name, entry in quote['entries'].items()
+        }
+    )
+
+
+def use(name: str) -> None:
+    """Select JSON backend used by loads/dumps"""
+    global loads, dumps, backend
+    if name not in BACKENDS:
+        raise ValueError(f"JSON backend '{name}' is not available")
+    if name == 'msgspec':
+        decoder, encoder = msgspec.json.Decoder(), msgspec.json.Encoder()
+        loads = decoder.decode
+        dumps = lambda obj: encoder.encode(obj).decode()
+    elif name == 'orjson':
+        loads = orjson.loads
+        dumps = lambda obj: orjson.dumps(obj).decode()
+    else:
+        loads, dumps = json.loads, json.dumps
+    backend = name
+
+
+## Body
+use(BACKENDS[0])
@@ -67,3 +67,20 @@ class WebSocketClosedException(Exception):
     # -Constructor
     def __init__(self, url: str) -> WebSocketOpenException:
         super().__init__(f"Connection with address: {url} has expired.")
+
+
+class OrderException(Exception):
+    """Order exception for requests refused by the server"""
+
+    # -Constructor
+    def __init__(self, url: str, status: int, reason: str) -> OrderException:
+        super().__init__(f"Order request '{url}' failed with status {status}: {reason}.")
+
+
+class RiskException(Exception):
+    """Order exception for requests rejected by the pre-trade risk gate"""
+
+    # -Constructor
+    def __init__(self, account_id: int, reason: str) -> RiskException:
+        super().__init__(f"Order for account {account_id} rejected by risk gate: {reason}.")
+        self.reason: str = reason
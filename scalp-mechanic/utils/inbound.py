@@ -0,0 +1,156 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Inbound Frame Queue           ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+from collections import deque
+from enum import Enum
+from typing import Iterator
+
+## Constants
+QUEUE_SIZE = 1024
+
+
+## Classes
+class OVERFLOW(Enum):
+    """Full FrameQueue policy Enum"""
+    BLOCK = 'block'                 # -reader waits, backpressure to the socket
+    DROP_OLDEST = 'drop_oldest'     # -oldest queued frame is dropped
+    CONFLATE = 'conflate'           # -quotes merge into the queued quote per contract
+
+
+class FrameQueue:
+    """Bounded queue of decoded WebSocket frames between reader and consumer"""
+
+    # -Constructor
+    def __init__(
+        self, maxsize: int = QUEUE_SIZE, policy: OVERFLOW = OVERFLOW.BLOCK
+    ) -> FrameQueue:
+        self.maxsize: int = maxsize
+        self.policy: OVERFLOW = policy
+        self.enqueued: int = 0
+        self.dropped: int = 0
+        self.conflated: int = 0
+        self.blocked: int = 0
+        self.max_depth: int = 0
+        self._frames: deque[tuple[list[dict], int, int]] = deque()
+        self._latest: dict[int, dict] = {}
+        self._readable: asyncio.Event = asyncio.Event()
+        self._writable: asyncio.Event = asyncio.Event()
+        self._writable.set()
+
+    # -Dunder Methods
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __repr__(self) -> str:
+        return (
+            f"FrameQueue(depth={len(self._frames)}, maxsize={self.maxsize}, "
+            f"policy={self.policy.name})"
+        )
+
+    # -Static Methods
+    @staticmethod
+    def _quotes(frame: list[dict]) -> Iterator[dict]:
+        '''Every quote payload of a frame'''
+        for msg in frame:
+            if msg.get('e') == 'md':
+                yield from msg['d'].get('quotes', ())
+
+    # -Instance Methods: Private
+    def _conflate(self, frame: list[dict]) -> list[dict]:
+        '''Merge frame quotes into queued quotes; returns what is left to queue'''
+        remaining = []
+        for msg in frame:
+            data = msg.get('d')
+            if msg.get('e') != 'md' or not data.get('quotes'):
+                remaining.append(msg)
+                continue
+            quotes = []
+            for quote in data['quotes']:
+                queued = self._latest.get(quote['contractId'])
+                if queued is None:
+                    quotes.append(quote)
+                    continue
+                queued['entries'].update(quote['entries'])
+                queued['timestamp'] = quote['timestamp']
+                self.conflated += 1
+            data['quotes'] = quotes
+            if any(data.values()):
+                remaining.append(msg)
+        return remaining
+
+    def _drop(self) -> None:
+        '''Drop the oldest queued frame'''
+        frame, _, _ = self._frames.popleft()
+        if self.policy is OVERFLOW.CONFLATE:
+            self._forget(frame)
+        self.dropped += 1
+
+    def _forget(self, frame: list[dict]) -> None:
+        '''Remove frame quotes from the conflation index'''
+        for quote in self._quotes(frame):
+            if self._latest.get(quote['contractId']) is quote:
+                del self._latest[quote['contractId']]
+
+    # -Instance Methods: Public
+    def clear(self) -> None:
+        '''Drop every queued frame'''
+        self.dropped += len(self._frames)
+        self._frames.clear()
+        self._latest.clear()
+        self._writable.set()
+
+    async def get(self) -> tuple[list[dict], int, int]:
+        '''Oldest (frame, received ns, decoded ns), waiting for one if empty'''
+        while not self._frames:
+            self._readable.clear()
+            await self._readable.wait()
+        return self.get_nowait()
+
+    def get_nowait(self) -> tuple[list[dict], int, int]:
+        '''Oldest (frame, received ns, decoded ns); raises IndexError if empty'''
+        item = self._frames.popleft()
+        if self.policy is OVERFLOW.CONFLATE:
+            self._forget(item[0])
+        self._writable.set()
+        return item
+
+    async def put(self, frame: list[dict], received: int = 0, decoded: int = 0) -> None:
+        '''Queue a frame, applying the overflow policy when full'''
+        if len(self._frames) >= self.maxsize:
+            if self.policy is OVERFLOW.BLOCK:
+                self.blocked += 1
+                while len(self._frames) >= self.maxsize:
+                    self._writable.clear()
+                    await self._writable.wait()
+            elif self.policy is OVERFLOW.CONFLATE:
+                frame = self._conflate(frame)
+                if not frame:
+                    return None
+                if len(self._frames) >= self.maxsize:
+                    self._drop()
+            else:
+                self._drop()
+        if self.policy is OVERFLOW.CONFLATE:
+            for quote in self._quotes(frame):
+                self._latest[quote['contractId']] = quote
+        self._frames.append((frame, received, decoded))
+        self.enqueued += 1
+        if len(self._frames) > self.max_depth:
+            self.max_depth = len(self._frames)
+        self._readable.set()
+
+    # -Properties
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            'depth': len(self._frames), 'max_depth': self.max_depth,
+            'enqueued': self.enqueued, 'dropped': self.dropped,
+            'conflated': self.conflated, 'blocked': self.blocked,
+        }
@@ -0,0 +1,200 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Tradovate Event Router        ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+import logging
+from asyncio import AbstractEventLoop
+from inspect import iscoroutinefunction
+from time import perf_counter_ns
+from typing import Any, Callable
+
+from utils import codec
+from utils.stats import LatencyStats
+
+## Constants
+log = logging.getLogger(__name__)
+EVENTS = (
+    'quote', 'dom', 'histogram', 'chart', 'history', 'props', 'clock', 'shutdown',
+    'gap', 'reconnect'
+)
+# -Market data key, event, typed decoder of its payloads
+_MD_EVENTS = (
+    ('quotes', 'quote', codec.decode_quote), ('doms', 'dom', codec.decode_dom),
+    ('histograms', 'histogram', None)
+)
+
+
+## Classes
+class HandlerStats:
+    """Per-handler call and latency counters"""
+    __slots__ = ('name', 'calls', 'errors', 'total_ns', 'max_ns')
+
+    # -Constructor
+    def __init__(self, name: str = "") -> HandlerStats:
+        self.name: str = name
+        self.calls: int = 0
+        self.errors: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"HandlerStats(name={self.name}, calls={self.calls}, errors={self.errors}, "
+            f"mean_ns={self.mean_ns}, max_ns={self.max_ns})"
+        )
+
+    # -Instance Methods
+    def record(self, elapsed: int) -> None:
+        '''Add a handler call of elapsed nanoseconds'''
+        self.calls += 1
+        self.total_ns += elapsed
+        if elapsed > self.max_ns:
+            self.max_ns = elapsed
+
+    # -Properties
+    @property
+    def mean_ns(self) -> int:
+        return self.total_ns // self.calls if self.calls else 0
+
+
+class Router:
+    """Tradovate WebSocket event router"""
+
+    # -Constructor
+    def __init__(self, *, loop: AbstractEventLoop | None = None) -> Router:
+        self._loop: AbstractEventLoop = loop if loop else asyncio.get_event_loop()
+        self._sync: dict[str, tuple[Callable, ...]] = {}
+        self._async: dict[str, tuple[Callable, ...]] = {}
+        self._stats: dict[Callable, HandlerStats] = {}
+        self._handlers: int = 0
+        self.latency: LatencyStats | None = None
+        self._received: int = 0
+        self._decoded: int = 0
+
+    # -Instance Methods: Private
+    def _name(self, handler: Callable) -> str:
+        '''Stats name of handler, its qualified name made unique with a handler id'''
+        name = getattr(handler, '__qualname__', type(handler).__qualname__)
+        if any(stats.name == name for stats in self._stats.values()):
+            name = f"{name}#{self._handlers}"
+        return name
+
+    def _call(self, event: str, handler: Callable, payload: Any) -> None:
+        '''Call sync handler inline and record its latency'''
+        stats = self._stats[handler]
+        start = perf_counter_ns()
+        try:
+            handler(payload)
+        except Exception:
+            stats.errors += 1
+            log.exception(f"Router handler '{handler.__qualname__}' failed")
+        end = perf_counter_ns()
+        stats.record(end - start)
+        if self.latency is not None:
+            self.latency.record(event, self._received, self._decoded, start, end)
+
+    async def _run_batch(
+        self, batch: list[tuple[str, Callable, Any]], received: int, decoded: int
+    ) -> None:
+        '''Await a frame's coroutine handlers in order within one task'''
+        for event, handler, payload in batch:
+            stats = self._stats[handler]
+            start = perf_counter_ns()
+            try:
+                await handler(payload)
+            except Exception:
+                stats.errors += 1
+                log.exception(f"Router handler '{handler.__qualname__}' failed")
+            end = perf_counter_ns()
+            stats.record(end - start)
+            if self.latency is not None:
+                self.latency.record(event, received, decoded, start, end)
+
+    def _route(
+        self, event: str, payload: Any, batch: list[tuple[str, Callable, Any]]
+    ) -> None:
+        '''Call sync handlers and queue coroutine handlers for event'''
+        for handler in self._sync.get(event, ()):
+            self._call(event, handler, payload)
+        for handler in self._async.get(event, ()):
+            batch.append((event, handler, payload))
+
+    # -Instance Methods: Public
+    def emit(self, event: str, payload: Any) -> None:
+        '''Route a single Client generated event'''
+        if self.latency is not None:
+            self._received = self._decoded = perf_counter_ns()
+        batch = []
+        self._route(event, payload, batch)
+        if batch:
+            self._loop.create_task(
+                self._run_batch(batch, self._received, self._decoded)
+            )
+
+    def register(self, event: str, handler: Callable) -> None:
+        '''Add handler to the routing table for event'''
+        if event not in EVENTS:
+            raise ValueError(f"Unknown router event '{event}'")
+        table = self._async if iscoroutinefunction(handler) else self._sync
+        if handler in table.get(event, ()):
+            return None
+        table[event] = table.get(event, ()) + (handler,)
+        if handler not in self._stats:
+            self._handlers += 1
+            self._stats[handler] = HandlerStats(self._name(handler))
+
+    def unregister(self, event: str, handler: Callable) -> None:
+        '''Remove handler from the routing table for event'''
+        for table in (self._sync, self._async):
+            handlers = tuple(h for h in table.get(event, ()) if h != handler)
+            if handlers:
+                table[event] = handlers
+            else:
+                table.pop(event, None)
+        # -Stats go with the last registration of handler
+        for table in (self._sync, self._async):
+            if any(handler in handlers for handlers in table.values()):
+                return None
+        self._stats.pop(handler, None)
+
+    def route_frame(
+        self, frame: list[dict], received: int = 0, decoded: int = 0
+    ) -> asyncio.Task | None:
+        '''Route every event message of a WebSocket frame; returns its coroutine task'''
+        if self.latency is not None:
+            if not received:
+                received = decoded = perf_counter_ns()
+            self.latency.record_frame(received, decoded)
+            self._received, self._decoded = received, decoded
+        batch = []
+        for msg in frame:
+            event = msg.get('e')
+            if event == 'md':
+                data = msg['d']
+                for key, name, decode in _MD_EVENTS:
+                    if key in data and (name in self._sync or name in self._async):
+                        for item in data[key]:
+                            self._route(name, decode(item) if decode else item, batch)
+            elif event == 'chart':
+                if 'chart' in self._sync or 'chart' in self._async:
+                    for item in msg['d'].get('charts', ()):
+                        self._route('chart', item, batch)
+            elif event is not None:
+                self._route(event, msg.get('d'), batch)
+        if batch:
+            return self._loop.create_task(
+                self._run_batch(batch, self._received, self._decoded)
+            )
+        return None
+
+    # -Properties
+    @property
+    def stats(self) -> dict[str, HandlerStats]:
+        return {stats.name: stats for stats in self._stats.values()}
@@ -0,0 +1,145 @@
+##-------------------------------##
+## [Tradovate]Scalp-Mechanic     ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Latency Statistics            ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from array import array
+
+## Constants
+SUB_BITS = 6                        # -64 sub-buckets, ~3% value precision
+MAX_SHIFT = 40                      # -values up to ~2**46ns (~19 hours)
+_SUB = 1 << SUB_BITS
+_HALF = _SUB >> 1
+_BUCKETS = _SUB + MAX_SHIFT * _HALF
+STAGES = ('route', 'handler', 'total')
+
+
+## Classes
+class Histogram:
+    """Log-linear (HDR-style) histogram of non-negative integer values"""
+    __slots__ = ('count', 'total', 'min', 'max', '_counts')
+
+    # -Constructor
+    def __init__(self) -> Histogram:
+        self.count: int = 0
+        self.total: int = 0
+        self.min: int = 0
+        self.max: int = 0
+        self._counts: array = array('Q', bytes(8 * _BUCKETS))
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (
+            f"Histogram(count={self.count}, p50={self.percentile(50)}, "
+            f"p99={self.percentile(99)}, max={self.max})"
+        )
+
+    # -Static Methods
+    @staticmethod
+    def _index(value: int) -> int:
+        '''Bucket index of value'''
+        if value < _SUB:
+            return value
+        shift = value.bit_length() - SUB_BITS
+        if shift > MAX_SHIFT:
+            return _BUCKETS - 1
+        return _SUB + (shift - 1) * _HALF + (value >> shift) - _HALF
+
+    @staticmethod
+    def _value(index: int) -> int:
+        '''Highest value that lands in bucket index'''
+        if index < _SUB:
+            return index
+        shift, sub = divmod(index - _SUB, _HALF)
+        shift += 1
+        return ((sub + _HALF + 1) << shift) - 1
+
+    # -Instance Methods
+    def percentile(self, percent: float) -> int:
+        '''Value at or below which percent of recorded values fall'''
+        if not self.count:
+            return 0
+        rank = max(1, int(self.count * percent / 100 + 0.5))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(self._value(index), self.max)
+        return self.max
+
+    def record(self, value: int) -> None:
+        '''Add a value'''
+        if value < 0:
+            value = 0
+        self._counts[self._index(value)] += 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def reset(self) -> None:
+        '''Drop every recorded value'''
+        self.count = self.total = self.min = self.max = 0
+        self._counts = array('Q', bytes(8 * _BUCKETS))
+
+    def summary(self) -> dict[str, int]:
+        '''Count, mean and percentile summary'''
+        return {
+            'count': self.count,
+            'mean': self.total // self.count if self.count else 0,
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'p999': self.percentile(99.9),
+            'max': self.max,
+        }
+
+
+class LatencyStats:
+    """Per event type latency histograms from socket receive to handler end"""
+
+    # -Constructor
+    def __init__(self) -> LatencyStats:
+        self.decode: Histogram = Histogram()
+        self._events: dict[str, tuple[Histogram, Histogram, Histogram]] = {}
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"LatencyStats(frames={self.decode.count}, events={tuple(self._events)})"
+
+    # -Instance Methods
+    def record(
+        self, event: str, received: int, decoded: int, start: int, end: int
+    ) -> None:
+        '''Add one handler call for event, in perf_counter_ns timestamps'''
+        histograms = self._events.get(event)
+        if histograms is None:
+            histograms = self._events[event] = (Histogram(), Histogram(), Histogram())
+        route, handler, total = histograms
+        route.record(start - decoded)
+        handler.record(end - start)
+        total.record(end - received)
+
+    def record_frame(self, received: int, decoded: int) -> None:
+        '''Add one frame receive to decode interval'''
+        self.decode.record(decoded - received)
+
+    def reset(self) -> None:
+        '''Drop every recorded value'''
+        self.decode.reset()
+        self._events.clear()
+
+    def summary(self) -> dict[str, dict[str, dict[str, int]]]:
+        '''Nanosecond summaries of every stage by event type'''
+        summary = {'frame': {'decode': self.decode.summary()}}
+        for event, histograms in self._events.items():
+            summary[event] = {
+                stage: histogram.summary()
+                for stage, histogram in zip(STAGES, histograms)
+            }
+        return summary
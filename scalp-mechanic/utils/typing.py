@@ -28,6 +28,71 @@ class AccountDict(TypedDict, total=False):
     approveForACH: bool
 
 
+class PriceLevelDict(TypedDict, total=False):
+    """Tradovate DOM/quote price level typed dictionary"""
+    price: float
+    size: float
+
+
+class ContractDict(TypedDict, total=False):
+    """Tradovate contract typed dictionary"""
+    id: int
+    name: str
+    contractMaturityId: int
+    status: str
+    providerTickSize: float
+
+
+class ContractMaturityDict(TypedDict, total=False):
+    """Tradovate contract maturity typed dictionary"""
+    id: int
+    productId: int
+    expirationMonth: int
+    expirationDate: str
+    archived: bool
+    seqNo: int
+    isFront: bool
+
+
+class DOMDict(TypedDict):
+    """Tradovate DOM typed dictionary"""
+    contractId: int
+    timestamp: str
+    bids: list[PriceLevelDict]
+    offers: list[PriceLevelDict]
+
+
+class QuoteDict(TypedDict):
+    """Tradovate quote typed dictionary"""
+    contractId: int
+    timestamp: str
+    entries: dict[str, PriceLevelDict]
+
+
+class GapDict(TypedDict, total=False):
+    """WebSocket connection gap typed dictionary"""
+    websocket: int
+    url: str
+    market: bool
+    start: float
+    duration: float
+    attempts: int
+
+
+class FillDict(TypedDict, total=False):
+    """Tradovate fill typed dictionary"""
+    id: int
+    orderId: int
+    contractId: int
+    timestamp: str
+    tradeDate: dict
+    action: str
+    qty: int
+    price: float
+    active: bool
+    finallyPaired: int
+
+
 class MeAuthDict(TypedDict):
     """"""
     userId: int
@@ -37,6 +102,29 @@ class MeAuthDict(TypedDict):
     isTrial: bool
 
 
+class BarDict(TypedDict, total=False):
+    """Tradovate chart bar typed dictionary"""
+    timestamp: str
+    open: float
+    high: float
+    low: float
+    close: float
+    upVolume: float
+    downVolume: float
+    upTicks: float
+    downTicks: float
+    bidVolume: float
+    offerVolume: float
+
+
+class ChartDict(TypedDict, total=False):
+    """Tradovate chart packet typed dictionary"""
+    id: int
+    td: int
+    bars: list[BarDict]
+    eoh: bool
+
+
 class CredentialAuthDict(TypedDict):
     """Credentials authorization typed dictionary"""
     name: str
@@ -48,6 +136,46 @@ class CredentialAuthDict(TypedDict):
     appVersion: str
 
 
+class ResponseDict(TypedDict, total=False):
+    """WebSocket request response typed dictionary"""
+    i: int
+    s: int
+    d: dict
+
+
+class ProductDict(TypedDict, total=False):
+    """Tradovate product typed dictionary"""
+    id: int
+    name: str
+    currencyId: int
+    productType: str
+    description: str
+    exchangeId: int
+    contractGroupId: int
+    status: str
+    valuePerPoint: float
+    priceFormatType: str
+    priceFormat: int
+    tickSize: float
+
+
+class PropsDict(TypedDict):
+    """Tradovate props entity event typed dictionary"""
+    entityType: str
+    eventType: str
+    entity: dict
+
+
+class OrderResultDict(TypedDict, total=False):
+    """Tradovate order request result typed dictionary"""
+    orderId: int
+    oso1Id: int
+    oso2Id: int
+    ocoId: int
+    failureReason: str
+    failureText: str
+
+
 class OAuth2Dict(TypedDict):
     """OAuth2 authorization typed dictionary"""
     pass
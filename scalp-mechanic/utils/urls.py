@@ -15,15 +15,17 @@ _domains = (
     "://live.tradovateapi.com/v1/",     # -Live Account Functionality
     "://demo.tradovateapi.com/v1/",     # -Demo Account Functionality
     "://md.tradovateapi.com/v1/",       # -Live Market Functionality
-    #"://md-demo.tradovateapi.com/v1/",  # -Demo Market Functionality [?]
-    #"://replay.tradovateapi.com/v1",    # -Replay Market Functionality
+    "://md-demo.tradovateapi.com/v1/",  # -Demo Market Functionality
+    "://replay.tradovateapi.com/v1/",   # -Replay Market Functionality
 )
-http_base_live, http_base_demo, http_base_market = [
-    f"https{domain}" for domain in _domains
-]
-wss_base_live, wss_base_demo, wss_base_market = [
-    f"wss{domain}websocket" for domain in _domains
-]
+(
+    http_base_live, http_base_demo, http_base_market,
+    http_base_mddemo, http_base_replay
+) = [f"https{domain}" for domain in _domains]
+(
+    wss_base_live, wss_base_demo, wss_base_market,
+    wss_base_mddemo, wss_base_replay
+) = [f"wss{domain}websocket" for domain in _domains]
 # -Authorization
 #  -HTTP[Live Only]
 http_base_auth = http_base_live + "auth/"
@@ -35,6 +37,12 @@ http_auth_me = http_base_auth + "me"
 wss_auth = "authorize"
 # -User
 wss_user_sync = "user/syncrequest"
+# -Order
+wss_order_place = "order/placeOrder"
+wss_order_modify = "order/modifyOrder"
+wss_order_cancel = "order/cancelOrder"
+wss_order_oso = "order/placeOSO"
+wss_order_oco = "order/placeOCO"
 # -Market
 wss_market_sub = "md/subscribeQuote"
 wss_market_usub = "md/unsubscribeQuote"
@@ -44,27 +52,96 @@ wss_market_histogram_sub = "md/subscribeHistogram"
 wss_market_histogram_usub = "md/unsubscribeHistogram"
 wss_market_chart_sub = "md/getChart"
 wss_market_chart_usub = "md/cancelChart"
+# -Replay
+wss_replay_clock = "replay/initializeClock"
 
 
 ## Functions
 # -Account
 def get_account(endpoint: ENDPOINT, id_: int) -> str:
     """URL Endpoint for getting single account"""
-    url = "account/item"
-    if endpoint == ENDPOINT.WEBSOCKET:
-        return url
-    return endpoint.value + url + f"/?id={id_}"
+    return get_item(endpoint, "account", id_)
 
 
 def get_accounts(
     endpoint: ENDPOINT, ids: list[int] | None = None
 ) -> str:
     """URL Endpoint for getting multiple accounts - by id or full list"""
-    url = "account/items" if ids else "account/list"
+    if ids:
+        return get_items(endpoint, "account", ids)
+    return get_list(endpoint, "account")
+
+
+# -Entity
+def get_deps(endpoint: ENDPOINT, entity: str, master_id: int) -> str:
+    """URL Endpoint for getting entities that depend on a master entity"""
+    url = f"{entity}/deps"
+    if endpoint == ENDPOINT.WEBSOCKET:
+        return url
+    return _endpoint_base(endpoint) + url + f"/?masterid={master_id}"
+
+
+def get_find(endpoint: ENDPOINT, entity: str, name: str) -> str:
+    """URL Endpoint for finding an entity by name"""
+    url = f"{entity}/find"
+    if endpoint == ENDPOINT.WEBSOCKET:
+        return url
+    return _endpoint_base(endpoint) + url + f"/?name={name}"
+
+
+def get_item(endpoint: ENDPOINT, entity: str, id_: int) -> str:
+    """URL Endpoint for getting single entity"""
+    url = f"{entity}/item"
     if endpoint == ENDPOINT.WEBSOCKET:
         return url
-    url += "/?ids=" + ','.join(str(i) for i in ids) if ids else ""
-    return endpoint.value + url
+    return _endpoint_base(endpoint) + url + f"/?id={id_}"
+
+
+def get_items(endpoint: ENDPOINT, entity: str, ids: list[int]) -> str:
+    """URL Endpoint for getting multiple entities by id"""
+    url = f"{entity}/items"
+    if endpoint == ENDPOINT.WEBSOCKET:
+        return url
+    return _endpoint_base(endpoint) + url + "/?ids=" + ','.join(str(i) for i in ids)
+
+
+def get_list(endpoint: ENDPOINT, entity: str) -> str:
+    """URL Endpoint for getting every entity of a type"""
+    url = f"{entity}/list"
+    if endpoint == ENDPOINT.WEBSOCKET:
+        return url
+    return _endpoint_base(endpoint) + url
+
+
+# -Host
+def _endpoint_base(endpoint: ENDPOINT) -> str:
+    """Current HTTP base URL for endpoint"""
+    return http_base_live if endpoint == ENDPOINT.LIVE else http_base_demo
+
+
+def set_host(host: str | None = None, *, secure: bool = True) -> None:
+    """Point every endpoint at host (e.g. a local stand-in), or back to Tradovate"""
+    global http_base_live, http_base_demo, http_base_market
+    global http_base_mddemo, http_base_replay
+    global wss_base_live, wss_base_demo, wss_base_market
+    global wss_base_mddemo, wss_base_replay
+    global http_base_auth, http_auth_oauth, http_auth_request
+    global http_auth_renew, http_auth_me
+    domains = _domains if host is None else (f"://{host}/v1/",) * len(_domains)
+    http, wss = ("https", "wss") if secure or host is None else ("http", "ws")
+    (
+        http_base_live, http_base_demo, http_base_market,
+        http_base_mddemo, http_base_replay
+    ) = [f"{http}{domain}" for domain in domains]
+    (
+        wss_base_live, wss_base_demo, wss_base_market,
+        wss_base_mddemo, wss_base_replay
+    ) = [f"{wss}{domain}websocket" for domain in domains]
+    http_base_auth = http_base_live + "auth/"
+    http_auth_oauth = http_base_auth + "oauthtoken"
+    http_auth_request = http_base_auth + "accesstokenrequest"
+    http_auth_renew = http_base_auth + "renewaccesstoken"
+    http_auth_me = http_base_auth + "me"
 
 
 ## Classes